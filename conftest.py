@@ -0,0 +1 @@
+pytest_plugins = ["histafrica.pytest_plugin"]
@@ -3,4 +3,9 @@
 uv sync --frozen
 
 /app/.venv/bin/python src/manage.py migrate
+# The prefork server closes the connection after each response (HTTP/1.0,
+# no keep-alive): run it behind a proxy that keeps client connections alive.
+if [ "$APP_ENV" = "production" ]; then
+  exec /app/.venv/bin/python src/manage.py serve --bind 0.0.0.0:8000
+fi
 /app/.venv/bin/python src/manage.py runserver 0.0.0.0:8000
@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 import dj_database_url
 from pydantic import Field, field_validator
@@ -12,17 +12,33 @@ from pydantic_settings import (
 # Define the path to the environment folder
 _ENV_FOLDER = Path(__file__).resolve().parent.parent.parent / "envs"
 
+# SQLite next to the settings when no DSN is configured, as before.
+_DEFAULT_DSN = f"sqlite:///{Path(__file__).resolve().parent / 'db.sqlite3'}"
+
 # Get the current environment (development, production, etc.)
 APP_ENV = os.getenv("APP_ENV")  # Where to pass the APP_ENV value
 
 
 class ConfigService(BaseSettings):
 
-    database_dsn: str
+    database_dsn: str = _DEFAULT_DSN
+    # Seconds a connection is kept between requests when not pooled.
+    database_conn_max_age: int = 0
+    database_health_checks: bool = True
+    # psycopg_pool pool, PostgreSQL only. Sizes are per process.
+    database_pool: bool = False
+    database_pool_min_size: int = 2
+    database_pool_max_size: Optional[int] = 10
+    database_pool_max_idle: float = 600.0
+    database_pool_max_lifetime: float = 3600.0
+    database_pool_timeout: float = 30.0
+    # Built from the fields above, which are validated before it.
     database_conn: Dict = Field(init=False, default=None)
     debug: bool = False
     language_code: str = "en-us"
-    secret_key: str
+    secret_key: str = (
+        "django-insecure-rpf^_%&ln+27ii7v0q%2z*f)$a6!(v$2bm8_nnubnfq7b+(f%7"
+    )
     test_keep_db: bool = True
     test_use_migrations: bool = True
 
@@ -32,7 +48,31 @@ class ConfigService(BaseSettings):
 
     @field_validator("database_conn", mode="before")
     def make_database_conn(cls, v, info):
-        return dj_database_url.config(default=info.data["database_dsn"])
+        data = info.data
+        conn = dj_database_url.config(
+            default=data["database_dsn"],
+            conn_max_age=data["database_conn_max_age"],
+            conn_health_checks=data["database_health_checks"],
+        )
+        if data["database_pool"] and conn["ENGINE"] == "django.db.backends.postgresql":
+            # Pooled connections go back to the pool after each request, which
+            # Django refuses to combine with persistent connections. Health
+            # checks then run on checkout, through the pool.
+            conn["CONN_MAX_AGE"] = 0
+            conn.setdefault("OPTIONS", {})["pool"] = {
+                "min_size": data["database_pool_min_size"],
+                "max_size": data["database_pool_max_size"],
+                "max_idle": data["database_pool_max_idle"],
+                "max_lifetime": data["database_pool_max_lifetime"],
+                "timeout": data["database_pool_timeout"],
+            }
+        return conn
+
+    @field_validator("database_health_checks", "database_pool", mode="before")
+    def parse_database_flags(cls, v):
+        if isinstance(v, str):
+            return v.lower() == "true"
+        return v
 
     @field_validator("debug", mode="before")
     def parse_debug(cls, v):
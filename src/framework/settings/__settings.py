@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 
 from pathlib import Path
 
+from framework.config import config_service
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -21,7 +22,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # See https://docs.djangoproject.com/en/5.1/howto/deployment/checklist/
 
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = "django-insecure-rpf^_%&ln+27ii7v0q%2z*f)$a6!(v$2bm8_nnubnfq7b+(f%7"
+SECRET_KEY = config_service.secret_key
 
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = True
@@ -38,9 +39,13 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "rest_framework",
+    "histafrica.shared.infra.django_app",
+    "histafrica.category.infra.django_app",
 ]
 
 MIDDLEWARE = [
+    "histafrica.shared.infra.django_app.metrics.TimingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -48,6 +53,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "histafrica.shared.infra.django_app.response_cache.ResponseCacheMiddleware",
 ]
 
 ROOT_URLCONF = "framework.urls"
@@ -72,10 +78,7 @@ WSGI_APPLICATION = "framework.wsgi.application"
 
 
 DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
+    "default": config_service.database_conn,
 }
 
 
@@ -122,3 +125,26 @@ STATIC_URL = "static/"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+
+REST_FRAMEWORK = {
+    "EXCEPTION_HANDLER": (
+        "histafrica.shared.infra.django_app.exception_handler.custom_exception_handler"
+    ),
+}
+
+# Rendered API responses. Each worker keeps the popular ones in process;
+# point "responses" at a shared backend (Redis, Memcached) to share the rest
+# between workers, or set RESPONSE_CACHE_ALIAS to None for the local tier only.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "responses": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "responses",
+        "TIMEOUT": 300,
+    },
+}
+
+RESPONSE_CACHE_ALIAS = "responses"
+RESPONSE_CACHE_LOCAL_SIZE = 256
@@ -16,8 +16,12 @@ Including another URLconf
 """
 
 from django.contrib import admin
-from django.urls import path
+from django.urls import include, path
+
+from histafrica.shared.infra.django_app.metrics import metrics_view
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("api/", include("histafrica.category.infra.django_app.urls")),
+    path("metrics", metrics_view, name="metrics"),
 ]
@@ -0,0 +1,22 @@
+import time
+from typing import Callable, Iterable
+
+
+def measure(func: Callable[[], None], number: int = 1000) -> float:
+    """Return the mean latency of ``func`` in microseconds."""
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - start) / number * 1_000_000
+
+
+def print_table(title: str, header: Iterable[str], rows: Iterable[Iterable]):
+    print(f"\n{title}")
+    print(" | ".join(f"{column:>12}" for column in header))
+    for row in rows:
+        print(
+            " | ".join(
+                f"{value:>12.3f}" if isinstance(value, float) else f"{value:>12}"
+                for value in row
+            )
+        )
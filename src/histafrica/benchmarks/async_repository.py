@@ -0,0 +1,89 @@
+"""
+Throughput of concurrent requests against the category tables, through the
+sync repository wrapped in AsyncSearchableRepositoryAdapter and through
+CategoryDjangoAsyncRepository. Runs on a throwaway test database created from
+the configured settings.
+
+Usage: python -m histafrica.benchmarks.async_repository [concurrency ...]
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+
+import django
+
+CONCURRENCY = [1, 10, 50]
+ROWS = 1_000
+REQUESTS = 500
+
+
+async def throughput(repo, ids, concurrency: int, requests: int = REQUESTS) -> float:
+    """Return the requests served per second with ``concurrency`` in flight."""
+    from histafrica.shared.domain.repository import SearchParams
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def request():
+        async with semaphore:
+            await repo.find_by_id(random.choice(ids))
+            await repo.search(SearchParams(per_page=15, sort="name"))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(request() for _ in range(requests)))
+    return requests / (time.perf_counter() - start)
+
+
+async def run(concurrency_levels):
+    from histafrica.category.domain.entity import Category
+    from histafrica.category.infra.django_app.repositories import (
+        CategoryDjangoAsyncRepository,
+        CategoryDjangoRepository,
+    )
+    from histafrica.shared.infra.async_adapters import (
+        AsyncSearchableRepositoryAdapter,
+    )
+
+    native = CategoryDjangoAsyncRepository()
+    adapted = AsyncSearchableRepositoryAdapter(CategoryDjangoRepository())
+    categories = [Category(name=f"category {i}") for i in range(ROWS)]
+    await native.bulk_insert(categories)
+    ids = [category.id for category in categories]
+
+    return [
+        [
+            concurrency,
+            await throughput(adapted, ids, concurrency),
+            await throughput(native, ids, concurrency),
+        ]
+        for concurrency in concurrency_levels
+    ]
+
+
+def main(concurrency_levels=None):
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "framework.settings")
+    django.setup()
+
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    from histafrica.benchmarks import print_table
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        rows = asyncio.run(run(concurrency_levels or CONCURRENCY))
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    print_table(
+        f"Category repository, {REQUESTS} requests (req/s)",
+        ["concurrency", "sync adapter", "async ORM"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]])
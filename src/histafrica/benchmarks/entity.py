@@ -0,0 +1,88 @@
+"""
+Cost of serializing Category entities with the compiled Entity.to_dict and
+Entity.to_dicts, against the previous dataclasses.asdict implementation, and
+of building them from storage rows with Entity.hydrate_many, against plain
+tuple iteration and the Category constructor.
+
+Usage: python -m histafrica.benchmarks.entity [size ...]
+"""
+
+import datetime
+import sys
+import uuid
+from dataclasses import asdict
+
+from histafrica.benchmarks import measure, print_table
+from histafrica.category.domain.entity import Category
+from histafrica.shared.domain.entity import Entity
+from histafrica.shared.domain.value_objects import UniqueEntityId
+
+SIZES = [10_000]
+HYDRATION_SIZES = [100_000]
+
+
+def asdict_to_dict(entity: Entity):
+    entity_dict = asdict(entity)
+    entity_dict.pop("unique_entity_id")
+    entity_dict["id"] = entity.id
+    return entity_dict
+
+
+def run(size: int, number: int = 5):
+    entities = [
+        Category(name=f"category {i}", description=f"description {i}")
+        for i in range(size)
+    ]
+    # Milliseconds to serialize the whole list.
+    return [
+        size,
+        measure(lambda: [asdict_to_dict(e) for e in entities], number) / 1000,
+        measure(lambda: [e.to_dict() for e in entities], number) / 1000,
+        measure(lambda: Entity.to_dicts(entities), number) / 1000,
+    ]
+
+
+def run_hydration(size: int, number: int = 5):
+    created_at = datetime.datetime.now(datetime.timezone.utc)
+    rows = [
+        (uuid.uuid4(), f"category {i}", None, True, created_at) for i in range(size)
+    ]
+
+    def construct():
+        return [
+            Category(
+                unique_entity_id=UniqueEntityId(str(row[0])),
+                name=row[1],
+                description=row[2],
+                is_activate=row[3],
+                created_at=row[4],
+            )
+            for row in rows
+        ]
+
+    return [
+        size,
+        measure(lambda: [tuple(row) for row in rows], number) / 1000,
+        measure(lambda: Category.hydrate_many(rows), number) / 1000,
+        measure(construct, number) / 1000,
+    ]
+
+
+def main(sizes=None):
+    rows = [run(size) for size in sizes or SIZES]
+    print_table(
+        "Category serialization (ms per list)",
+        ["entities", "asdict", "to_dict", "to_dicts"],
+        rows,
+    )
+
+    rows = [run_hydration(size) for size in sizes or HYDRATION_SIZES]
+    print_table(
+        "Category hydration from rows (ms per list)",
+        ["rows", "tuples", "hydrate_many", "Category()"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]])
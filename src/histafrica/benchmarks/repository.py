@@ -0,0 +1,55 @@
+"""
+Latency of InMemoryRepository lookups and writes as the repository grows.
+
+Usage: python -m histafrica.benchmarks.repository [size ...]
+"""
+
+import random
+import sys
+
+from histafrica.benchmarks import measure, print_table
+from histafrica.category.domain.entity import Category
+from histafrica.shared.domain.repository import InMemoryRepository
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+
+class CategoryRepository(InMemoryRepository[Category]):
+    pass
+
+
+def run(size: int, number: int = 10_000):
+    repo = CategoryRepository()
+    entities = [Category(name=f"category {i}") for i in range(size)]
+    for entity in entities:
+        repo.insert(entity)
+
+    sample = random.choices(entities, k=number)
+    lookups = iter(sample)
+    updates = iter(sample)
+    deletes = iter(sample[: number // 2])
+
+    def delete_and_insert():
+        entity = next(deletes)
+        repo.delete(entity)
+        repo.insert(entity)
+
+    return [
+        size,
+        measure(lambda: repo.find_by_id(next(lookups).id), number),
+        measure(lambda: repo.update(next(updates)), number),
+        measure(delete_and_insert, number // 2),
+    ]
+
+
+def main(sizes=None):
+    rows = [run(size) for size in sizes or SIZES]
+    print_table(
+        "InMemoryRepository (µs/op)",
+        ["entities", "find_by_id", "update", "delete+insert"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]])
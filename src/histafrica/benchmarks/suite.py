@@ -0,0 +1,331 @@
+"""
+Benchmark suite for the hot paths, run at several sizes and compared against
+a JSON baseline. Every case returns microseconds per operation (or per item
+for the list cases), so results at different sizes read the same way.
+
+Usage: python -m histafrica.benchmarks.suite [--sizes 1000,100000]
+           [--baseline PATH] [--save] [--threshold 0.2] [case ...]
+
+The same suite runs under pytest with ``--benchmark``, see pytest_plugin.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import django
+
+SIZES = [1_000, 100_000, 1_000_000]
+BASELINE = os.path.join(".benchmarks", "baseline.json")
+THRESHOLD = 0.2
+
+# Operations timed on a repository of the benchmarked size.
+OPERATIONS = 10_000
+
+# case name -> function(size) -> {metric: microseconds}
+Results = Dict[str, Dict[str, Dict[str, float]]]
+CASES: Dict[str, Callable[[int], Dict[str, float]]] = {}
+
+
+def case(name: str):
+    def register(func: Callable[[int], Dict[str, float]]):
+        CASES[name] = func
+        return func
+
+    return register
+
+
+def per_item(func: Callable[[], Any], items: int, repeat: int = 3) -> float:
+    """Best of ``repeat`` runs of ``func``, in microseconds per item."""
+    best = float("inf")
+    for _ in range(1 if items >= 1_000_000 else repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best / items * 1_000_000
+
+
+def categories(size: int) -> List[Any]:
+    from histafrica.category.domain.entity import Category
+
+    return [
+        Category(name=f"category {i}", description=f"description {i}")
+        for i in range(size)
+    ]
+
+
+@case("repository")
+def repository(size: int) -> Dict[str, float]:
+    from histafrica.benchmarks import measure
+    from histafrica.benchmarks.repository import CategoryRepository
+
+    repo = CategoryRepository()
+    entities = categories(size)
+    for entity in entities:
+        repo.insert(entity)
+
+    number = min(size, OPERATIONS)
+    sample = random.choices(entities, k=number)
+    new_entities = iter(categories(number))
+    lookups, updates = iter(sample), iter(sample)
+    deletes = iter(random.sample(entities, number // 2))
+
+    def delete_and_insert():
+        entity = next(deletes)
+        repo.delete(entity)
+        repo.insert(entity)
+
+    return {
+        "insert": measure(lambda: repo.insert(next(new_entities)), number),
+        "find_by_id": measure(lambda: repo.find_by_id(next(lookups).id), number),
+        "update": measure(lambda: repo.update(next(updates)), number),
+        "delete+insert": measure(delete_and_insert, number // 2),
+    }
+
+
+@case("search_params")
+def search_params(size: int) -> Dict[str, float]:
+    from histafrica.shared.domain.repository import SearchParams
+
+    raw = [
+        {"page": str(i % 50), "per_page": "15", "sort": "name", "sort_dir": "DESC"}
+        for i in range(size)
+    ]
+    queries = [
+        f"page={i % 50}&per_page=15&sort=name&sort_dir=DESC" for i in range(size)
+    ]
+    sortable_fields = ["name", "created_at"]
+    return {
+        "normalize": per_item(lambda: [SearchParams(**params) for params in raw], size),
+        "from_query": per_item(
+            lambda: [SearchParams.from_query(q, sortable_fields) for q in queries], size
+        ),
+    }
+
+
+@case("entity.to_dict")
+def entity_to_dict(size: int) -> Dict[str, float]:
+    from histafrica.shared.domain.entity import Entity
+
+    entities = categories(size)
+    return {
+        "to_dict": per_item(lambda: [entity.to_dict() for entity in entities], size),
+        "to_dicts": per_item(lambda: Entity.to_dicts(entities), size),
+    }
+
+
+@case("unique_entity_id")
+def unique_entity_id(size: int) -> Dict[str, float]:
+    from histafrica.shared.domain.value_objects import UniqueEntityId
+
+    ids = [str(UniqueEntityId()) for _ in range(size)]
+    return {
+        "new": per_item(lambda: [UniqueEntityId() for _ in range(size)], size),
+        "time_ordered": per_item(
+            lambda: [UniqueEntityId.time_ordered() for _ in range(size)], size
+        ),
+        "parse": per_item(lambda: [UniqueEntityId(value) for value in ids], size),
+    }
+
+
+@case("category_validator")
+def category_validator(size: int) -> Dict[str, float]:
+    from histafrica.category.infra.django_app.validators import CategoryValidator
+
+    items = [
+        {"name": f"category {i}", "description": f"description {i}", "is_active": True}
+        for i in range(size)
+    ]
+    for item in items[::10]:
+        item["name"] = ""
+    validator = CategoryValidator()
+    return {
+        "validate": per_item(lambda: [validator.validate(i) for i in items], size),
+        "validate_many": per_item(lambda: validator.validate_many(items), size),
+    }
+
+
+@case("collection_serializer")
+def collection_serializer(size: int) -> Dict[str, float]:
+    from rest_framework import serializers
+
+    from histafrica.shared.application.dto import PaginationOutput
+    from histafrica.shared.domain.entity import Entity
+    from histafrica.shared.infra.django_app.renderers import StreamingJSONRenderer
+    from histafrica.shared.infra.django_app.serializers import (
+        CollectionSerializer,
+        ResourceSerializer,
+    )
+
+    class CategorySerializer(ResourceSerializer):
+        id = serializers.UUIDField()
+        name = serializers.CharField()
+        description = serializers.CharField(allow_null=True)
+        is_activate = serializers.BooleanField()
+        created_at = serializers.DateTimeField()
+
+    class CategoryCollectionSerializer(CollectionSerializer):
+        child = CategorySerializer()
+
+    pagination = PaginationOutput(
+        items=Entity.to_dicts(categories(size)),
+        total=size,
+        current_page=1,
+        per_page=size,
+        last_page=1,
+    )
+    renderer = StreamingJSONRenderer()
+
+    def stream():
+        collection = CategoryCollectionSerializer(instance=pagination)
+        for _ in renderer.render_collection(collection):
+            pass
+
+    return {
+        "data": per_item(
+            lambda: CategoryCollectionSerializer(instance=pagination).data, size
+        ),
+        "stream": per_item(stream, size),
+    }
+
+
+@case("timing")
+def timing(size: int) -> Dict[str, float]:
+    from histafrica.shared.timing import collect, timed
+
+    def call(func: Callable[[], Any]):
+        for _ in range(size):
+            func()
+
+    def plain():
+        return None
+
+    instrumented = timed("benchmark")(plain)
+
+    def collected():
+        with collect():
+            call(instrumented)
+
+    return {
+        "plain": per_item(lambda: call(plain), size),
+        "outside_request": per_item(lambda: call(instrumented), size),
+        "in_request": per_item(collected, size),
+    }
+
+
+def setup():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "framework.settings")
+    django.setup()
+
+
+def run_suite(sizes: Iterable[int], names: Optional[Iterable[str]] = None) -> Results:
+    results: Results = {}
+    for name in names or CASES:
+        for size in sizes:
+            results.setdefault(name, {})[str(size)] = CASES[name](size)
+    return results
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    case: str
+    size: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+    def __str__(self) -> str:
+        return (
+            f"{self.case}[{self.size}] {self.metric}: {self.baseline:.3f} -> "
+            f"{self.current:.3f} µs ({self.ratio - 1:+.0%})"
+        )
+
+
+def compare(results: Results, baseline: Results, threshold: float) -> List[Regression]:
+    """Metrics slower than their baseline by more than ``threshold`` (0.2 = 20%)."""
+    regressions = []
+    for name, by_size in results.items():
+        for size, metrics in by_size.items():
+            previous = baseline.get(name, {}).get(size, {})
+            for metric, current in metrics.items():
+                if metric in previous and current > previous[metric] * (1 + threshold):
+                    regressions.append(
+                        Regression(name, size, metric, previous[metric], current)
+                    )
+    return regressions
+
+
+def load_baseline(path: str) -> Results:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)["results"]
+
+
+def save_baseline(path: str, results: Results):
+    """Merge ``results`` into the baseline at ``path``, per case and size."""
+    merged = load_baseline(path)
+    for name, by_size in results.items():
+        merged.setdefault(name, {}).update(by_size)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": merged,
+            },
+            file,
+            indent=2,
+            sort_keys=True,
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("cases", nargs="*", help=", ".join(CASES))
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)))
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save", action="store_true")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    args = parser.parse_args(argv)
+    unknown = set(args.cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    setup()
+    from histafrica.benchmarks import print_table
+
+    results = run_suite([int(size) for size in args.sizes.split(",")], args.cases)
+    print_table(
+        "Benchmark suite (µs per op or item)",
+        ["case", "size", "metric", "µs"],
+        [
+            [name, size, metric, value]
+            for name, by_size in results.items()
+            for size, metrics in by_size.items()
+            for metric, value in metrics.items()
+        ],
+    )
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        return 0
+    regressions = compare(results, load_baseline(args.baseline), args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,12 @@
+import pytest
+
+from histafrica.benchmarks.suite import CASES
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name", list(CASES))
+def test_benchmark(name, benchmark_size, benchmark_session):
+    regressions = benchmark_session.record(
+        name, benchmark_size, CASES[name](benchmark_size)
+    )
+    assert not regressions, "\n".join(map(str, regressions))
@@ -0,0 +1,58 @@
+import json
+import os
+import tempfile
+import unittest
+
+from histafrica.benchmarks.suite import (
+    CASES,
+    Regression,
+    compare,
+    load_baseline,
+    run_suite,
+    save_baseline,
+)
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+
+    def test_every_case_reports_microseconds(self):
+        results = run_suite([10])
+
+        self.assertListEqual(list(results), list(CASES))
+        for by_size in results.values():
+            self.assertListEqual(list(by_size), ["10"])
+            for value in by_size["10"].values():
+                self.assertIsInstance(value, float)
+                self.assertGreater(value, 0)
+
+    def test_compare_flags_slowdowns_over_the_threshold(self):
+        baseline = {"case": {"1000": {"fast": 1.0, "slow": 1.0}}}
+        results = {
+            "case": {"1000": {"fast": 1.1, "slow": 1.5, "new": 9.0}},
+            "other": {"1000": {"fast": 9.0}},
+        }
+
+        self.assertListEqual(
+            compare(results, baseline, threshold=0.2),
+            [Regression("case", "1000", "slow", 1.0, 1.5)],
+        )
+        self.assertListEqual(compare(results, baseline, threshold=0.5), [])
+        self.assertEqual(
+            str(Regression("case", "1000", "slow", 1.0, 1.5)),
+            "case[1000] slow: 1.000 -> 1.500 µs (+50%)",
+        )
+
+    def test_save_baseline_merges_results(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "nested", "baseline.json")
+            self.assertDictEqual(load_baseline(path), {})
+
+            save_baseline(path, {"case": {"1000": {"op": 1.0}, "10": {"op": 2.0}}})
+            save_baseline(path, {"case": {"1000": {"op": 3.0}}, "other": {"1": {}}})
+
+            self.assertDictEqual(
+                load_baseline(path),
+                {"case": {"1000": {"op": 3.0}, "10": {"op": 2.0}}, "other": {"1": {}}},
+            )
+            with open(path, encoding="utf-8") as file:
+                self.assertIn("python", json.load(file))
@@ -0,0 +1,57 @@
+"""
+Cost of validating category payloads with the compiled CategoryValidator,
+one by one and through validate_many, against building the CategoryRules
+serializer for every payload.
+
+Usage: python -m histafrica.benchmarks.validators [size ...]
+"""
+
+import os
+import sys
+
+import django
+
+SIZES = [10_000]
+
+
+def run(size: int, number: int = 3):
+    from histafrica.benchmarks import measure
+    from histafrica.category.infra.django_app.validators import CategoryRules, CategoryValidator
+
+    items = [
+        {"name": f"category {i}", "description": f"description {i}", "is_active": True}
+        for i in range(size)
+    ]
+    # A tenth of the payloads are invalid, as in a dirty import file.
+    for item in items[::10]:
+        item["name"] = ""
+    validator = CategoryValidator()
+
+    def serializer():
+        return [CategoryRules(data=item).is_valid() for item in items]
+
+    # Milliseconds to validate the whole list.
+    return [
+        size,
+        measure(serializer, number) / 1000,
+        measure(lambda: [validator.validate(i) for i in items], number) / 1000,
+        measure(lambda: validator.validate_many(items), number) / 1000,
+    ]
+
+
+def main(sizes=None):
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "framework.settings")
+    django.setup()
+
+    from histafrica.benchmarks import print_table
+
+    rows = [run(size) for size in sizes or SIZES]
+    print_table(
+        "Category validation (ms per list)",
+        ["payloads", "serializer", "validate", "validate_many"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]])
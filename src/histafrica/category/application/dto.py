@@ -0,0 +1,27 @@
+import datetime
+from dataclasses import dataclass
+from typing import Optional
+
+from histafrica.category.domain.entity import Category
+
+
+@dataclass(frozen=True, slots=True)
+class CategoryOutput:
+    id: str
+    name: str
+    description: Optional[str]
+    is_active: Optional[bool]
+    created_at: datetime.datetime
+
+
+class CategoryOutputMapper:
+
+    @staticmethod
+    def to_output(entity: Category) -> CategoryOutput:
+        return CategoryOutput(
+            id=entity.id,
+            name=entity.name,
+            description=entity.description,
+            is_active=entity.is_activate,
+            created_at=entity.created_at,
+        )
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+
+from histafrica.category.application.dto import CategoryOutput, CategoryOutputMapper
+from histafrica.category.domain.repositories import CategoryRepository
+from histafrica.shared.application.dto import PaginationOutput, PaginationOutputMapper
+from histafrica.shared.application.use_case import UseCase
+from histafrica.shared.domain.repository import SearchParams
+
+
+@dataclass(frozen=True, slots=True)
+class GetCategoryUseCase(UseCase[str, CategoryOutput]):
+    category_repo: CategoryRepository
+
+    def execute(self, input_dto: str) -> CategoryOutput:
+        return CategoryOutputMapper.to_output(self.category_repo.find_by_id(input_dto))
+
+
+@dataclass(frozen=True, slots=True)
+class ListCategoriesUseCase(UseCase[SearchParams, PaginationOutput[CategoryOutput]]):
+    category_repo: CategoryRepository
+
+    def execute(self, input_dto: SearchParams) -> PaginationOutput[CategoryOutput]:
+        result = self.category_repo.search(input_dto)
+        items = [CategoryOutputMapper.to_output(item) for item in result.items]
+        return PaginationOutputMapper.from_child(PaginationOutput).to_output(
+            items, result
+        )
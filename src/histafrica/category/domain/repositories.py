@@ -0,0 +1,25 @@
+from abc import ABC
+from typing import List
+
+from histafrica.category.domain.entity import Category
+from histafrica.shared.domain.repository import (
+    AsyncSearchableRepositoryInterface,
+    SearchableRepositoryInterface,
+    SearchParams,
+    SearchResult,
+    VersionedRepositoryInterface,
+)
+
+
+class CategoryRepository(
+    SearchableRepositoryInterface[Category, SearchParams, SearchResult],
+    VersionedRepositoryInterface,
+    ABC,
+):
+    sortable_fields: List[str] = ["name", "created_at"]
+
+
+class AsyncCategoryRepository(
+    AsyncSearchableRepositoryInterface[Category, SearchParams, SearchResult], ABC
+):
+    sortable_fields: List[str] = ["name", "created_at"]
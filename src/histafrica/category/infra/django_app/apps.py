@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class CategoryConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "histafrica.category.infra.django_app"
+    label = "category"
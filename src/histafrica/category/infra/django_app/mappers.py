@@ -0,0 +1,35 @@
+from typing import Iterable, List, Sequence
+
+from histafrica.category.domain.entity import Category
+from histafrica.category.infra.django_app.models import CategoryModel
+from histafrica.shared.domain.value_objects import UniqueEntityId
+
+
+class CategoryModelMapper:
+    # Model columns in Category field order, for values_list() queries whose
+    # rows are hydrated without going through model instances.
+    columns = ("id", "name", "description", "is_active", "created_at")
+
+    @staticmethod
+    def to_entity(model: CategoryModel) -> Category:
+        return Category(
+            unique_entity_id=UniqueEntityId.trusted(model.id),
+            name=model.name,
+            description=model.description,
+            is_activate=model.is_active,
+            created_at=model.created_at,
+        )
+
+    @staticmethod
+    def rows_to_entities(rows: Iterable[Sequence]) -> List[Category]:
+        return Category.hydrate_many(rows)
+
+    @staticmethod
+    def to_model(entity: Category) -> CategoryModel:
+        return CategoryModel(
+            id=entity.id,
+            name=entity.name,
+            description=entity.description,
+            is_active=entity.is_activate,
+            created_at=entity.created_at,
+        )
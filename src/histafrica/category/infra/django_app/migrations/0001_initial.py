@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="CategoryModel",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(editable=False, primary_key=True, serialize=False),
+                ),
+                ("name", models.CharField(max_length=255)),
+                ("description", models.TextField(null=True)),
+                ("is_active", models.BooleanField(default=True)),
+                ("created_at", models.DateTimeField()),
+            ],
+            options={
+                "db_table": "categories",
+                "indexes": [
+                    models.Index(fields=["name", "id"], name="categories_name_id_idx"),
+                    models.Index(
+                        fields=["created_at", "id"], name="categories_created_at_id_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
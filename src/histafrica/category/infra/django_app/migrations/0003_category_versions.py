@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("category", "0002_category_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RepositoryVersionModel",
+            fields=[
+                (
+                    "name",
+                    models.CharField(max_length=100, primary_key=True, serialize=False),
+                ),
+                ("version", models.BigIntegerField(default=0)),
+            ],
+            options={
+                "db_table": "repository_versions",
+            },
+        ),
+        migrations.AddField(
+            model_name="categorymodel",
+            name="version",
+            field=models.BigIntegerField(default=0),
+        ),
+    ]
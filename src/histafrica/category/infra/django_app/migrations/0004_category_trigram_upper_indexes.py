@@ -0,0 +1,39 @@
+from django.db import migrations
+
+# icontains compiles to UPPER("column"::text) LIKE UPPER(%s) on PostgreSQL, so
+# the trigram indexes must be on that expression for the planner to use them.
+TRIGRAM_INDEXES = {
+    "categories_name_trgm_idx": "name",
+    "categories_description_trgm_idx": "description",
+}
+
+
+def _create(schema_editor, expression: str) -> None:
+    for name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+        schema_editor.execute(
+            f"CREATE INDEX {name} ON categories "
+            f"USING gin (({expression.format(column=column)}) gin_trgm_ops)"
+        )
+
+
+def index_upper_expressions(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    _create(schema_editor, "UPPER({column}::text)")
+
+
+def index_columns(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    _create(schema_editor, "{column}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("category", "0003_category_versions"),
+    ]
+
+    operations = [
+        migrations.RunPython(index_upper_expressions, index_columns),
+    ]
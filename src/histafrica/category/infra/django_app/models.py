@@ -0,0 +1,31 @@
+from django.db import models
+
+
+class CategoryModel(models.Model):
+    id = models.UUIDField(primary_key=True, editable=False)
+    name = models.CharField(max_length=255)
+    description = models.TextField(null=True)
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField()
+    # Repository version of the last write to the row, see RepositoryVersionModel.
+    version = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = "categories"
+        # (sort field, id) indexes back keyset pagination in both directions
+        indexes = [
+            models.Index(fields=["name", "id"], name="categories_name_id_idx"),
+            models.Index(
+                fields=["created_at", "id"], name="categories_created_at_id_idx"
+            ),
+        ]
+
+
+class RepositoryVersionModel(models.Model):
+    """Write counter of each versioned repository, one row per repository."""
+
+    name = models.CharField(primary_key=True, max_length=100)
+    version = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = "repository_versions"
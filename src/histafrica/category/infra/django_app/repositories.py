@@ -0,0 +1,525 @@
+import datetime
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.contrib.postgres.search import TrigramSimilarity
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connections, transaction
+from django.db.models import F, FloatField, Q, QuerySet, TextField, Value
+from django.db.models.functions import Cast, Coalesce, Concat
+
+from histafrica.category.domain.entity import Category
+from histafrica.category.domain.repositories import (
+    AsyncCategoryRepository,
+    CategoryRepository,
+)
+from histafrica.category.infra.django_app.mappers import CategoryModelMapper
+from histafrica.category.infra.django_app.models import (
+    CategoryModel,
+    RepositoryVersionModel,
+)
+from histafrica.shared.domain.exceptions import (
+    DuplicateEntityException,
+    InvalidCursorException,
+    InvalidUuidException,
+    NotFoundException,
+)
+from histafrica.shared.domain.repository import (
+    BulkResult,
+    SearchCursor,
+    SearchParams,
+    SearchResult,
+)
+from histafrica.shared.domain.text_search import parse_text_query
+from histafrica.shared.domain.value_objects import UniqueEntityId
+from histafrica.shared.infra.django_app.queries import estimate_count
+
+
+class CategoryDjangoQueries:
+    """Query building shared by the sync and async Django repositories."""
+
+    default_sort = "created_at"
+    default_sort_dir = "desc"
+    batch_size = 1000
+    update_fields = ["name", "description", "is_active", "created_at", "version"]
+    version_name = "categories"
+    # Types a cursor's value may have, per sort field: JSON turns whole
+    # ranks into ints.
+    cursor_value_types = {
+        "name": str,
+        "created_at": datetime.datetime,
+        "rank": (float, int),
+    }
+
+    # Writes run in a transaction with the version bump, so a version is
+    # never visible without its rows. atomic() is sync only: the async
+    # repository runs them through sync_to_async.
+
+    def _insert(self, entity: Category) -> None:
+        model = CategoryModelMapper.to_model(entity)
+        try:
+            with transaction.atomic():
+                model.version = self._next_version()
+                model.save(force_insert=True)
+        except IntegrityError as ex:
+            raise DuplicateEntityException(
+                f"Entity already exists using ID '{entity.id}'"
+            ) from ex
+
+    def _bulk_create(self, entities: List[Category]) -> None:
+        if not entities:
+            return
+        models = [CategoryModelMapper.to_model(entity) for entity in entities]
+        with transaction.atomic():
+            version = self._next_version()
+            for model in models:
+                model.version = version
+            CategoryModel.objects.bulk_create(models, batch_size=self.batch_size)
+
+    def _update(self, entity: Category) -> None:
+        fields = self._model_fields(CategoryModelMapper.to_model(entity))
+        with transaction.atomic():
+            fields["version"] = self._next_version()
+            if not CategoryModel.objects.filter(id=entity.id).update(**fields):
+                # Rolls the version bump back with the transaction.
+                raise NotFoundException(f"Entity not found using ID '{entity.id}'")
+
+    def _bulk_update(self, entities: List[Category]) -> None:
+        if not entities:
+            return
+        models = [CategoryModelMapper.to_model(entity) for entity in entities]
+        with transaction.atomic():
+            version = self._next_version()
+            for model in models:
+                model.version = version
+            CategoryModel.objects.bulk_update(
+                models, fields=self.update_fields, batch_size=self.batch_size
+            )
+
+    def _delete_ids(self, entity_ids: List[str]) -> int:
+        if not entity_ids:
+            return 0
+        with transaction.atomic():
+            deleted, _ = CategoryModel.objects.filter(id__in=entity_ids).delete()
+            if deleted:
+                self._next_version()
+        return deleted
+
+    def _next_version(self) -> int:
+        # The UPDATE locks the counter row until the caller's transaction ends,
+        # which orders concurrent writers.
+        versions = RepositoryVersionModel.objects.filter(name=self.version_name)
+        if versions.update(version=F("version") + 1):
+            return versions.values_list("version", flat=True).get()
+        # First write. The INSERT runs in its own savepoint: a concurrent
+        # writer creating the row first must not surface as an IntegrityError
+        # of the caller's entity write. The UPDATE then waits for that writer.
+        try:
+            with transaction.atomic():
+                RepositoryVersionModel.objects.create(name=self.version_name, version=1)
+            return 1
+        except IntegrityError:
+            versions.update(version=F("version") + 1)
+            return versions.values_list("version", flat=True).get()
+
+    def _entity_version_query(self, entity_id: str) -> QuerySet:
+        UniqueEntityId(entity_id)
+        return CategoryModel.objects.filter(id=entity_id).values_list(
+            "version", flat=True
+        )
+
+    def _collection_version_query(self) -> QuerySet:
+        return RepositoryVersionModel.objects.filter(
+            name=self.version_name
+        ).values_list("version", flat=True)
+
+    def _new_entities(
+        self, entities: List[Category], errors: Dict[int, Exception], existing: set
+    ) -> List[Category]:
+        added = []
+        for index, entity in enumerate(entities):
+            if index in errors:
+                continue
+            if entity.id in existing:
+                errors[index] = DuplicateEntityException(
+                    f"Entity already exists using ID '{entity.id}'"
+                )
+                continue
+            added.append(entity)
+        return added
+
+    def _page_query(
+        self, query: QuerySet, input_params: SearchParams
+    ) -> Tuple[QuerySet, str, str]:
+        sort, sort_dir = self._resolve_sort(input_params, query)
+        columns = CategoryModelMapper.columns
+        if sort == "rank":
+            query = query.annotate(rank=self._rank(input_params.filter))
+            columns += ("rank",)
+        query = query.values_list(*columns).order_by(*self._ordering(sort, sort_dir))
+        per_page = input_params.per_page
+        if input_params.cursor:
+            cursor = SearchCursor.decode(input_params.cursor, self.cursor_value_types)
+            if (cursor.sort, cursor.sort_dir) != (sort, sort_dir):
+                raise InvalidCursorException()
+            return query.filter(self._after(cursor))[: per_page + 1], sort, sort_dir
+
+        offset = (input_params.page - 1) * per_page
+        return query[offset : offset + per_page + 1], sort, sort_dir
+
+    @staticmethod
+    def _to_result(
+        rows: List[Tuple],
+        input_params: SearchParams,
+        sort: str,
+        sort_dir: str,
+        total: Optional[int],
+        estimated_total: Optional[int],
+    ) -> SearchResult:
+        # The extra row fetched past the page tells whether a next page exists
+        # without needing the count.
+        per_page = input_params.per_page
+        has_next = len(rows) > per_page
+        next_cursor = None
+        if has_next:
+            rows = rows[:per_page]
+            last = rows[-1]
+            position = (*CategoryModelMapper.columns, "rank").index(sort)
+            next_cursor = SearchCursor(
+                sort=sort, sort_dir=sort_dir, value=last[position], id=str(last[0])
+            ).encode()
+
+        return SearchResult(
+            items=CategoryModelMapper.rows_to_entities(rows),
+            total=total,
+            current_page=input_params.page,
+            per_page=per_page,
+            sort=input_params.sort,
+            sort_dir=input_params.sort_dir,
+            filter=input_params.filter,
+            next_cursor=next_cursor,
+            has_next=has_next,
+            estimated_total=estimated_total,
+        )
+
+    def _apply_filter(self, query: QuerySet, filter_param: Optional[str]) -> QuerySet:
+        # Same syntax as the in-memory index: every term must appear in the
+        # name or the description. On PostgreSQL icontains emits
+        # UPPER(col::text) LIKE UPPER(%s), served by the trigram GIN indexes on
+        # those expressions (migration 0004).
+        if filter_param is None:
+            return query
+        for term in parse_text_query(filter_param):
+            query = query.filter(
+                Q(name__icontains=term) | Q(description__icontains=term)
+            )
+        return query
+
+    def _resolve_sort(
+        self, input_params: SearchParams, query: QuerySet
+    ) -> Tuple[str, str]:
+        if input_params.sort in self.sortable_fields:
+            return input_params.sort, input_params.sort_dir
+        # Unsorted text searches come back best match first where pg_trgm can
+        # rank them, like the in-memory repository does.
+        if (
+            input_params.filter is not None
+            and connections[query.db].vendor == "postgresql"
+        ):
+            return "rank", "desc"
+        return self.default_sort, self.default_sort_dir
+
+    @staticmethod
+    def _rank(filter_param: str) -> Cast:
+        text = Concat(
+            "name",
+            Value(" "),
+            Coalesce("description", Value("")),
+            output_field=TextField(),
+        )
+        # similarity() is a real; as a double it survives the cursor's JSON
+        # round trip exactly, so keyset pages can compare it for equality.
+        return Cast(TrigramSimilarity(text, filter_param), FloatField())
+
+    @staticmethod
+    def _ordering(sort: str, sort_dir: str) -> Tuple[str, str]:
+        prefix = "-" if sort_dir == "desc" else ""
+        return f"{prefix}{sort}", f"{prefix}id"
+
+    @staticmethod
+    def _after(cursor: SearchCursor) -> Q:
+        # Rows strictly after (value, id) in the page order. The OR alone is
+        # not an index condition, so it is ANDed with the inclusive bound on
+        # the sort field: the (sort field, id) index then seeks to the cursor
+        # instead of filtering every row before it.
+        lookup = "lt" if cursor.sort_dir == "desc" else "gt"
+        return Q(**{f"{cursor.sort}__{lookup}e": cursor.value}) & (
+            Q(**{f"{cursor.sort}__{lookup}": cursor.value})
+            | Q(**{cursor.sort: cursor.value, f"id__{lookup}": cursor.id})
+        )
+
+    @staticmethod
+    def _ids_query(entity_ids) -> QuerySet:
+        return CategoryModel.objects.filter(id__in=list(entity_ids)).values_list(
+            "id", flat=True
+        )
+
+    def _valid_ids(
+        self, batch: List[Any], errors: Dict[int, Exception]
+    ) -> Dict[int, str]:
+        valid = {}
+        for index, item in enumerate(batch):
+            if index in errors:
+                continue
+            entity_id = self._entity_id(item)
+            try:
+                UniqueEntityId(entity_id)
+            except InvalidUuidException:
+                errors[index] = NotFoundException(
+                    f"Entity not found using ID '{entity_id}'"
+                )
+                continue
+            valid[index] = entity_id
+        return valid
+
+    @staticmethod
+    def _keep_existing(
+        batch: List[Any],
+        valid: Dict[int, str],
+        existing: set,
+        errors: Dict[int, Exception],
+    ) -> List[Any]:
+        found = []
+        for index, entity_id in valid.items():
+            if entity_id not in existing:
+                errors[index] = NotFoundException(
+                    f"Entity not found using ID '{entity_id}'"
+                )
+                continue
+            found.append(batch[index])
+        return found
+
+    @staticmethod
+    def _model_fields(model: CategoryModel) -> Dict[str, Any]:
+        return {
+            "name": model.name,
+            "description": model.description,
+            "is_active": model.is_active,
+            "created_at": model.created_at,
+        }
+
+
+class CategoryDjangoRepository(CategoryDjangoQueries, CategoryRepository):
+    def insert(self, entity: Category) -> None:
+        self._insert(entity)
+
+    def bulk_insert(self, entities: List[Category]) -> BulkResult:
+        errors = self._find_duplicates(entities)
+        existing = self._existing_ids(
+            entity.id for index, entity in enumerate(entities) if index not in errors
+        )
+        added = self._new_entities(entities, errors, existing)
+
+        self._bulk_create(added)
+        return BulkResult(succeeded=[entity.id for entity in added], errors=errors)
+
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> Category:
+        return CategoryModelMapper.to_entity(self._get(str(entity_id)))
+
+    def entity_version(self, entity_id: str | UniqueEntityId) -> Optional[int]:
+        try:
+            return self._entity_version_query(str(entity_id)).first()
+        except InvalidUuidException:
+            return None
+
+    def collection_version(self) -> int:
+        return self._collection_version_query().first() or 0
+
+    def find_all(self) -> List[Category]:
+        return CategoryModelMapper.rows_to_entities(
+            CategoryModel.objects.values_list(*CategoryModelMapper.columns)
+        )
+
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[Category]:
+        # On PostgreSQL, QuerySet.iterator() reads through a psycopg server-side
+        # cursor, fetching chunk_size rows per round trip, so memory stays flat
+        # whatever the size of the table.
+        rows = (
+            CategoryModel.objects.order_by()
+            .values_list(*CategoryModelMapper.columns)
+            .iterator(chunk_size=chunk_size)
+        )
+        while chunk := list(islice(rows, chunk_size)):
+            yield from CategoryModelMapper.rows_to_entities(chunk)
+
+    def update(self, entity: Category) -> None:
+        self._update(entity)
+
+    def bulk_update(self, entities: List[Category]) -> BulkResult:
+        errors = self._find_duplicates(entities)
+        found = self._collect_existing(entities, errors)
+
+        self._bulk_update(found)
+        return BulkResult(succeeded=[entity.id for entity in found], errors=errors)
+
+    def delete(self, entity_id: str | UniqueEntityId | Category) -> None:
+        model = self._get(self._entity_id(entity_id))
+        if not self._delete_ids([model.id]):
+            raise NotFoundException(f"Entity not found using ID '{model.id}'")
+
+    def bulk_delete(
+        self, entity_ids: List[str | UniqueEntityId | Category]
+    ) -> BulkResult:
+        errors = self._find_duplicates(entity_ids)
+        found = [
+            self._entity_id(item) for item in self._collect_existing(entity_ids, errors)
+        ]
+
+        self._delete_ids(found)
+        return BulkResult(succeeded=found, errors=errors)
+
+    def search(self, input_params: SearchParams) -> SearchResult:
+        query = self._apply_filter(CategoryModel.objects.all(), input_params.filter)
+        total = query.count() if input_params.count_mode == "exact" else None
+        estimated_total = (
+            estimate_count(query) if input_params.count_mode == "estimate" else None
+        )
+
+        rows, sort, sort_dir = self._page_query(query, input_params)
+        return self._to_result(
+            list(rows), input_params, sort, sort_dir, total, estimated_total
+        )
+
+    def _get(self, entity_id: str) -> CategoryModel:
+        try:
+            return CategoryModel.objects.get(id=entity_id)
+        except (CategoryModel.DoesNotExist, ValidationError) as ex:
+            raise NotFoundException(f"Entity not found using ID '{entity_id}'") from ex
+
+    def _existing_ids(self, entity_ids) -> set:
+        return {str(entity_id) for entity_id in self._ids_query(entity_ids)}
+
+    def _collect_existing(self, batch: List[Any], errors: Dict[int, Exception]):
+        valid = self._valid_ids(batch, errors)
+        existing = self._existing_ids(valid.values())
+        return self._keep_existing(batch, valid, existing, errors)
+
+
+class CategoryDjangoAsyncRepository(CategoryDjangoQueries, AsyncCategoryRepository):
+    """
+    Same queries through Django's async ORM API. As of Django 5.x the database
+    drivers are still sync, so each query is run in a worker thread; callers
+    already get the async interface and will use native async connections
+    once Django provides them.
+    """
+
+    async def insert(self, entity: Category) -> None:
+        # The savepoint keeps a duplicate from breaking the caller's
+        # transaction, and atomic() is only available to sync code.
+        await sync_to_async(self._insert)(entity)
+
+    async def bulk_insert(self, entities: List[Category]) -> BulkResult:
+        errors = self._find_duplicates(entities)
+        existing = await self._existing_ids(
+            entity.id for index, entity in enumerate(entities) if index not in errors
+        )
+        added = self._new_entities(entities, errors, existing)
+
+        await sync_to_async(self._bulk_create)(added)
+        return BulkResult(succeeded=[entity.id for entity in added], errors=errors)
+
+    async def find_by_id(self, entity_id: str | UniqueEntityId) -> Category:
+        return CategoryModelMapper.to_entity(await self._get(str(entity_id)))
+
+    async def entity_version(self, entity_id: str | UniqueEntityId) -> Optional[int]:
+        try:
+            return await self._entity_version_query(str(entity_id)).afirst()
+        except InvalidUuidException:
+            return None
+
+    async def collection_version(self) -> int:
+        return await self._collection_version_query().afirst() or 0
+
+    async def find_all(self) -> List[Category]:
+        return CategoryModelMapper.rows_to_entities(
+            [
+                row
+                async for row in CategoryModel.objects.values_list(
+                    *CategoryModelMapper.columns
+                )
+            ]
+        )
+
+    async def iter_all(self, chunk_size: int = 1000) -> AsyncIterator[Category]:
+        # aiterator() runs a values_list() query from the event loop thread,
+        # so the chunks are fetched through sync_to_async instead.
+        rows = (
+            CategoryModel.objects.order_by()
+            .values_list(*CategoryModelMapper.columns)
+            .iterator(chunk_size=chunk_size)
+        )
+        next_chunk = sync_to_async(lambda: list(islice(rows, chunk_size)))
+        while chunk := await next_chunk():
+            for entity in CategoryModelMapper.rows_to_entities(chunk):
+                yield entity
+
+    async def update(self, entity: Category) -> None:
+        await sync_to_async(self._update)(entity)
+
+    async def bulk_update(self, entities: List[Category]) -> BulkResult:
+        errors = self._find_duplicates(entities)
+        found = await self._collect_existing(entities, errors)
+
+        await sync_to_async(self._bulk_update)(found)
+        return BulkResult(succeeded=[entity.id for entity in found], errors=errors)
+
+    async def delete(self, entity_id: str | UniqueEntityId | Category) -> None:
+        model = await self._get(self._entity_id(entity_id))
+        if not await sync_to_async(self._delete_ids)([model.id]):
+            raise NotFoundException(f"Entity not found using ID '{model.id}'")
+
+    async def bulk_delete(
+        self, entity_ids: List[str | UniqueEntityId | Category]
+    ) -> BulkResult:
+        errors = self._find_duplicates(entity_ids)
+        found = [
+            self._entity_id(item)
+            for item in await self._collect_existing(entity_ids, errors)
+        ]
+
+        await sync_to_async(self._delete_ids)(found)
+        return BulkResult(succeeded=found, errors=errors)
+
+    async def search(self, input_params: SearchParams) -> SearchResult:
+        query = self._apply_filter(CategoryModel.objects.all(), input_params.filter)
+        total = await query.acount() if input_params.count_mode == "exact" else None
+        estimated_total = (
+            await sync_to_async(estimate_count)(query)
+            if input_params.count_mode == "estimate"
+            else None
+        )
+
+        rows, sort, sort_dir = self._page_query(query, input_params)
+        return self._to_result(
+            [row async for row in rows],
+            input_params,
+            sort,
+            sort_dir,
+            total,
+            estimated_total,
+        )
+
+    async def _get(self, entity_id: str) -> CategoryModel:
+        try:
+            return await CategoryModel.objects.aget(id=entity_id)
+        except (CategoryModel.DoesNotExist, ValidationError) as ex:
+            raise NotFoundException(f"Entity not found using ID '{entity_id}'") from ex
+
+    async def _existing_ids(self, entity_ids) -> set:
+        return {str(entity_id) async for entity_id in self._ids_query(entity_ids)}
+
+    async def _collect_existing(self, batch: List[Any], errors: Dict[int, Exception]):
+        valid = self._valid_ids(batch, errors)
+        existing = await self._existing_ids(valid.values())
+        return self._keep_existing(batch, valid, existing, errors)
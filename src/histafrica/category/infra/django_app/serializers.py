@@ -0,0 +1,18 @@
+from rest_framework import serializers
+
+from histafrica.shared.infra.django_app.serializers import (
+    CollectionSerializer,
+    ResourceSerializer,
+)
+
+
+class CategorySerializer(ResourceSerializer):
+    id = serializers.UUIDField()
+    name = serializers.CharField()
+    description = serializers.CharField(allow_null=True)
+    is_active = serializers.BooleanField(allow_null=True)
+    created_at = serializers.DateTimeField()
+
+
+class CategoryCollectionSerializer(CollectionSerializer):
+    child = CategorySerializer()
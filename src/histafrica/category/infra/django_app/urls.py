@@ -0,0 +1,15 @@
+from django.urls import path
+
+from histafrica.category.infra.django_app.views import (
+    CategoryDetailView,
+    CategoryListView,
+)
+
+urlpatterns = [
+    path("categories/", CategoryListView.as_view(), name="category-list"),
+    path(
+        "categories/<uuid:category_id>/",
+        CategoryDetailView.as_view(),
+        name="category-detail",
+    ),
+]
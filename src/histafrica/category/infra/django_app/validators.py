@@ -1,9 +1,7 @@
-from typing import Dict
-
 from rest_framework import serializers
 
-from histafrica.shared.domain.validators import (
-    DRFValidator,
+from histafrica.shared.infra.django_app.validators import (
+    CompiledDRFValidator,
     StrictBooleanField,
     StrictCharField,
 )
@@ -16,10 +14,8 @@ class CategoryRules(serializers.Serializer):
     created_at = serializers.DateTimeField(required=False)
 
 
-class CategoryValidator(DRFValidator):
-    def validate(self, data: Dict) -> bool:
-        rules = CategoryRules(data=data if data is not None else {})
-        return super().validate(rules)
+class CategoryValidator(CompiledDRFValidator):
+    rules = CategoryRules
 
 
 class CategoryValidatorFactory:
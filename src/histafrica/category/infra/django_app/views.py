@@ -0,0 +1,90 @@
+from typing import Optional
+
+from django.http import HttpRequest, HttpResponseNotModified
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from histafrica.category.application.use_cases import (
+    GetCategoryUseCase,
+    ListCategoriesUseCase,
+)
+from histafrica.category.infra.django_app.repositories import CategoryDjangoRepository
+from histafrica.category.infra.django_app.serializers import (
+    CategoryCollectionSerializer,
+    CategorySerializer,
+)
+from histafrica.shared.domain.exceptions import NotFoundException
+from histafrica.shared.domain.repository import SearchParams
+from histafrica.shared.infra.django_app.conditional import (
+    VersionedView,
+    digest,
+    etag_matches,
+    strong_etag,
+)
+from histafrica.shared.infra.django_app.renderers import StreamingCollectionResponse
+
+# Clients and shared caches keep the body but revalidate it on every use,
+# which costs a version lookup when nothing changed.
+CACHE_CONTROL = "no-cache"
+
+
+class CategoryListView(VersionedView):
+    """
+    Category pages. The ETag is the repository version plus a hash of the
+    normalized query, so a matching If-None-Match is answered from one
+    counter read, before any category is loaded.
+    """
+
+    repository_class = CategoryDjangoRepository
+
+    def search_params(self, request: HttpRequest) -> SearchParams:
+        return SearchParams.from_query(
+            request.GET, self.repository_class.sortable_fields
+        )
+
+    def get_etag(self, request: HttpRequest, **kwargs) -> Optional[str]:
+        version = self.repository_class().collection_version()
+        return strong_etag(
+            "c", version, digest(self.search_params(request).cache_key())
+        )
+
+    def get(self, request: Request):
+        etag = self.etag(request)
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        if etag_matches(request, etag):
+            return HttpResponseNotModified(headers=headers)
+
+        output = ListCategoriesUseCase(self.repository_class()).execute(
+            self.search_params(request)
+        )
+        if self.get_etag(request) != etag:
+            # Written while the page was read: the page may not be the one the
+            # ETag names, so it goes out without one.
+            del headers["ETag"]
+        return StreamingCollectionResponse(
+            CategoryCollectionSerializer(output), headers=headers
+        )
+
+
+class CategoryDetailView(VersionedView):
+    """A category, tagged with its own version."""
+
+    repository_class = CategoryDjangoRepository
+
+    def get_etag(self, request: HttpRequest, **kwargs) -> Optional[str]:
+        category_id = str(kwargs["category_id"])
+        version = self.repository_class().entity_version(category_id)
+        return None if version is None else strong_etag(category_id, version)
+
+    def get(self, request: Request, category_id: str):
+        etag = self.etag(request, category_id=category_id)
+        if etag is None:
+            raise NotFoundException(f"Entity not found using ID '{category_id}'")
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        if etag_matches(request, etag):
+            return HttpResponseNotModified(headers=headers)
+
+        output = GetCategoryUseCase(self.repository_class()).execute(str(category_id))
+        if self.get_etag(request, category_id=category_id) != etag:
+            del headers["ETag"]
+        return Response(CategorySerializer(output).data, headers=headers)
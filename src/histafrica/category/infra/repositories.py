@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+from histafrica.category.domain.entity import Category
+from histafrica.category.domain.repositories import CategoryRepository
+from histafrica.shared.domain.repository import InMemorySearchableRepository
+
+
+@dataclass(slots=True)
+class CategoryInMemoryRepository(
+    InMemorySearchableRepository[Category], CategoryRepository
+):
+    text_fields = ["name", "description"]
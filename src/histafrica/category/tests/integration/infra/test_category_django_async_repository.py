@@ -0,0 +1,89 @@
+from django.test import TestCase
+
+from histafrica.category.domain.entity import Category
+from histafrica.category.infra.django_app.repositories import (
+    CategoryDjangoAsyncRepository,
+)
+from histafrica.category.tests.integration.infra.test_category_django_repository import (  # noqa: E501
+    make_categories,
+)
+from histafrica.shared.domain.exceptions import (
+    DuplicateEntityException,
+    NotFoundException,
+)
+from histafrica.shared.domain.repository import SearchParams
+
+
+class TestCategoryDjangoAsyncRepository(TestCase):
+    repo: CategoryDjangoAsyncRepository
+
+    def setUp(self) -> None:
+        self.repo = CategoryDjangoAsyncRepository()
+
+    async def test_crud(self):
+        category = Category(name="Movie", description="Some description")
+        await self.repo.insert(category)
+        self.assertEqual(await self.repo.find_by_id(category.id), category)
+
+        with self.assertRaises(DuplicateEntityException):
+            await self.repo.insert(category)
+
+        updated = Category(
+            unique_entity_id=category.unique_entity_id,
+            name="Documentary",
+            created_at=category.created_at,
+        )
+        await self.repo.update(updated)
+        self.assertEqual(await self.repo.find_all(), [updated])
+
+        await self.repo.delete(category.id)
+        with self.assertRaises(NotFoundException):
+            await self.repo.find_by_id(category.id)
+        with self.assertRaises(NotFoundException):
+            await self.repo.update(updated)
+
+    async def test_bulk_operations(self):
+        categories = make_categories(3)
+        result = await self.repo.bulk_insert([*categories, categories[0]])
+        self.assertEqual(result.succeeded, [c.id for c in categories])
+        self.assertIsInstance(result.errors[3], DuplicateEntityException)
+
+        result = await self.repo.bulk_update([categories[1], make_categories(1)[0]])
+        self.assertEqual(result.succeeded, [categories[1].id])
+        self.assertIsInstance(result.errors[1], NotFoundException)
+
+        result = await self.repo.bulk_delete([categories[0].id, "fake"])
+        self.assertEqual(result.succeeded, [categories[0].id])
+        self.assertIsInstance(result.errors[1], NotFoundException)
+
+        items = [entity async for entity in self.repo.iter_all(chunk_size=1)]
+        self.assertCountEqual(items, categories[1:])
+
+    async def test_search_matches_sync_repository_shape(self):
+        categories = make_categories(5)
+        await self.repo.bulk_insert(categories)
+
+        result = await self.repo.search(SearchParams(per_page=2, sort="name"))
+        self.assertEqual(result.items, categories[:2])
+        self.assertEqual(result.total, 5)
+        self.assertTrue(result.has_next)
+
+        result = await self.repo.search(
+            SearchParams(per_page=2, sort="name", cursor=result.next_cursor)
+        )
+        self.assertEqual(result.items, categories[2:4])
+
+    async def test_versions_follow_writes(self):
+        category, other = make_categories(2)
+        self.assertEqual(await self.repo.collection_version(), 0)
+
+        await self.repo.bulk_insert([category, other])
+        await self.repo.update(category)
+        self.assertEqual(await self.repo.collection_version(), 2)
+        self.assertEqual(await self.repo.entity_version(category.id), 2)
+        self.assertEqual(await self.repo.entity_version(other.id), 1)
+
+        await self.repo.delete(category.id)
+        self.assertEqual(await self.repo.collection_version(), 3)
+        self.assertIsNone(await self.repo.entity_version(category.id))
+        self.assertIsNone(await self.repo.entity_version("fake id"))
@@ -0,0 +1,335 @@
+import datetime
+import unittest
+from unittest import mock
+
+from django.db import connection
+from django.db.models import QuerySet
+from django.test import TestCase
+
+from histafrica.category.domain.entity import Category
+from histafrica.category.infra.django_app.models import (
+    CategoryModel,
+    RepositoryVersionModel,
+)
+from histafrica.category.infra.django_app.repositories import (
+    CategoryDjangoRepository,
+)
+from histafrica.shared.domain.exceptions import (
+    DuplicateEntityException,
+    InvalidCursorException,
+    NotFoundException,
+)
+from histafrica.shared.domain.repository import SearchCursor, SearchParams
+
+
+def make_categories(size: int):
+    created_at = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    return [
+        Category(
+            name=f"category {i:02}",
+            created_at=created_at + datetime.timedelta(seconds=i),
+        )
+        for i in range(size)
+    ]
+
+
+class TestCategoryDjangoRepository(TestCase):
+    repo: CategoryDjangoRepository
+
+    def setUp(self) -> None:
+        self.repo = CategoryDjangoRepository()
+
+    def test_insert_and_find_by_id(self):
+        category = Category(name="Movie", description="Some description")
+        self.repo.insert(category)
+
+        model = CategoryModel.objects.get(id=category.id)
+        self.assertEqual(model.name, "Movie")
+        self.assertEqual(self.repo.find_by_id(category.id), category)
+        self.assertEqual(self.repo.find_by_id(category.unique_entity_id), category)
+
+    def test_throw_duplicate_entity_exception_in_insert(self):
+        category = Category(name="Movie")
+        self.repo.insert(category)
+        with self.assertRaises(DuplicateEntityException):
+            self.repo.insert(category)
+
+    def test_throw_not_found_exception(self):
+        category = Category(name="Movie")
+        for action in [
+            lambda: self.repo.find_by_id("fake id"),
+            lambda: self.repo.find_by_id(category.id),
+            lambda: self.repo.update(category),
+            lambda: self.repo.delete(category.id),
+        ]:
+            with self.assertRaises(NotFoundException):
+                action()
+
+    def test_update_and_delete(self):
+        category = Category(name="Movie")
+        self.repo.insert(category)
+
+        category_updated = Category(
+            unique_entity_id=category.unique_entity_id,
+            name="Documentary",
+            is_activate=False,
+            created_at=category.created_at,
+        )
+        self.repo.update(category_updated)
+        self.assertEqual(self.repo.find_by_id(category.id), category_updated)
+
+        self.repo.delete(category.id)
+        self.assertEqual(self.repo.find_all(), [])
+
+    def test_bulk_operations(self):
+        categories = make_categories(3)
+        self.repo.insert(categories[0])
+
+        result = self.repo.bulk_insert([*categories, categories[1]])
+        self.assertEqual(result.succeeded, [categories[1].id, categories[2].id])
+        self.assertIsInstance(result.errors[0], DuplicateEntityException)
+        self.assertIsInstance(result.errors[3], DuplicateEntityException)
+        self.assertEqual(CategoryModel.objects.count(), 3)
+
+        category_updated = Category(
+            unique_entity_id=categories[1].unique_entity_id,
+            name="updated",
+            created_at=categories[1].created_at,
+        )
+        result = self.repo.bulk_update([category_updated, Category(name="missing")])
+        self.assertEqual(result.succeeded, [category_updated.id])
+        self.assertIsInstance(result.errors[1], NotFoundException)
+        self.assertEqual(self.repo.find_by_id(category_updated.id), category_updated)
+
+        result = self.repo.bulk_delete([categories[0].id, categories[2], "fake id"])
+        self.assertEqual(result.succeeded, [categories[0].id, categories[2].id])
+        self.assertIsInstance(result.errors[2], NotFoundException)
+        self.assertEqual(self.repo.find_all(), [category_updated])
+
+    def test_iter_all(self):
+        categories = make_categories(5)
+        self.repo.bulk_insert(categories)
+
+        items = list(self.repo.iter_all(chunk_size=2))
+        self.assertCountEqual(items, categories)
+
+    def test_search_sorts_by_created_at_desc_by_default(self):
+        categories = make_categories(16)
+        self.repo.bulk_insert(categories)
+
+        result = self.repo.search(SearchParams())
+        self.assertEqual(result.items, categories[::-1][:15])
+        self.assertEqual(result.total, 16)
+        self.assertEqual(result.last_page, 2)
+
+        result = self.repo.search(SearchParams(page=2))
+        self.assertEqual(result.items, [categories[0]])
+        self.assertIsNone(result.next_cursor)
+
+    def test_search_without_count(self):
+        categories = make_categories(5)
+        self.repo.bulk_insert(categories)
+
+        with self.assertNumQueries(1):
+            result = self.repo.search(SearchParams(per_page=2, count_mode="none"))
+        self.assertEqual(result.items, categories[::-1][:2])
+        self.assertIsNone(result.total)
+        self.assertTrue(result.has_next)
+
+        result = self.repo.search(
+            SearchParams(page=3, per_page=2, count_mode="estimate")
+        )
+        self.assertEqual(result.items, [categories[0]])
+        self.assertFalse(result.has_next)
+        # estimates come from the PostgreSQL planner only
+        self.assertIsNone(result.estimated_total)
+
+    def test_search_with_filter_and_sort(self):
+        categories = [
+            Category(name="test b"),
+            Category(name="fake", description="a TEST description"),
+            Category(name="other"),
+        ]
+        self.repo.bulk_insert(categories)
+
+        result = self.repo.search(SearchParams(filter="test", sort="name"))
+        self.assertEqual(result.items, [categories[1], categories[0]])
+        self.assertEqual(result.total, 2)
+
+    def test_search_filter_requires_every_term(self):
+        categories = [
+            Category(name="Documentary", description="Movies about history"),
+            Category(name="Movie"),
+        ]
+        self.repo.bulk_insert(categories)
+
+        result = self.repo.search(SearchParams(filter="mov HIST"))
+        self.assertEqual(result.items, [categories[0]])
+
+    @unittest.skipUnless(
+        connection.vendor == "postgresql", "trigram indexes are PostgreSQL only"
+    )
+    def test_search_filter_uses_the_trigram_indexes(self):
+        self.repo.bulk_insert(make_categories(10))
+        query = self.repo._apply_filter(CategoryModel.objects.all(), "category")
+        with connection.cursor() as cursor:
+            # A table this small is cheaper to scan; ruling that out shows
+            # whether the indexes can serve the filter at all.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            plan = query.explain()
+
+        self.assertIn("categories_name_trgm_idx", plan)
+        self.assertIn("categories_description_trgm_idx", plan)
+
+    def test_search_with_cursor_walks_every_page(self):
+        categories = make_categories(7)
+        # ties on the sort field are broken by id
+        categories.append(
+            Category(name=categories[3].name, created_at=categories[3].created_at)
+        )
+        self.repo.bulk_insert(categories)
+
+        for sort_dir in ["asc", "desc"]:
+            expected = sorted(
+                categories,
+                key=lambda c: (c.name, c.id),
+                reverse=sort_dir == "desc",
+            )
+            params = dict(per_page=3, sort="name", sort_dir=sort_dir)
+            result = self.repo.search(SearchParams(**params))
+            items = list(result.items)
+            while result.next_cursor:
+                result = self.repo.search(
+                    SearchParams(**params, cursor=result.next_cursor)
+                )
+                items.extend(result.items)
+
+            self.assertEqual(items, expected, sort_dir)
+
+    def test_search_with_cursor_seeks_the_sort_index(self):
+        self.repo.bulk_insert(make_categories(5))
+        first = self.repo.search(SearchParams(per_page=2, sort="name"))
+        cursor = SearchCursor.decode(first.next_cursor)
+        query = CategoryModel.objects.order_by("name", "id").filter(
+            self.repo._after(cursor)
+        )
+        plan = query.explain()
+
+        if connection.vendor == "postgresql":
+            self.assertIn("Index Cond", plan)
+        else:
+            self.assertIn("USING INDEX categories_name_id_idx (name>?)", plan)
+
+    @unittest.skipUnless(
+        connection.vendor == "postgresql", "ranking uses pg_trgm, PostgreSQL only"
+    )
+    def test_search_with_cursor_walks_tied_ranks(self):
+        categories = [
+            Category(name="history of africa", description=f"tome {i}")
+            for i in range(5)
+        ] + [Category(name="african history"), Category(name="africa")]
+        self.repo.bulk_insert(categories)
+
+        params = dict(per_page=2, filter="africa")
+        # Unsorted text searches page by rank, tied here but for two rows.
+        result = self.repo.search(SearchParams(**params))
+        items = list(result.items)
+        while result.next_cursor:
+            result = self.repo.search(SearchParams(**params, cursor=result.next_cursor))
+            items.extend(result.items)
+
+        self.assertEqual(len(items), len(categories))
+        self.assertEqual({item.id for item in items}, {c.id for c in categories})
+
+    def test_search_with_cursor_matches_offset_pages(self):
+        categories = make_categories(10)
+        self.repo.bulk_insert(categories)
+
+        page_1 = self.repo.search(SearchParams(per_page=4))
+        page_2 = self.repo.search(SearchParams(per_page=4, page=2))
+        # The page query alone: cursor pages are not counted.
+        with self.assertNumQueries(1):
+            by_cursor = self.repo.search(
+                SearchParams(per_page=4, cursor=page_1.next_cursor)
+            )
+        self.assertEqual(by_cursor.items, page_2.items)
+        self.assertEqual(by_cursor.next_cursor, page_2.next_cursor)
+        self.assertIsNone(by_cursor.total)
+        self.assertTrue(by_cursor.has_next)
+
+    def test_throw_invalid_cursor_exception(self):
+        self.repo.bulk_insert(make_categories(3))
+        result = self.repo.search(SearchParams(per_page=1, sort="name"))
+
+        with self.assertRaises(InvalidCursorException):
+            self.repo.search(SearchParams(per_page=1, cursor=result.next_cursor))
+
+        with self.assertRaises(InvalidCursorException):
+            self.repo.search(SearchParams(per_page=1, cursor="fake"))
+
+    def test_versions_follow_writes(self):
+        first, second, third = make_categories(3)
+        self.assertEqual(self.repo.collection_version(), 0)
+        self.assertIsNone(self.repo.entity_version(first.id))
+        self.assertIsNone(self.repo.entity_version("fake id"))
+
+        self.repo.insert(first)
+        self.repo.bulk_insert([second, third])
+        self.assertEqual(self.repo.collection_version(), 2)
+        self.assertEqual(self.repo.entity_version(first.id), 1)
+        self.assertEqual(self.repo.entity_version(third.unique_entity_id), 2)
+
+        self.repo.update(first)
+        self.repo.bulk_update([second])
+        self.assertEqual(self.repo.collection_version(), 4)
+        self.assertEqual(
+            [self.repo.entity_version(c.id) for c in (first, second, third)],
+            [3, 4, 2],
+        )
+
+        self.repo.delete(first.id)
+        self.repo.bulk_delete([second.id])
+        self.assertEqual(self.repo.collection_version(), 6)
+        self.assertIsNone(self.repo.entity_version(first.id))
+
+    def test_first_writes_racing_on_the_version_counter(self):
+        update = QuerySet.update
+        raced = []
+
+        def racing_update(queryset, **kwargs):
+            # Another writer creates the counter row between this writer's
+            # UPDATE finding no row and its INSERT.
+            if queryset.model is RepositoryVersionModel and not raced:
+                raced.append(True)
+                RepositoryVersionModel.objects.create(
+                    name=self.repo.version_name, version=1
+                )
+                return 0
+            return update(queryset, **kwargs)
+
+        category, *others = make_categories(3)
+        for write in [
+            lambda: self.repo.insert(category),
+            lambda: self.repo.bulk_insert(others),
+        ]:
+            RepositoryVersionModel.objects.all().delete()
+            raced.clear()
+            with mock.patch.object(QuerySet, "update", racing_update):
+                write()
+            self.assertEqual(self.repo.collection_version(), 2)
+
+        self.assertEqual(self.repo.entity_version(category.id), 2)
+        self.assertEqual(self.repo.entity_version(others[0].id), 2)
+
+    def test_failed_writes_keep_versions(self):
+        category = Category(name="Movie")
+        self.repo.insert(category)
+        for action in [
+            lambda: self.repo.insert(category),
+            lambda: self.repo.update(Category(name="Other")),
+            lambda: self.repo.delete(Category(name="Other").id),
+        ]:
+            with self.assertRaises((DuplicateEntityException, NotFoundException)):
+                action()
+        self.repo.bulk_delete([])
+        self.assertEqual(self.repo.collection_version(), 1)
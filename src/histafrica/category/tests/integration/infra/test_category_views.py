@@ -0,0 +1,245 @@
+import base64
+import json
+from unittest import mock
+
+import pytest
+from django.core.cache import caches
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from histafrica.category.application.use_cases import GetCategoryUseCase
+from histafrica.category.domain.entity import Category
+from histafrica.category.infra.django_app.repositories import (
+    CategoryDjangoRepository,
+)
+from histafrica.category.tests.integration.infra.test_category_django_repository import (  # noqa: E501
+    make_categories,
+)
+from histafrica.shared.infra.django_app.metrics import PHASE_SECONDS
+
+
+class TestCategoryViews(TestCase):
+
+    def setUp(self) -> None:
+        caches["responses"].clear()
+        self.client = APIClient()
+        self.repo = CategoryDjangoRepository()
+        self.categories = make_categories(3)
+        self.repo.bulk_insert(self.categories)
+
+    def test_detail_with_etag(self):
+        category = self.categories[0]
+        url = f"/api/categories/{category.id}/"
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["ETag"], f'"{category.id}-1"')
+        self.assertEqual(response.json()["data"]["name"], category.name)
+
+        not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified["ETag"], response["ETag"])
+        self.assertEqual(not_modified.content, b"")
+
+        self.repo.update(
+            Category(unique_entity_id=category.unique_entity_id, name="Renamed")
+        )
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(changed["ETag"], f'"{category.id}-2"')
+        self.assertEqual(changed.json()["data"]["name"], "Renamed")
+
+    def test_detail_not_modified_skips_loading(self):
+        category = self.categories[0]
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                f"/api/categories/{category.id}/",
+                HTTP_IF_NONE_MATCH=f'"other", W/"{category.id}-1"',
+            )
+        self.assertEqual(response.status_code, 304)
+
+    def test_server_timing_and_metrics(self):
+        response = self.client.get(f"/api/categories/{self.categories[0].id}/")
+        phases = [
+            metric.split(";")[0] for metric in response["Server-Timing"].split(", ")
+        ]
+        self.assertEqual(phases, ["repository", "use_case", "serialization", "total"])
+
+        metrics = self.client.get("/metrics")
+        self.assertEqual(
+            metrics["Content-Type"], "text/plain; version=0.0.4; charset=utf-8"
+        )
+        body = metrics.content.decode()
+        self.assertIn('histafrica_phase_seconds_count{phase="use_case"}', body)
+        self.assertIn(
+            'histafrica_request_seconds_count{method="GET",'
+            'route="api/categories/<uuid:category_id>/",status="200"}',
+            body,
+        )
+
+    def test_list_server_timing_includes_the_streamed_items(self):
+        before = sum(PHASE_SECONDS.snapshot().get(("serialization",), [[], 0.0])[0])
+        response = self.client.get("/api/categories/")
+        phases = [
+            metric.split(";")[0] for metric in response["Server-Timing"].split(", ")
+        ]
+        self.assertIn("serialization", phases)
+
+        b"".join(response.streaming_content)
+        # Observed once the stream is over.
+        after = sum(PHASE_SECONDS.snapshot()[("serialization",)][0])
+        self.assertEqual(after, before + 1)
+
+    # setUp's inserts included: a query per listed category would exceed it.
+    @pytest.mark.query_budget(8)
+    def test_list_queries_do_not_grow_with_the_page(self):
+        response = self.client.get("/api/categories/?per_page=3")
+        self.assertEqual(response.status_code, 200)
+        body = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(len(body["data"]), 3)
+
+    def test_list_walks_pages_with_the_next_cursor(self):
+        url = "/api/categories/?per_page=2&sort=name"
+        first = json.loads(b"".join(self.client.get(url).streaming_content))
+        cursor = first["meta"]["next_cursor"]
+
+        response = self.client.get(f"{url}&cursor={cursor}")
+        self.assertEqual(response.status_code, 200)
+        second = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(
+            [item["name"] for item in first["data"] + second["data"]],
+            [category.name for category in self.categories],
+        )
+        self.assertNotIn("next_cursor", second["meta"])
+
+    def test_list_with_invalid_cursor(self):
+        crafted = [
+            ["created_at", "desc", {"$datetime": "2024-01-01T00:00:00"}, "x"],
+            ["name", "asc", "a", "not-uuid"],
+            ["created_at", "desc", [1, 2], "x"],
+            ["created_at", "desc", "a", str(self.categories[0].id)],
+        ]
+        for cursor in [
+            "garbage",
+            "eyJzIjogMX0",
+            *(
+                base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+                for payload in crafted
+            ),
+        ]:
+            response = self.client.get(f"/api/categories/?cursor={cursor}")
+            self.assertEqual(response.status_code, 400, cursor)
+            self.assertEqual(
+                response.json(),
+                {"message": "Cursor is invalid or does not match the sort"},
+            )
+
+    def test_detail_not_found(self):
+        response = self.client.get(f"/api/categories/{Category(name='x').id}/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_list_with_etag(self):
+        url = "/api/categories/?per_page=2&sort=name"
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        body = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(
+            [item["name"] for item in body["data"]],
+            [category.name for category in self.categories[:2]],
+        )
+        self.assertEqual(body["meta"]["total"], 3)
+
+        etag = response["ETag"]
+        with self.assertNumQueries(1):
+            not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(not_modified.status_code, 304)
+
+        # Equivalent queries share the ETag, other pages do not.
+        same = self.client.get("/api/categories/?sort=name&per_page=2&page=1")
+        other = self.client.get("/api/categories/?per_page=2&sort=name&page=2")
+        self.assertEqual(same["ETag"], etag)
+        self.assertNotEqual(other["ETag"], etag)
+
+        self.repo.delete(self.categories[2].id)
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed["ETag"], etag)
+
+
+class TestCategoryViewsResponseCache(TestCase):
+
+    def setUp(self) -> None:
+        caches["responses"].clear()
+        self.client = APIClient()
+        self.repo = CategoryDjangoRepository()
+        self.categories = make_categories(3)
+        self.repo.bulk_insert(self.categories)
+
+    def get(self, url: str, **headers):
+        response = self.client.get(url, **headers)
+        if response.streaming:
+            return response, b"".join(response.streaming_content)
+        return response, response.content
+
+    def test_list_served_from_cache(self):
+        url = "/api/categories/?sort=name"
+        first, body = self.get(url)
+
+        with mock.patch(
+            "histafrica.category.infra.django_app.views.ListCategoriesUseCase"
+        ) as use_case, self.assertNumQueries(1):
+            cached, cached_body = self.get("/api/categories/?sort=name&page=1")
+        use_case.assert_not_called()
+        self.assertEqual(cached.status_code, 200)
+        self.assertEqual(cached_body, body)
+        self.assertEqual(cached["ETag"], first["ETag"])
+        self.assertEqual(cached["Content-Type"], first["Content-Type"])
+        self.assertEqual(cached["Cache-Control"], "no-cache")
+
+    def test_shared_tier_serves_other_workers(self):
+        url = f"/api/categories/{self.categories[0].id}/"
+        _, body = self.get(url)
+
+        # A new client loads the middleware again, with an empty local tier.
+        self.client = APIClient()
+        with mock.patch(
+            "histafrica.category.infra.django_app.views.GetCategoryUseCase"
+        ) as use_case:
+            cached, cached_body = self.get(url)
+        use_case.assert_not_called()
+        self.assertEqual(cached_body, body)
+
+    def test_writes_invalidate_touched_entries(self):
+        first, second, _ = self.categories
+        list_url = "/api/categories/"
+        first_url = f"/api/categories/{first.id}/"
+        second_url = f"/api/categories/{second.id}/"
+        for url in [list_url, first_url, second_url]:
+            self.get(url)
+
+        self.repo.update(Category(unique_entity_id=first.unique_entity_id, name="New"))
+
+        views = "histafrica.category.infra.django_app.views"
+        with mock.patch(f"{views}.GetCategoryUseCase") as use_case:
+            self.get(second_url)
+        use_case.assert_not_called()
+
+        response, body = self.get(first_url)
+        self.assertEqual(json.loads(body)["data"]["name"], "New")
+        self.assertEqual(response["ETag"], f'"{first.id}-2"')
+        _, body = self.get(list_url)
+        self.assertIn("New", [item["name"] for item in json.loads(body)["data"]])
+
+    def test_only_json_is_cached(self):
+        url = f"/api/categories/{self.categories[0].id}/"
+        self.get(url, HTTP_ACCEPT="text/html")
+
+        views = "histafrica.category.infra.django_app.views"
+        with mock.patch(
+            f"{views}.GetCategoryUseCase", wraps=GetCategoryUseCase
+        ) as use_case:
+            response, _ = self.get(url, HTTP_ACCEPT="text/html")
+        use_case.assert_called_once()
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/html"))
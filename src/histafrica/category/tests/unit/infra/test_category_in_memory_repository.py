@@ -0,0 +1,58 @@
+import unittest
+
+from histafrica.category.domain.entity import Category
+from histafrica.category.infra.repositories import CategoryInMemoryRepository
+from histafrica.shared.domain.repository import SearchParams
+
+
+class TestCategoryInMemoryRepository(unittest.TestCase):
+    repo: CategoryInMemoryRepository
+
+    def setUp(self) -> None:
+        self.repo = CategoryInMemoryRepository()
+        self.categories = [
+            Category(name="Documentary", description="Movies about history"),
+            Category(name="Movie"),
+            Category(name="Music", description=None),
+        ]
+        self.repo.bulk_insert(self.categories)
+
+    def test_search_filter_ranks_when_not_sorted(self):
+        result = self.repo.search(SearchParams(filter="movie"))
+        self.assertEqual(result.items, [self.categories[1], self.categories[0]])
+        self.assertEqual(result.total, 2)
+
+    def test_search_filter_with_sort(self):
+        result = self.repo.search(SearchParams(filter="M", sort="name"))
+        self.assertEqual(
+            result.items, [self.categories[0], self.categories[1], self.categories[2]]
+        )
+
+    def test_search_filter_requires_every_term(self):
+        result = self.repo.search(SearchParams(filter="mov HIST"))
+        self.assertEqual(result.items, [self.categories[0]])
+
+    def test_index_follows_writes(self):
+        renamed = Category(
+            unique_entity_id=self.categories[1].unique_entity_id, name="Cinema"
+        )
+        self.repo.update(renamed)
+        self.repo.delete(self.categories[0])
+
+        self.assertEqual(self.repo.search(SearchParams(filter="movie")).items, [])
+        self.assertEqual(self.repo.search(SearchParams(filter="cine")).items, [renamed])
+
+    def test_versions_follow_writes(self):
+        first, second, third = self.categories
+        self.assertEqual(self.repo.collection_version(), 1)
+        self.assertEqual(self.repo.entity_version(first.id), 1)
+
+        self.repo.update(Category(unique_entity_id=first.unique_entity_id, name="Doc"))
+        self.assertEqual(self.repo.collection_version(), 2)
+        self.assertEqual(self.repo.entity_version(first.id), 2)
+        self.assertEqual(self.repo.entity_version(second.unique_entity_id), 1)
+
+        self.repo.delete(third)
+        self.assertEqual(self.repo.collection_version(), 3)
+        self.assertIsNone(self.repo.entity_version(third.id))
+        self.assertIsNone(self.repo.entity_version("fake id"))
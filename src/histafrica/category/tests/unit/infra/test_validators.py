@@ -0,0 +1,86 @@
+import unittest
+
+from histafrica.category.infra.django_app.validators import (
+    CategoryRules,
+    CategoryValidator,
+    CategoryValidatorFactory,
+)
+
+
+class TestCategoryValidator(unittest.TestCase):
+    validator: CategoryValidator
+
+    def setUp(self) -> None:
+        self.validator = CategoryValidatorFactory.create()
+        return super().setUp()
+
+    def test_invalidation_cases_for_name_field(self):
+        invalid_data = [
+            {"data": None, "expected": "This field is required."},
+            {"data": {}, "expected": "This field is required."},
+            {"data": {"name": None}, "expected": "This field may not be null."},
+            {"data": {"name": ""}, "expected": "This field may not be blank."},
+            {"data": {"name": 5}, "expected": "Not a valid string."},
+            {
+                "data": {"name": "a" * 256},
+                "expected": "Ensure this field has no more than 255 characters.",
+            },
+        ]
+
+        for i in invalid_data:
+            is_valid = self.validator.validate(i["data"])
+            self.assertFalse(is_valid)
+
+    def test_invalidation_cases_for_description(self):
+        is_valid = self.validator.validate({"description": 5})
+
+        self.assertFalse(is_valid)
+        self.assertListEqual(
+            self.validator.errors["description"], ["Not a valid string."]
+        )
+
+    def test_same_errors_as_category_rules(self):
+        cases = [
+            {"name": "  Movie  "},
+            {"name": "Movie", "description": None, "is_active": False},
+            {"name": "Movie", "description": "   "},
+            {"name": "Movie", "description": "a\x00b"},
+            {"name": "Movie", "is_active": "yes"},
+            {"name": "Movie", "created_at": "2024-01-01T10:00:00Z"},
+            {"name": "Movie", "created_at": "yesterday"},
+            {"name": ["Movie"], "description": 5, "is_active": 0},
+        ]
+
+        for data in cases:
+            rules = CategoryRules(data=data)
+            is_valid = self.validator.validate(data)
+            self.assertEqual(is_valid, rules.is_valid(), msg=data)
+            if is_valid:
+                self.assertEqual(
+                    self.validator.validated_data, dict(rules.validated_data)
+                )
+            else:
+                self.assertEqual(
+                    self.validator.errors,
+                    {
+                        field: [str(error) for error in errors]
+                        for field, errors in rules.errors.items()
+                    },
+                )
+
+    def test_validate_many(self):
+        errors = self.validator.validate_many(
+            [{"name": "Movie"}, {"name": ""}, {"name": "Documentary"}, {"name": 5}]
+        )
+
+        self.assertEqual(
+            errors,
+            {
+                1: {"name": ["This field may not be blank."]},
+                3: {"name": ["Not a valid string."]},
+            },
+        )
+        self.assertEqual(
+            self.validator.validated_data,
+            [{"name": "Movie"}, None, {"name": "Documentary"}, None],
+        )
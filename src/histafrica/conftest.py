@@ -5,11 +5,15 @@ import pytest
 def django_db_keepdb(request) -> bool:
     from django.conf import settings
 
-    return request.conf.getvalue("reuse_db") or settings.TEST_KEEP_DB
+    return request.config.getvalue("reuse_db") or getattr(
+        settings, "TEST_KEEP_DB", False
+    )
 
 
 @pytest.fixture(scope="session")
 def django_db_use_migrations(request) -> bool:
     from django.conf import settings
 
-    return request.confi.getvalue("nomigrations") or settings.TEST_USE_MIGRATIONS
+    return not request.config.getvalue("nomigrations") and getattr(
+        settings, "TEST_USE_MIGRATIONS", True
+    )
@@ -1,9 +1,15 @@
+import cProfile
 import os
-from dataclasses import dataclass
-from typing import List
+import pstats
+import re
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
 
+import pytest
 from colorama import Fore, Style
-from pytest import Config, Item, Parser, hoolkimpl
+from pytest import Config, Item, Parser
 
 
 def pytest_addoption(parser: Parser):
@@ -20,8 +26,72 @@ def pytest_addoption(parser: Parser):
         help="run tests only from ther specified group",
     )
 
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="run only the benchmark suite and compare it with the baseline",
+    )
+    group.addoption(
+        "--benchmark-sizes",
+        action="store",
+        default="1000,100000,1000000",
+        help="comma separated sizes each benchmark case runs at",
+    )
+    group.addoption(
+        "--benchmark-baseline",
+        action="store",
+        default=os.path.join(".benchmarks", "baseline.json"),
+        help="JSON baseline to compare with, relative to the rootdir",
+    )
+    group.addoption(
+        "--benchmark-save",
+        action="store_true",
+        default=False,
+        help="store the results in the baseline instead of comparing",
+    )
+    group.addoption(
+        "--benchmark-threshold",
+        action="store",
+        type=float,
+        default=0.2,
+        help="slowdown over the baseline reported as a regression (0.2 = 20%%)",
+    )
+
+    group = parser.getgroup("profiling")
+    group.addoption(
+        "--max-queries",
+        action="store",
+        type=int,
+        default=None,
+        help="fail tests running more SQL queries than this, unless their "
+        "query_budget marker sets another budget",
+    )
+    group.addoption(
+        "--profile",
+        action="store_true",
+        default=False,
+        help="profile each test with cProfile and write its stats to --profile-dir",
+    )
+    group.addoption(
+        "--profile-dir",
+        action="store",
+        default=".profiles",
+        help="directory of the --profile stats files, relative to the rootdir",
+    )
+    group.addoption(
+        "--slowest-report",
+        action="store",
+        type=int,
+        default=None,
+        metavar="N",
+        help="profile each test and report the N functions taking the most own "
+        "time over the whole run",
+    )
 
-@hoolkimpl(tryfirst=True)
+
+@pytest.hookimpl(tryfirst=True)
 def pytest_load_initial_conftests(
     early_config: Config, parser: Parser, args: List[str]
 ):
@@ -37,7 +107,219 @@ def pytest_runtest_setup(item: Item):
 
     if group_option:
         if group_mark is None or group_option not in group_mark.args:
-            pytest.skip(f"test requires group {group_option}")  # noqa: F821
+            pytest.skip(f"test requires group {group_option}")
+
+
+def pytest_collection_modifyitems(config: Config, items: List[Item]):
+    # --benchmark runs the benchmark cases alone; they are left out otherwise.
+    run_benchmarks = config.getoption("--benchmark")
+    selected, deselected = [], []
+    for item in items:
+        is_benchmark = item.get_closest_marker("benchmark") is not None
+        (selected if is_benchmark == run_benchmarks else deselected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: Item):
+    budget = query_budget(item)
+    profiles = item.config.stash.get(profile_session_key, None)
+    with ExitStack() as stack:
+        queries = stack.enter_context(QueryCounter()) if budget is not None else None
+        if profiles is not None:
+            stack.enter_context(profiles.profile(item.nodeid))
+        result = yield
+
+    if queries is not None and queries.count > budget:
+        pytest.fail(queries.report(budget), pytrace=False)
+    return result
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter, config: Config):
+    profiles = config.stash.get(profile_session_key, None)
+    top = config.getoption("--slowest-report")
+    if profiles is None or not top or profiles.stats is None:
+        return
+    terminalreporter.write_sep("=", f"{top} slowest functions, by own time")
+    terminalreporter.write_line(
+        f"{'rank':>4} {'own s':>10} {'cumul. s':>10} {'calls':>10}  function"
+    )
+    for rank, (own, cumulative, calls, location) in enumerate(
+        profiles.hotspots(top, str(config.rootpath)), start=1
+    ):
+        terminalreporter.write_line(
+            f"{rank:>4} {own:>10.4f} {cumulative:>10.4f} {calls:>10}  {location}"
+        )
+    if profiles.directory is not None:
+        terminalreporter.write_line(f"per test stats in {profiles.directory}")
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc):
+    if "benchmark_size" in metafunc.fixturenames:
+        sizes = metafunc.config.getoption("--benchmark-sizes").split(",")
+        metafunc.parametrize("benchmark_size", [int(size) for size in sizes])
+
+
+@dataclass
+class BenchmarkSession:
+
+    baseline_path: str
+    threshold: float
+    save: bool
+    results: dict = field(default_factory=dict)
+
+    def record(self, name: str, size: int, metrics: dict) -> list:
+        """Keep the metrics of a case; return its regressions, if comparing."""
+        from histafrica.benchmarks.suite import compare, load_baseline
+
+        current = {name: {str(size): metrics}}
+        self.results.setdefault(name, {}).update(current[name])
+        if self.save:
+            return []
+        return compare(current, load_baseline(self.baseline_path), self.threshold)
+
+
+@pytest.fixture(scope="session")
+def benchmark_session(request: pytest.FixtureRequest) -> Iterator[BenchmarkSession]:
+    from histafrica.benchmarks.suite import save_baseline, setup
+
+    setup()
+    config = request.config
+    session = BenchmarkSession(
+        baseline_path=str(config.rootpath / config.getoption("--benchmark-baseline")),
+        threshold=config.getoption("--benchmark-threshold"),
+        save=config.getoption("--benchmark-save"),
+    )
+    yield session
+    if session.save and session.results:
+        save_baseline(session.baseline_path, session.results)
+
+
+def query_budget(item: Item) -> Optional[int]:
+    """Queries the test may run: its query_budget marker, else --max-queries."""
+    marker = item.get_closest_marker("query_budget")
+    if marker is not None:
+        return marker.args[0] if marker.args else marker.kwargs["queries"]
+    return item.config.getoption("--max-queries")
+
+
+# Run by the test cases' own transactions and their deferred constraint
+# checks, not by the code under test.
+_TEST_BOOKKEEPING = re.compile(
+    r"\s*(SAVEPOINT|RELEASE SAVEPOINT|ROLLBACK|COMMIT|BEGIN|SET CONSTRAINTS"
+    r"|PRAGMA foreign_key_check)\b",
+    re.IGNORECASE,
+)
+
+
+class QueryCounter:
+    """
+    Counts the SQL queries run on every database connection of this thread,
+    leaving out the test cases' own bookkeeping. Unlike assertNumQueries, it does not
+    keep the executed queries around, only how many times each statement ran.
+    """
+
+    def __init__(self):
+        self.statements: Counter = Counter()
+        self._stack = ExitStack()
+
+    @property
+    def count(self) -> int:
+        return sum(self.statements.values())
+
+    def __enter__(self) -> "QueryCounter":
+        from django.db import connections
+
+        for connection in connections.all():
+            self._stack.enter_context(connection.execute_wrapper(self))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._stack.close()
+
+    def __call__(self, execute, sql, params, many, context):
+        if not _TEST_BOOKKEEPING.match(sql):
+            self.statements[sql] += 1
+        return execute(sql, params, many, context)
+
+    def report(self, budget: int, most_common: int = 5) -> str:
+        lines = [f"ran {self.count} SQL queries, over its budget of {budget}."]
+        repeated = [
+            (count, sql)
+            for sql, count in self.statements.most_common(most_common)
+            if count > 1
+        ]
+        if repeated:
+            lines.append("Most repeated, a sign of N+1 queries:")
+            lines.extend(f"  {count} x {sql}" for count, sql in repeated)
+        return "\n".join(lines)
+
+
+@dataclass
+class ProfileSession:
+    """
+    cProfile stats of each test's call phase, written to ``directory`` when
+    set and summed up when ``aggregate`` is. Only the thread running the test
+    is profiled: the event loop of async tests runs in another one.
+    """
+
+    directory: Optional[str] = None
+    aggregate: bool = False
+    stats: Optional[pstats.Stats] = None
+
+    @contextmanager
+    def profile(self, nodeid: str) -> Iterator[cProfile.Profile]:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield profiler
+        finally:
+            profiler.disable()
+            self.record(nodeid, profiler)
+
+    def record(self, nodeid: str, profiler: cProfile.Profile) -> None:
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+            profiler.dump_stats(os.path.join(self.directory, stats_filename(nodeid)))
+        if self.aggregate:
+            if self.stats is None:
+                self.stats = pstats.Stats(profiler)
+            else:
+                self.stats.add(profiler)
+
+    def hotspots(
+        self, top: int, rootdir: str = ""
+    ) -> List[Tuple[float, float, int, str]]:
+        """Own seconds, cumulative seconds, calls and location, by own time."""
+        if self.stats is None:
+            return []
+        rows = [
+            (own, cumulative, calls, _location(function, rootdir))
+            for function, (_, calls, own, cumulative, _) in self.stats.stats.items()
+        ]
+        rows.sort(key=lambda row: row[0], reverse=True)
+        return rows[:top]
+
+
+def stats_filename(nodeid: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", nodeid).strip("_") + ".pstats"
+
+
+def _location(function: Tuple[str, int, str], rootdir: str) -> str:
+    filename, line, name = function
+    if filename == "~":
+        # Built-ins, whose name is already the whole description.
+        return name
+    if rootdir and filename.startswith(rootdir + os.sep):
+        filename = os.path.relpath(filename, rootdir)
+    elif "site-packages" + os.sep in filename:
+        filename = filename.split("site-packages" + os.sep, 1)[1]
+    return f"{filename}:{line}({name})"
+
+
+profile_session_key = pytest.StashKey[ProfileSession]()
 
 
 def enable_migration(django_db_use_migrations) -> bool:
@@ -48,6 +330,26 @@ MigrationCommandBackup = None
 
 
 def pytest_configure(config: Config):
+    config.addinivalue_line(
+        "markers", "benchmark: benchmark suite case, runs only with --benchmark"
+    )
+    config.addinivalue_line(
+        "markers",
+        "query_budget(queries): fail the test if it runs more SQL queries, "
+        "overriding --max-queries",
+    )
+    profile = config.getoption("--profile")
+    top = config.getoption("--slowest-report")
+    if profile or top:
+        config.stash[profile_session_key] = ProfileSession(
+            directory=(
+                str(config.rootpath / config.getoption("--profile-dir"))
+                if profile
+                else None
+            ),
+            aggregate=bool(top),
+        )
+
     from django.core.management.commands import migrate
 
     global MigrationCommandBackup
@@ -21,10 +21,13 @@ Item = TypeVar("Item")
 @dataclass(frozen=True, slots=True)
 class PaginationOutput(Generic[Item]):
     items: List[Item]
-    total: int
+    total: Optional[int]
     current_page: int
     per_page: int
-    last_page: int
+    last_page: Optional[int]
+    has_next: Optional[bool] = None
+    estimated_total: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 Output = TypeVar("Output")
@@ -41,10 +44,22 @@ class PaginationOutputMapper:
     def to_output(
         self, items: List[Item], result: SearchResult
     ) -> PaginationOutput[Item]:
+        if result.total is not None:
+            return self.output_child(
+                items=items,
+                total=result.total,
+                current_page=result.current_page,
+                per_page=result.per_page,
+                last_page=result.last_page,
+                next_cursor=result.next_cursor,
+            )
         return self.output_child(
             items=items,
-            total=result.total,
+            total=None,
             current_page=result.current_page,
             per_page=result.per_page,
-            last_page=result.last_page,
+            last_page=None,
+            has_next=result.has_next,
+            estimated_total=result.estimated_total,
+            next_cursor=result.next_cursor,
         )
@@ -1,12 +1,29 @@
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 
+from histafrica.shared.timing import instrument
+
 Input = TypeVar("Input")
 Output = TypeVar("Output")
 
 
 class UseCase(Generic[Input, Output], ABC):
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        instrument(cls, "use_case", ["execute"])
+
     @abstractmethod
     def execute(self, input_dto: Input) -> Output:
         raise NotImplementedError()
+
+
+class AsyncUseCase(Generic[Input, Output], ABC):
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        instrument(cls, "use_case", ["execute"])
+
+    @abstractmethod
+    async def execute(self, input_dto: Input) -> Output:
+        raise NotImplementedError()
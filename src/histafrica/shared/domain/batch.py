@@ -0,0 +1,197 @@
+import operator
+from array import array
+from dataclasses import fields
+from functools import cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from histafrica.shared.domain.entity import ET, _is_atomic, _plain
+
+_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+}
+
+# array typecodes for columns whose values all have one of these exact types.
+# Not bool: an array would give the values back as ints.
+_TYPECODES = {int: "q", float: "d"}
+
+
+def _numpy():
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    return numpy
+
+
+def _column(values: List[Any]) -> Sequence:
+    kinds = set(map(type, values))
+    if len(kinds) == 1:
+        typecode = _TYPECODES.get(kinds.pop())
+        if typecode is not None:
+            try:
+                return array(typecode, values)
+            except OverflowError:
+                pass
+    return values
+
+
+@cache
+def _row_builder(names: Tuple[str, ...]) -> Callable[..., Dict[str, Any]]:
+    # A dict literal over positional arguments, for map() over the columns.
+    arguments = [f"_{index}" for index in range(len(names))]
+    items = ", ".join(f"{name!r}: {arg}" for name, arg in zip(names, arguments))
+    namespace: Dict[str, Any] = {}
+    exec(  # pylint: disable=exec-used
+        f"def build({', '.join(arguments)}):\n    return {{{items}}}", namespace
+    )
+    return namespace["build"]
+
+
+class EntityBatch(Generic[ET]):
+    """
+    Entities of one class stored column by column: one sequence per field plus
+    the ids. Fields holding only ints or only floats are packed in arrays,
+    which NumPy, when installed, compares and sorts without a Python loop.
+    Operations return new batches and never copy the entities back out until
+    asked to.
+    """
+
+    def __init__(
+        self,
+        entity_cls: Optional[Type[ET]],
+        ids: List[str],
+        columns: Dict[str, Sequence],
+    ):
+        self.entity_cls = entity_cls
+        self.ids = ids
+        self.columns = columns
+
+    @classmethod
+    def from_entities(
+        cls,
+        entities: Iterable[ET],
+        field_names: Optional[Iterable[str]] = None,
+        entity_cls: Optional[Type[ET]] = None,
+    ) -> "EntityBatch[ET]":
+        """
+        Batch of ``entities``, keeping only ``field_names`` if given. The class
+        is taken from the first entity unless ``entity_cls`` is passed.
+        """
+        entities = list(entities)
+        if entity_cls is None:
+            entity_cls = type(entities[0]) if entities else None
+        if field_names is None:
+            field_names = [
+                entity_field.name
+                for entity_field in (fields(entity_cls) if entity_cls else ())
+                if entity_field.name != "unique_entity_id"
+            ]
+        return cls(
+            entity_cls,
+            [entity.id for entity in entities],
+            {
+                name: _column([getattr(entity, name) for entity in entities])
+                for name in field_names
+            },
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def compare(self, field_name: str, op: str, value: Any) -> Sequence[bool]:
+        """Mask of the rows where ``column <op> value`` holds."""
+        column = self.columns[field_name]
+        numpy = _numpy()
+        if numpy is not None and isinstance(column, array):
+            return _OPERATORS[op](numpy.frombuffer(column, column.typecode), value)
+        compare = _OPERATORS[op]
+        return [
+            value is not None and v is not None and compare(v, value) for v in column
+        ]
+
+    def contains(self, field_name: str, text: str) -> List[bool]:
+        """Mask of the rows whose text contains ``text``, ignoring case."""
+        text = text.lower()
+        return [v is not None and text in v.lower() for v in self.columns[field_name]]
+
+    def filter(self, mask: Sequence[bool]) -> "EntityBatch[ET]":
+        numpy = _numpy()
+        if numpy is not None and not isinstance(mask, list):
+            indices = numpy.flatnonzero(mask).tolist()
+        else:
+            indices = [index for index, keep in enumerate(mask) if keep]
+        return self.take(indices)
+
+    def argsort(self, field_name: str, reverse: bool = False) -> List[int]:
+        """
+        Row order by the field, then by id; None sorts after everything else.
+        This is the order of InMemorySearchableRepository's sort indexes.
+        """
+        ids = self.ids
+        column = self.columns[field_name]
+        numpy = _numpy()
+        if numpy is not None and isinstance(column, array):
+            # A stable sort on the value keeps the id order between ties.
+            by_id = sorted(range(len(ids)), key=ids.__getitem__)
+            values = numpy.frombuffer(column, column.typecode)[by_id]
+            order = numpy.asarray(by_id)[numpy.argsort(values, kind="stable")]
+            order = order.tolist()
+        else:
+            order = sorted(
+                range(len(ids)),
+                key=lambda index: (column[index] is None, column[index], ids[index]),
+            )
+        if reverse:
+            order.reverse()
+        return order
+
+    def sort(self, field_name: str, reverse: bool = False) -> "EntityBatch[ET]":
+        return self.take(self.argsort(field_name, reverse))
+
+    def take(self, indices: Sequence[int]) -> "EntityBatch[ET]":
+        return EntityBatch(
+            self.entity_cls,
+            [self.ids[index] for index in indices],
+            {
+                name: _column([column[index] for index in indices])
+                for name, column in self.columns.items()
+            },
+        )
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Rows in the shape of Entity.to_dict."""
+        if not self.ids:
+            return []
+        types = {
+            entity_field.name: entity_field.type
+            for entity_field in fields(self.entity_cls)
+        }
+        columns = [
+            column if _is_atomic(types[name]) else [_plain(v) for v in column]
+            for name, column in self.columns.items()
+        ]
+        return list(map(_row_builder((*self.columns, "id")), *columns, self.ids))
+
+    def to_entities(self) -> List[ET]:
+        """Entities rebuilt from the columns; fields left out take defaults."""
+        if not self.ids:
+            return []
+        return self.entity_cls.hydrate_many(
+            zip(self.ids, *self.columns.values()), columns=["id", *self.columns]
+        )
@@ -1,9 +1,147 @@
+import copy
+import datetime
+import decimal
+import uuid
 from abc import ABC
-from dataclasses import Field, asdict, dataclass, field
-from typing import Any
+from dataclasses import MISSING, Field, dataclass, field, fields, is_dataclass
+from functools import cache
+from types import MemberDescriptorType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from histafrica.shared.domain.value_objects import UniqueEntityId
 
+# Immutable types asdict() would return as they are, so they are read directly.
+_ATOMIC_TYPES = (
+    str,
+    int,
+    float,
+    bool,
+    type(None),
+    datetime.datetime,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    decimal.Decimal,
+    uuid.UUID,
+)
+
+
+def _plain(value: Any) -> Any:
+    """Same conversion asdict() applies to a field value."""
+    if isinstance(value, _ATOMIC_TYPES):
+        return value
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: _plain(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return type(value)(*[_plain(item) for item in value])
+    if isinstance(value, (list, tuple)):
+        return type(value)(_plain(item) for item in value)
+    if isinstance(value, dict):
+        return type(value)((_plain(k), _plain(v)) for k, v in value.items())
+    return copy.deepcopy(value)
+
+
+def _is_atomic(annotation: Any) -> bool:
+    if get_origin(annotation) is Union:
+        return all(_is_atomic(arg) for arg in get_args(annotation))
+    return isinstance(annotation, type) and issubclass(annotation, _ATOMIC_TYPES)
+
+
+@cache
+def _compile_to_dict(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    # Fields annotated with immutable types are read as they are; anything
+    # else goes through _plain, so the output matches asdict().
+    items = []
+    for entity_field in fields(cls):
+        if entity_field.name == "unique_entity_id":
+            continue
+        access = f"self.{entity_field.name}"
+        if not _is_atomic(entity_field.type):
+            access = f"_plain({access})"
+        items.append(f"{entity_field.name!r}: {access}")
+    items.append("'id': self.unique_entity_id.id")
+
+    namespace = {"_plain": _plain}
+    exec(  # pylint: disable=exec-used
+        f"def to_dict(self):\n    return {{{', '.join(items)}}}", namespace
+    )
+    return namespace["to_dict"]
+
+
+def _setter(cls: type, name: str) -> Callable[[Any, Any], None]:
+    # The slot descriptor itself when there is one, which skips both the
+    # attribute lookup and the frozen __setattr__.
+    descriptor = getattr(cls, name, None)
+    if isinstance(descriptor, MemberDescriptorType):
+        return descriptor.__set__
+    return lambda instance, value: object.__setattr__(instance, name, value)
+
+
+def _default_columns(cls: type) -> Tuple[str, ...]:
+    return tuple(
+        "id" if entity_field.name == "unique_entity_id" else entity_field.name
+        for entity_field in fields(cls)
+    )
+
+
+@cache
+def _compile_hydrator(
+    cls: type, columns: Optional[Tuple[str, ...]]
+) -> Callable[[Sequence], Any]:
+    # Sets every field straight on a bare instance: no __init__, no
+    # __post_init__ and no id parsing. Fields missing from the columns take
+    # their default, like __init__ would give them.
+    columns = _default_columns(cls) if columns is None else columns
+    positions = {column: index for index, column in enumerate(columns)}
+    namespace = {
+        "_cls": cls,
+        "_new": object.__new__,
+        "_UniqueEntityId": UniqueEntityId,
+        "_set_id": _setter(UniqueEntityId, "id"),
+    }
+    lines = ["def hydrate(row):", "    self = _new(_cls)"]
+    for entity_field in fields(cls):
+        name = entity_field.name
+        namespace[f"_set_{name}"] = _setter(cls, name)
+        if name == "unique_entity_id":
+            if "id" not in positions:
+                raise ValueError(f"Missing column 'id' to build {cls.__name__}")
+            lines += [
+                "    entity_id = _new(_UniqueEntityId)",
+                f"    _set_id(entity_id, str(row[{positions['id']}]))",
+                "    _set_unique_entity_id(self, entity_id)",
+            ]
+        elif name in positions:
+            lines.append(f"    _set_{name}(self, row[{positions[name]}])")
+        elif entity_field.default is not MISSING:
+            namespace[f"_default_{name}"] = entity_field.default
+            lines.append(f"    _set_{name}(self, _default_{name})")
+        elif entity_field.default_factory is not MISSING:
+            namespace[f"_factory_{name}"] = entity_field.default_factory
+            lines.append(f"    _set_{name}(self, _factory_{name}())")
+        else:
+            raise ValueError(f"Missing column '{name}' to build {cls.__name__}")
+    lines.append("    return self")
+
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+    return namespace["hydrate"]
+
+
+ET = TypeVar("ET", bound="Entity")
+
 
 @dataclass(frozen=True, slots=True)
 class Entity(ABC):
@@ -12,18 +150,54 @@ class Entity(ABC):
     )
 
     @property
-    def id(self):
-        return str(self.unique_entity_id)
+    def id(self) -> str:
+        return self.unique_entity_id.id
 
     def _set(self, name: str, value: Any):
         object.__setattr__(self, name, value)
         return self
 
     def to_dict(self):
-        entity_dict = asdict(self)
-        entity_dict.pop("unique_entity_id")
-        entity_dict["id"] = self.id
-        return entity_dict
+        # Compiled once per class on first use: by the time __init_subclass__
+        # runs, @dataclass has not collected the fields yet.
+        return _compile_to_dict(type(self))(self)
+
+    @staticmethod
+    def to_dicts(entities: Iterable["Entity"]) -> List[Dict[str, Any]]:
+        dicts = []
+        cls = to_dict = None
+        for entity in entities:
+            if type(entity) is not cls:
+                cls = type(entity)
+                to_dict = _compile_to_dict(cls)
+            dicts.append(to_dict(entity))
+        return dicts
+
+    @classmethod
+    def from_row(
+        cls: type[ET],
+        row: Sequence | Dict[str, Any],
+        columns: Optional[Sequence[str]] = None,
+    ) -> ET:
+        """
+        Build an entity from a row already validated by the storage, skipping
+        __post_init__ and validation. A tuple row follows ``columns``, which
+        defaults to the field order with ``id`` in place of the id object; a
+        dict row is keyed the same way.
+        """
+        if isinstance(row, dict):
+            return _compile_hydrator(cls, tuple(row))(tuple(row.values()))
+        return _compile_hydrator(cls, None if columns is None else tuple(columns))(row)
+
+    @classmethod
+    def hydrate_many(
+        cls: type[ET],
+        rows: Iterable[Sequence],
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[ET]:
+        """from_row for every tuple row, resolving the column layout once."""
+        hydrate = _compile_hydrator(cls, None if columns is None else tuple(columns))
+        return [hydrate(row) for row in rows]
 
     @classmethod
     def get_field(cls, entity_fied: str) -> Field:
@@ -9,6 +9,16 @@ class InvalidUuidException(Exception):
         super().__init__(error)
 
 
+class InvalidCursorException(Exception):
+    def __init__(self, error="Cursor is invalid or does not match the sort") -> None:
+        super().__init__(error)
+
+
+class InvalidSortException(Exception):
+    def __init__(self, error="Sort field is not sortable") -> None:
+        super().__init__(error)
+
+
 class ValidationException(Exception):
     pass
 
@@ -31,3 +41,7 @@ class LoadEntityException(Exception):
 
 class NotFoundException(Exception):
     pass
+
+
+class DuplicateEntityException(Exception):
+    pass
@@ -1,26 +1,120 @@
+import base64
+import datetime
+import json
 import math
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Any, Generic, List, Optional, TypeVar
-
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+from urllib.parse import parse_qsl
+
+from histafrica.shared.domain.batch import EntityBatch
 from histafrica.shared.domain.entity import Entity
-from histafrica.shared.domain.exceptions import NotFoundException
+from histafrica.shared.domain.exceptions import (
+    DuplicateEntityException,
+    InvalidCursorException,
+    InvalidSortException,
+    InvalidUuidException,
+    NotFoundException,
+)
+from histafrica.shared.domain.text_search import NGramIndex
 from histafrica.shared.domain.value_objects import UniqueEntityId
+from histafrica.shared.timing import instrument
 
 ET = TypeVar("ET", bound=Entity)
 Filter = TypeVar("Filter", str, Any)
 Input = TypeVar("Input")
 Output = TypeVar("OutPut")
+CursorValueType = type | Tuple[type, ...]
+
+BULK_REINDEX_THRESHOLD = 32
+
+# "exact" counts every match, "estimate" asks the backend for a cheap guess and
+# "none" skips counting; the last two only report whether a next page exists.
+# Cursor pages are never counted exactly.
+COUNT_MODES = ("exact", "estimate", "none")
+
+# Query string keys read by SearchParams.from_query, and the largest page a
+# request may ask for.
+QUERY_PARAMS = (
+    "page",
+    "per_page",
+    "sort",
+    "sort_dir",
+    "filter",
+    "cursor",
+    "count_mode",
+)
+MAX_PER_PAGE = 100
+
+# Repository methods timed under the "repository" phase; iter_all is left out,
+# its work happens while the caller iterates.
+TIMED_METHODS = (
+    "insert",
+    "bulk_insert",
+    "find_by_id",
+    "find_all",
+    "update",
+    "bulk_update",
+    "delete",
+    "bulk_delete",
+    "search",
+    "entity_version",
+    "collection_version",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class BulkResult:
+    """IDs written by a bulk operation and the error of each rejected item,
+    keyed by its position in the batch."""
+
+    succeeded: List[str] = field(default_factory=list)
+    errors: Dict[int, Exception] = field(default_factory=dict)
+
+    def __post_init__(self):
+        object.__setattr__(self, "errors", dict(sorted(self.errors.items())))
+
+    @property
+    def has_errors(self) -> bool:
+        return bool(self.errors)
 
 
 class RepositoryInterface(Generic[ET], ABC):
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        instrument(cls, "repository", TIMED_METHODS)
+
     @abstractmethod
     def insert(self, entity: ET) -> None:
         raise NotImplementedError()
 
-    def bulk_insert(self, entities: List[ET]) -> None:
-        raise NotImplementedError()
+    def bulk_insert(self, entities: List[ET]) -> BulkResult:
+        return self._bulk_apply(self.insert, entities)
+
+    def bulk_update(self, entities: List[ET]) -> BulkResult:
+        return self._bulk_apply(self.update, entities)
+
+    def bulk_delete(self, entity_ids: List[str | UniqueEntityId]) -> BulkResult:
+        return self._bulk_apply(self.delete, entity_ids)
 
     @abstractmethod
     def find_by_id(self, entity_id: str | UniqueEntityId) -> ET:
@@ -30,6 +124,14 @@ class RepositoryInterface(Generic[ET], ABC):
     def find_all(self) -> List[ET]:
         raise NotImplementedError()
 
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[ET]:
+        """
+        Yield every entity, loading at most ``chunk_size`` of them at a time
+        where the backend supports it. Prefer it to find_all for exports and
+        backfills.
+        """
+        yield from self.find_all()
+
     @abstractmethod
     def update(self, entity: ET) -> None:
         raise NotImplementedError()
@@ -38,16 +140,96 @@ class RepositoryInterface(Generic[ET], ABC):
     def delete(self, entity_id: str | UniqueEntityId) -> None:
         raise NotImplementedError()
 
+    def _bulk_apply(self, write: Callable[[Any], None], batch: List[Any]) -> BulkResult:
+        errors = self._find_duplicates(batch)
+        succeeded = []
+        for index, item in enumerate(batch):
+            if index in errors:
+                continue
+            try:
+                write(item)
+            except (DuplicateEntityException, NotFoundException) as ex:
+                errors[index] = ex
+            else:
+                succeeded.append(self._entity_id(item))
+        return BulkResult(succeeded=succeeded, errors=errors)
+
+    @staticmethod
+    def _entity_id(value: ET | str | UniqueEntityId) -> str:
+        return value.id if isinstance(value, Entity) else str(value)
+
+    @classmethod
+    def _find_duplicates(cls, batch: List[Any]) -> Dict[int, Exception]:
+        seen = set()
+        duplicates = {}
+        for index, item in enumerate(batch):
+            entity_id = cls._entity_id(item)
+            if entity_id in seen:
+                duplicates[index] = DuplicateEntityException(
+                    f"Entity ID '{entity_id}' is repeated in the batch"
+                )
+            seen.add(entity_id)
+        return duplicates
+
+
+class VersionedRepositoryInterface(ABC):
+    """
+    Repositories numbering their writes. Every write takes the next repository
+    version and stamps it on the entities it inserts or updates, so a version
+    is never reused, not even by an entity deleted and inserted again. Both
+    versions are read without loading entities, which lets the HTTP layer
+    answer conditional requests cheaply.
+    """
+
+    @abstractmethod
+    def entity_version(self, entity_id: str | UniqueEntityId) -> Optional[int]:
+        """Version of the last write to the entity; None if it does not exist."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def collection_version(self) -> int:
+        """Version of the last write to the repository, 0 before any."""
+        raise NotImplementedError()
+
 
 @dataclass(slots=True)
-class InMemoryRepository(RepositoryInterface[ET], ABC):
-    items: List[ET] = field(default_factory=lambda: [])
+class InMemoryRepository(RepositoryInterface[ET], VersionedRepositoryInterface, ABC):
+    _entities: Dict[str, ET] = field(default_factory=dict, init=False, repr=False)
+    _versions: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _version: int = field(default=0, init=False, repr=False)
 
-    def insert(self, entity: ET) -> None:
-        self.items.append(entity)
+    @property
+    def items(self) -> List[ET]:
+        return list(self._entities.values())
 
-    def bulk_insert(self, entities: List[ET]) -> None:
-        pass
+    def as_batch(self, field_names: Optional[List[str]] = None) -> EntityBatch[ET]:
+        """Columnar export of every entity, or of ``field_names`` only."""
+        return EntityBatch.from_entities(self._entities.values(), field_names)
+
+    def insert(self, entity: ET) -> None:
+        if entity.id in self._entities:
+            raise DuplicateEntityException(
+                f"Entity already exists using ID '{entity.id}'"
+            )
+        self._entities[entity.id] = entity
+        self._written(removed=[], added=[entity])
+
+    def bulk_insert(self, entities: List[ET]) -> BulkResult:
+        errors = self._find_duplicates(entities)
+        added = []
+        for index, entity in enumerate(entities):
+            if index in errors:
+                continue
+            if entity.id in self._entities:
+                errors[index] = DuplicateEntityException(
+                    f"Entity already exists using ID '{entity.id}'"
+                )
+                continue
+            added.append(entity)
+
+        self._entities.update((entity.id, entity) for entity in added)
+        self._written(removed=[], added=added)
+        return BulkResult(succeeded=[entity.id for entity in added], errors=errors)
 
     def find_by_id(self, entity_id: str | UniqueEntityId) -> ET:
         return self._get(str(entity_id))
@@ -55,22 +237,80 @@ class InMemoryRepository(RepositoryInterface[ET], ABC):
     def find_all(self) -> List[ET]:
         return self.items
 
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[ET]:
+        # The entities already live in memory; iterating over a snapshot of the
+        # references lets the consumer write to the repository meanwhile.
+        yield from self.items
+
     def update(self, entity: ET) -> None:
         entity_found = self._get(entity.id)
-        index = self.items.index(entity_found)
-        self.items[index] = entity
+        self._entities[entity.id] = entity
+        self._written(removed=[entity_found], added=[entity])
 
-    def delete(self, entity: ET) -> None:
-        entity_found = self._get(entity.id)
-        self.items.remove(entity_found)
+    def bulk_update(self, entities: List[ET]) -> BulkResult:
+        errors = self._find_duplicates(entities)
+        removed, added = self._collect_existing(entities, errors)
+
+        self._entities.update((entity.id, entity) for entity in added)
+        self._written(removed=removed, added=added)
+        return BulkResult(succeeded=[entity.id for entity in added], errors=errors)
+
+    def delete(self, entity_id: str | UniqueEntityId | ET) -> None:
+        entity_found = self._get(self._entity_id(entity_id))
+        del self._entities[entity_found.id]
+        self._written(removed=[entity_found], added=[])
+
+    def bulk_delete(self, entity_ids: List[str | UniqueEntityId | ET]) -> BulkResult:
+        errors = self._find_duplicates(entity_ids)
+        removed, _ = self._collect_existing(entity_ids, errors)
+
+        for entity in removed:
+            del self._entities[entity.id]
+        self._written(removed=removed, added=[])
+        return BulkResult(succeeded=[entity.id for entity in removed], errors=errors)
 
     def _get(self, entity_id: str) -> ET:
-        entity = next(filter(lambda i: i.id == entity_id, self.items), None)
+        entity = self._entities.get(entity_id)
 
-        if not entity:
+        if entity is None:
             raise NotFoundException(f"Entity not found using ID '{entity_id}'")
         return entity
 
+    def _collect_existing(
+        self, batch: List[Any], errors: Dict[int, Exception]
+    ) -> Tuple[List[ET], List[Any]]:
+        """Split the batch into stored entities and the items that matched them,
+        recording a NotFoundException for every unknown ID."""
+        found, matched = [], []
+        for index, item in enumerate(batch):
+            if index in errors:
+                continue
+            try:
+                found.append(self._get(self._entity_id(item)))
+            except NotFoundException as ex:
+                errors[index] = ex
+                continue
+            matched.append(item)
+        return found, matched
+
+    def entity_version(self, entity_id: str | UniqueEntityId) -> Optional[int]:
+        return self._versions.get(str(entity_id))
+
+    def collection_version(self) -> int:
+        return self._version
+
+    def _written(self, removed: List[ET], added: List[ET]) -> None:
+        if removed or added:
+            self._version += 1
+            for entity in removed:
+                self._versions.pop(entity.id, None)
+            for entity in added:
+                self._versions[entity.id] = self._version
+        self._reindex(removed, added)
+
+    def _reindex(self, removed: List[ET], added: List[ET]) -> None:
+        """Hook called after every write so subclasses can keep indexes in sync."""
+
 
 class SearchableRepositoryInterface(
     Generic[ET, Input, Output], RepositoryInterface[ET], ABC
@@ -82,6 +322,79 @@ class SearchableRepositoryInterface(
         raise NotImplementedError()
 
 
+class AsyncRepositoryInterface(Generic[ET], ABC):
+    """
+    Coroutine counterpart of RepositoryInterface for the ASGI entry point, with
+    the same methods, defaults and errors.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        instrument(cls, "repository", TIMED_METHODS)
+
+    @abstractmethod
+    async def insert(self, entity: ET) -> None:
+        raise NotImplementedError()
+
+    async def bulk_insert(self, entities: List[ET]) -> BulkResult:
+        return await self._bulk_apply(self.insert, entities)
+
+    async def bulk_update(self, entities: List[ET]) -> BulkResult:
+        return await self._bulk_apply(self.update, entities)
+
+    async def bulk_delete(self, entity_ids: List[str | UniqueEntityId]) -> BulkResult:
+        return await self._bulk_apply(self.delete, entity_ids)
+
+    @abstractmethod
+    async def find_by_id(self, entity_id: str | UniqueEntityId) -> ET:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def find_all(self) -> List[ET]:
+        raise NotImplementedError()
+
+    async def iter_all(self, chunk_size: int = 1000) -> AsyncIterator[ET]:
+        for entity in await self.find_all():
+            yield entity
+
+    @abstractmethod
+    async def update(self, entity: ET) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def delete(self, entity_id: str | UniqueEntityId) -> None:
+        raise NotImplementedError()
+
+    _entity_id = staticmethod(RepositoryInterface._entity_id)
+    _find_duplicates = classmethod(RepositoryInterface._find_duplicates.__func__)
+
+    async def _bulk_apply(
+        self, write: Callable[[Any], Awaitable[None]], batch: List[Any]
+    ) -> BulkResult:
+        errors = self._find_duplicates(batch)
+        succeeded = []
+        for index, item in enumerate(batch):
+            if index in errors:
+                continue
+            try:
+                await write(item)
+            except (DuplicateEntityException, NotFoundException) as ex:
+                errors[index] = ex
+            else:
+                succeeded.append(self._entity_id(item))
+        return BulkResult(succeeded=succeeded, errors=errors)
+
+
+class AsyncSearchableRepositoryInterface(
+    Generic[ET, Input, Output], AsyncRepositoryInterface[ET], ABC
+):
+    sortable_fields: List[str] = []
+
+    @abstractmethod
+    async def search(self, input_params: Input) -> Output:
+        raise NotImplementedError()
+
+
 @dataclass(slots=True, kw_only=True)
 class SearchParams(Generic[Filter]):
     page: Optional[int] = 1
@@ -89,6 +402,8 @@ class SearchParams(Generic[Filter]):
     sort: Optional[str] = None
     sort_dir: Optional[str] = None
     filter: Optional[Filter] = None
+    cursor: Optional[str] = None
+    count_mode: Optional[str] = "exact"
 
     def __post_init__(self):
         self._normalize_page()
@@ -96,6 +411,43 @@ class SearchParams(Generic[Filter]):
         self._normalize_sort()
         self._normalize_sort_dir()
         self._normalize_filter()
+        self._normalize_cursor()
+        self._normalize_count_mode()
+
+    def cache_key(self) -> Tuple:
+        """Hashable form of the normalized params: equivalent queries share it."""
+        return tuple(getattr(self, field.name) for field in fields(self))
+
+    @classmethod
+    def from_query(
+        cls,
+        query: str | Mapping[str, Any],
+        sortable_fields: Iterable[str],
+        max_per_page: int = MAX_PER_PAGE,
+        strict: bool = False,
+    ) -> "SearchParams":
+        """
+        Params from a raw query string or a query dict such as a QueryDict;
+        the last value wins for repeated keys. A sort outside
+        ``sortable_fields`` is dropped, or raises InvalidSortException when
+        ``strict``, and per_page is capped at ``max_per_page``. Parsing is
+        memoized on the raw values, but each call returns a new instance.
+        """
+        if isinstance(query, str):
+            values = _query_string_values(query)
+        else:
+            values = tuple(_last(query.get(name)) for name in QUERY_PARAMS)
+        arguments = (cls, values, tuple(sortable_fields), max_per_page, strict)
+        try:
+            key = _normalize_query(*arguments)
+        except TypeError:
+            # Unhashable values cannot be memoized.
+            key = _normalize_query.__wrapped__(*arguments)
+
+        params = object.__new__(cls)
+        for name, value in zip(cls.__dataclass_fields__, key):
+            setattr(params, name, value)
+        return params
 
     def _normalize_page(self):
         page = self._convert_to_int(self.page)
@@ -124,6 +476,20 @@ class SearchParams(Generic[Filter]):
             None if self.filter == "" or self.filter is None else str(self.filter)
         )
 
+    def _normalize_cursor(self):
+        self.cursor = (
+            None if self.cursor == "" or self.cursor is None else str(self.cursor)
+        )
+
+    def _normalize_count_mode(self):
+        count_mode = None if self.count_mode is None else str(self.count_mode).lower()
+        self.count_mode = count_mode if count_mode in COUNT_MODES else "exact"
+        # A keyset page is not at a page number, so an exact total and last
+        # page mean nothing there; counting would also cost a deep page the
+        # full scan the cursor avoids.
+        if self.cursor is not None and self.count_mode == "exact":
+            self.count_mode = "none"
+
     def _convert_to_int(self, value: Any, default=0) -> int:
         try:
             return int(value)
@@ -134,19 +500,63 @@ class SearchParams(Generic[Filter]):
         return SearchParams.__dataclass_fields__[field_name]
 
 
+def _last(value: Any) -> Any:
+    return value[-1] if isinstance(value, list) and value else value
+
+
+@lru_cache(maxsize=1024)
+def _query_string_values(query: str) -> Tuple:
+    values = dict(parse_qsl(query.lstrip("?"), keep_blank_values=True))
+    return tuple(values.get(name) for name in QUERY_PARAMS)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_query(
+    cls: type,
+    values: Tuple,
+    sortable_fields: Tuple[str, ...],
+    max_per_page: int,
+    strict: bool,
+) -> Tuple:
+    params = cls(**dict(zip(QUERY_PARAMS, values)))
+    if params.sort is not None and params.sort not in sortable_fields:
+        if strict:
+            raise InvalidSortException(
+                f"Cannot sort by '{params.sort}', "
+                f"sortable fields: {', '.join(sortable_fields)}"
+            )
+        params.sort = params.sort_dir = None
+    params.per_page = min(params.per_page, max_per_page)
+    return params.cache_key()
+
+
 @dataclass(slots=True, kw_only=True, frozen=True)
 class SearchResult(Generic[ET, Filter]):
+    """
+    A page of results. With an exact count, ``total`` and ``last_page`` are
+    set; otherwise both are None and ``has_next`` tells whether another page
+    follows, optionally alongside an ``estimated_total``.
+    """
+
     items: List[ET]
-    total: int
+    total: Optional[int]
     current_page: int
     per_page: int
-    last_page: int = field(init=False)
+    last_page: Optional[int] = field(init=False)
     sort: Optional[str] = None
     sort_dir: Optional[str] = None
     filter: Optional[Filter] = None
+    next_cursor: Optional[str] = None
+    has_next: Optional[bool] = None
+    estimated_total: Optional[int] = None
 
     def __post_init__(self):
+        if self.total is None:
+            object.__setattr__(self, "last_page", None)
+            return
         object.__setattr__(self, "last_page", math.ceil(self.total / self.per_page))
+        if self.has_next is None:
+            object.__setattr__(self, "has_next", self.current_page < self.last_page)
 
     def to_dict(self):
         return {
@@ -158,4 +568,202 @@ class SearchResult(Generic[ET, Filter]):
             "sort": self.sort,
             "sort_dir": self.sort_dir,
             "filter": self.filter,
+            "next_cursor": self.next_cursor,
+            "has_next": self.has_next,
+            "estimated_total": self.estimated_total,
         }
+
+
+@dataclass(frozen=True, slots=True)
+class SearchCursor:
+    """
+    Position after the last item of a page for keyset pagination: the value of
+    the sort field and the id used to break ties. It is handed to clients as an
+    opaque url-safe string.
+    """
+
+    sort: str
+    sort_dir: str
+    value: Any
+    id: str  # pylint: disable=invalid-name
+
+    def encode(self) -> str:
+        payload = json.dumps(
+            [self.sort, self.sort_dir, self.value, self.id],
+            default=_encode_cursor_value,
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode(
+        cursor: str, value_types: Optional[Mapping[str, CursorValueType]] = None
+    ) -> "SearchCursor":
+        """
+        Cursors come from clients, so anything but a well-formed one raises
+        InvalidCursorException: the id must be a UUID and, given
+        ``value_types``, the value an instance of its sort field's type.
+        """
+        try:
+            payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            sort, sort_dir, value, entity_id = json.loads(
+                payload, object_hook=_decode_cursor_value
+            )
+            if sort_dir not in ("asc", "desc") or not isinstance(entity_id, str):
+                raise ValueError("malformed cursor")
+            UniqueEntityId(entity_id)
+        except (ValueError, TypeError, InvalidUuidException) as ex:
+            raise InvalidCursorException() from ex
+        if value_types is not None:
+            expected = value_types.get(sort) if isinstance(sort, str) else None
+            # bool is an int, which stands for a float in JSON.
+            if (
+                expected is None
+                or isinstance(value, bool)
+                or not isinstance(value, expected)
+            ):
+                raise InvalidCursorException()
+        return SearchCursor(sort=sort, sort_dir=sort_dir, value=value, id=entity_id)
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return {"$datetime": value.isoformat()}
+    raise TypeError(f"{type(value).__name__} is not a supported cursor value")
+
+
+def _decode_cursor_value(value: Dict) -> Any:
+    if "$datetime" in value:
+        return datetime.datetime.fromisoformat(value["$datetime"])
+    return value
+
+
+@dataclass(slots=True)
+class InMemorySearchableRepository(
+    InMemoryRepository[ET],
+    SearchableRepositoryInterface[ET, SearchParams, SearchResult],
+    ABC,
+):
+    """
+    Keeps one sorted index of ``(value, id)`` keys per sortable field, so an
+    unfiltered page is a slice of a presorted list instead of a full sort.
+
+    Subclasses listing ``text_fields`` get those fields kept in an n-gram index
+    and filtered with the text search syntax, unsorted matches coming back best
+    ranked first; the others implement ``_apply_filter``.
+    """
+
+    text_fields: ClassVar[List[str]] = []
+
+    _sort_indexes: Dict[str, List[Tuple]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _text_index: Optional[NGramIndex] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        self._sort_indexes = {field_name: [] for field_name in self.sortable_fields}
+        if self.text_fields:
+            self._text_index = NGramIndex()
+
+    def search(self, input_params: SearchParams) -> SearchResult:
+        sort = input_params.sort if input_params.sort in self.sortable_fields else None
+        reverse = input_params.sort_dir == "desc"
+        start = (input_params.page - 1) * input_params.per_page
+        end = start + input_params.per_page
+
+        if input_params.filter is None:
+            total = len(self._entities)
+            items = self._slice_index(sort, reverse, start, end)
+        else:
+            items_filtered = self._filter(input_params.filter)
+            total = len(items_filtered)
+            items = self._apply_sort(items_filtered, sort, reverse)[start:end]
+
+        # Counting is free in memory; the other modes only shape the result
+        # the same way the database repositories do.
+        exact = input_params.count_mode == "exact"
+        return SearchResult(
+            items=items,
+            total=total if exact else None,
+            current_page=input_params.page,
+            per_page=input_params.per_page,
+            sort=input_params.sort,
+            sort_dir=input_params.sort_dir,
+            filter=input_params.filter,
+            has_next=end < total,
+            estimated_total=total if input_params.count_mode == "estimate" else None,
+        )
+
+    def _filter(self, filter_param: Filter) -> List[ET]:
+        if self._text_index is None:
+            return self._apply_filter(self.items, filter_param)
+        return [
+            self._entities[entity_id]
+            for entity_id, _ in self._text_index.search(filter_param)
+        ]
+
+    def _apply_filter(
+        self, items: List[ET], filter_param: Optional[Filter]
+    ) -> List[ET]:
+        raise NotImplementedError()
+
+    def _apply_sort(
+        self, items: List[ET], sort: Optional[str], reverse: bool
+    ) -> List[ET]:
+        if sort is None:
+            return items
+        # Same order as the sort indexes, computed over the one column.
+        order = EntityBatch.from_entities(items, [sort]).argsort(sort, reverse)
+        return [items[index] for index in order]
+
+    def _slice_index(
+        self, sort: Optional[str], reverse: bool, start: int, end: int
+    ) -> List[ET]:
+        if sort is None:
+            return list(islice(self._entities.values(), start, end))
+
+        index = self._sort_indexes[sort]
+        if reverse:
+            size = len(index)
+            keys = index[max(size - end, 0) : max(size - start, 0)][::-1]
+        else:
+            keys = index[start:end]
+        return [self._entities[entity_id] for _, entity_id in keys]
+
+    def _reindex(self, removed: List[ET], added: List[ET]) -> None:
+        if self._text_index is not None:
+            for entity in removed:
+                self._text_index.remove(entity.id)
+            for entity in added:
+                self._text_index.add(entity.id, self._text_of(entity))
+
+        if len(removed) + len(added) > BULK_REINDEX_THRESHOLD:
+            self._rebuild_indexes(removed, added)
+            return
+
+        for field_name, index in self._sort_indexes.items():
+            for entity in removed:
+                key = self._index_key(entity, field_name)
+                del index[bisect_left(index, key)]
+            for entity in added:
+                insort(index, self._index_key(entity, field_name))
+
+    def _rebuild_indexes(self, removed: List[ET], added: List[ET]) -> None:
+        # One pass per index instead of a list shift per item; sort() only has
+        # to merge the new keys into an already sorted run.
+        removed_ids = {entity.id for entity in removed}
+        for field_name, index in self._sort_indexes.items():
+            if removed_ids:
+                index[:] = [key for key in index if key[1] not in removed_ids]
+            index.extend(self._index_key(entity, field_name) for entity in added)
+            index.sort()
+
+    def _text_of(self, entity: ET) -> str:
+        values = (getattr(entity, field_name) for field_name in self.text_fields)
+        return "\n".join(str(value) for value in values if value is not None)
+
+    @staticmethod
+    def _index_key(entity: ET, field_name: str) -> Tuple:
+        value = getattr(entity, field_name)
+        # None sorts after every other value and never gets compared to them.
+        return (value is None, value), entity.id
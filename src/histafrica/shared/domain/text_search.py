@@ -0,0 +1,102 @@
+import re
+from typing import Dict, Iterable, List, Set, Tuple
+
+_WORDS = re.compile(r"[^\W_]+")
+
+
+def parse_text_query(query: str) -> List[str]:
+    """
+    Filter syntax shared by every repository: whitespace separated terms, case
+    insensitive, and each term must appear somewhere in the searched fields.
+    """
+    return list(dict.fromkeys(query.lower().split()))
+
+
+def ngrams(text: str, size: int = 3) -> Set[str]:
+    return {text[i : i + size] for i in range(len(text) - size + 1)}
+
+
+def word_trigrams(text: str) -> Set[str]:
+    # Same trigrams as PostgreSQL's pg_trgm: each word is padded with two
+    # spaces in front and one behind.
+    trigrams = set()
+    for word in _WORDS.findall(text.lower()):
+        trigrams |= ngrams(f"  {word} ")
+    return trigrams
+
+
+def similarity(first: str, second: str) -> float:
+    """Share of trigrams in common, as pg_trgm's similarity() computes it."""
+    first_trigrams, second_trigrams = word_trigrams(first), word_trigrams(second)
+    union = first_trigrams | second_trigrams
+    if not union:
+        return 0.0
+    return len(first_trigrams & second_trigrams) / len(union)
+
+
+class NGramIndex:
+    """
+    Inverted index from every n-gram of a document to the ids containing it.
+    A term is looked up by intersecting the posting sets of its own n-grams
+    and then confirmed with a substring check, so a search only touches the
+    candidate documents. Terms shorter than ``size`` are checked against the
+    candidates of the other terms, or every document when there are none.
+    """
+
+    def __init__(self, size: int = 3):
+        self.size = size
+        self._documents: Dict[str, str] = {}
+        self._postings: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, doc_id: str, text: str) -> None:
+        if doc_id in self._documents:
+            self.remove(doc_id)
+        text = text.lower()
+        self._documents[doc_id] = text
+        for gram in ngrams(text, self.size):
+            self._postings.setdefault(gram, set()).add(doc_id)
+
+    def add_many(self, documents: Iterable[Tuple[str, str]]) -> None:
+        for doc_id, text in documents:
+            self.add(doc_id, text)
+
+    def remove(self, doc_id: str) -> None:
+        text = self._documents.pop(doc_id, None)
+        if text is None:
+            return
+        for gram in ngrams(text, self.size):
+            postings = self._postings[gram]
+            postings.discard(doc_id)
+            if not postings:
+                del self._postings[gram]
+
+    def search(self, query: str) -> List[Tuple[str, float]]:
+        """Ids of the documents matching every term, best match first."""
+        terms = parse_text_query(query)
+        candidates = None
+        for term in sorted(terms, key=len, reverse=True):
+            if len(term) < self.size:
+                break
+            postings = sorted(
+                (self._postings.get(gram, set()) for gram in ngrams(term, self.size)),
+                key=len,
+            )
+            term_candidates = set(postings[0]).intersection(*postings[1:])
+            candidates = (
+                term_candidates if candidates is None else candidates & term_candidates
+            )
+            if not candidates:
+                return []
+
+        documents = self._documents
+        matches = [
+            doc_id
+            for doc_id in (documents if candidates is None else candidates)
+            if all(term in documents[doc_id] for term in terms)
+        ]
+        ranked = [(doc_id, similarity(query, documents[doc_id])) for doc_id in matches]
+        ranked.sort(key=lambda match: (-match[1], match[0]))
+        return ranked
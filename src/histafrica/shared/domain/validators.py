@@ -2,9 +2,6 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, Dict, Generic, List, TypeVar
 
-from rest_framework.fields import BooleanField, CharField
-from rest_framework.serializers import Serializer
-
 from .exceptions import ValidationException
 
 ErrorFields = Dict[str, List[str]]
@@ -51,41 +48,3 @@ class ValidatorFieldsInterface(ABC, Generic[PropsValidated]):
     @abstractmethod
     def validate(self, data: Any) -> bool:
         raise NotImplementedError()
-
-
-class DRFValidator(
-    ValidatorFieldsInterface[PropsValidated], ABC
-):  # pylint: disable=too-few-public-methods
-
-    def validate(self, data: Serializer) -> bool:
-        serializer = data
-        if serializer.is_valid():
-            self.validated_data = dict(serializer.validated_data)
-            return True
-
-        self.errors = {
-            field: [str(_error) for _error in _errors]
-            for field, _errors in serializer.errors.items()
-        }
-        return False
-
-
-class StrictCharField(CharField):
-
-    def to_internal_value(self, data):
-        if not isinstance(data, str):
-            self.fail("invalid")
-
-        return super().to_internal_value(data)
-
-
-class StrictBooleanField(BooleanField):
-
-    def to_internal_value(self, data):  # pylint: disable=inconsistent-return-statements
-        if data is True:
-            return True
-        if data is False:
-            return False
-        if data is None and self.allow_null:
-            return None
-        self.fail("invalid", input=data)
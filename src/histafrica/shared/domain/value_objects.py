@@ -1,16 +1,25 @@
 import json
+import os
+import threading
+import time
 import uuid
 from abc import ABC
 from dataclasses import dataclass, field, fields
+from functools import cache
+from typing import Tuple
 
 from histafrica.shared.domain.exceptions import InvalidUuidException
 
 
+@cache
+def _field_names(cls: type) -> Tuple[str, ...]:
+    return tuple(field.name for field in fields(cls))
+
+
 @dataclass(frozen=True, slots=True)
 class ValueObject(ABC):
     def __str__(self) -> str:
-        fields_name = [field.name for field in fields(self)]
-        print(len(fields_name))
+        fields_name = _field_names(type(self))
         return (
             str(getattr(self, fields_name[0]))
             if len(fields_name) == 1
@@ -20,6 +29,34 @@ class ValueObject(ABC):
         )
 
 
+_uuid7_lock = threading.Lock()
+_uuid7_last = 0
+
+
+def uuid7() -> str:
+    """
+    UUID version 7 (RFC 9562): a 48-bit Unix timestamp in milliseconds followed
+    by random bits. Ids generated later sort later, so primary key inserts land
+    at the end of the index instead of on random pages. Within a process, ids
+    generated in the same millisecond are kept increasing as well.
+    """
+    global _uuid7_last  # pylint: disable=global-statement
+    random = int.from_bytes(os.urandom(10), "big")
+    with _uuid7_lock:
+        # 48 bits of timestamp and 12 of rand_a form the ordered prefix; when
+        # the clock has not moved on, bump it instead.
+        prefix = max(time.time_ns() // 1_000_000 << 12 | random >> 68, _uuid7_last + 1)
+        _uuid7_last = prefix
+    value = (
+        (prefix >> 12) << 80
+        | 0x7 << 76
+        | (prefix & 0xFFF) << 64
+        | 0b10 << 62
+        | random & (1 << 62) - 1
+    )
+    return str(uuid.UUID(int=value))
+
+
 @dataclass(frozen=True, slots=True)
 class UniqueEntityId(ValueObject):
 
@@ -37,3 +74,21 @@ class UniqueEntityId(ValueObject):
             uuid.UUID(self.id)
         except ValueError as ex:
             raise InvalidUuidException() from ex
+
+    def __str__(self) -> str:
+        return self.id
+
+    @classmethod
+    def trusted(cls, value: str | uuid.UUID) -> "UniqueEntityId":
+        """
+        Build from an id known to be valid, such as one read back from storage,
+        without parsing it again.
+        """
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "id", str(value))
+        return instance
+
+    @classmethod
+    def time_ordered(cls) -> "UniqueEntityId":
+        """New id from uuid7(), for entities whose ids are database keys."""
+        return cls.trusted(uuid7())
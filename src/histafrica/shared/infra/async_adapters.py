@@ -0,0 +1,149 @@
+from dataclasses import dataclass
+from itertools import islice
+from typing import AsyncIterator, List
+
+from asgiref.sync import async_to_sync, sync_to_async
+
+from histafrica.shared.application.use_case import (
+    AsyncUseCase,
+    Input,
+    Output,
+    UseCase,
+)
+from histafrica.shared.domain.repository import (
+    ET,
+    AsyncRepositoryInterface,
+    AsyncSearchableRepositoryInterface,
+    BulkResult,
+    RepositoryInterface,
+    SearchableRepositoryInterface,
+    SearchParams,
+    SearchResult,
+)
+from histafrica.shared.domain.value_objects import UniqueEntityId
+
+# Sync calls are made with sync_to_async's default thread_sensitive=True: they
+# all run on one shared thread, which is what Django's ORM connections expect.
+
+
+@dataclass(slots=True)
+class AsyncRepositoryAdapter(AsyncRepositoryInterface[ET]):
+    """Awaitable view of a sync repository; each call runs in a worker thread."""
+
+    repository: RepositoryInterface[ET]
+
+    async def insert(self, entity: ET) -> None:
+        await sync_to_async(self.repository.insert)(entity)
+
+    async def bulk_insert(self, entities: List[ET]) -> BulkResult:
+        return await sync_to_async(self.repository.bulk_insert)(entities)
+
+    async def find_by_id(self, entity_id: str | UniqueEntityId) -> ET:
+        return await sync_to_async(self.repository.find_by_id)(entity_id)
+
+    async def find_all(self) -> List[ET]:
+        return await sync_to_async(self.repository.find_all)()
+
+    async def iter_all(self, chunk_size: int = 1000) -> AsyncIterator[ET]:
+        # One thread hop per chunk rather than per entity.
+        entities = self.repository.iter_all(chunk_size=chunk_size)
+        next_chunk = sync_to_async(lambda: list(islice(entities, chunk_size)))
+        while chunk := await next_chunk():
+            for entity in chunk:
+                yield entity
+
+    async def update(self, entity: ET) -> None:
+        await sync_to_async(self.repository.update)(entity)
+
+    async def bulk_update(self, entities: List[ET]) -> BulkResult:
+        return await sync_to_async(self.repository.bulk_update)(entities)
+
+    async def delete(self, entity_id: str | UniqueEntityId | ET) -> None:
+        await sync_to_async(self.repository.delete)(entity_id)
+
+    async def bulk_delete(
+        self, entity_ids: List[str | UniqueEntityId | ET]
+    ) -> BulkResult:
+        return await sync_to_async(self.repository.bulk_delete)(entity_ids)
+
+
+@dataclass(slots=True)
+class AsyncSearchableRepositoryAdapter(
+    AsyncRepositoryAdapter[ET],
+    AsyncSearchableRepositoryInterface[ET, SearchParams, SearchResult],
+):
+    repository: SearchableRepositoryInterface[ET, SearchParams, SearchResult]
+
+    @property
+    def sortable_fields(self) -> List[str]:
+        return self.repository.sortable_fields
+
+    async def search(self, input_params: SearchParams) -> SearchResult:
+        return await sync_to_async(self.repository.search)(input_params)
+
+
+@dataclass(slots=True)
+class SyncRepositoryAdapter(RepositoryInterface[ET]):
+    """
+    Blocking view of an async repository for sync callers. It must not be used
+    from a thread that is already running an event loop. iter_all falls back
+    to find_all: an async generator cannot outlive the event loop each
+    async_to_sync call runs in.
+    """
+
+    repository: AsyncRepositoryInterface[ET]
+
+    def insert(self, entity: ET) -> None:
+        async_to_sync(self.repository.insert)(entity)
+
+    def bulk_insert(self, entities: List[ET]) -> BulkResult:
+        return async_to_sync(self.repository.bulk_insert)(entities)
+
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> ET:
+        return async_to_sync(self.repository.find_by_id)(entity_id)
+
+    def find_all(self) -> List[ET]:
+        return async_to_sync(self.repository.find_all)()
+
+    def update(self, entity: ET) -> None:
+        async_to_sync(self.repository.update)(entity)
+
+    def bulk_update(self, entities: List[ET]) -> BulkResult:
+        return async_to_sync(self.repository.bulk_update)(entities)
+
+    def delete(self, entity_id: str | UniqueEntityId | ET) -> None:
+        async_to_sync(self.repository.delete)(entity_id)
+
+    def bulk_delete(self, entity_ids: List[str | UniqueEntityId | ET]) -> BulkResult:
+        return async_to_sync(self.repository.bulk_delete)(entity_ids)
+
+
+@dataclass(slots=True)
+class SyncSearchableRepositoryAdapter(
+    SyncRepositoryAdapter[ET],
+    SearchableRepositoryInterface[ET, SearchParams, SearchResult],
+):
+    repository: AsyncSearchableRepositoryInterface[ET, SearchParams, SearchResult]
+
+    @property
+    def sortable_fields(self) -> List[str]:
+        return self.repository.sortable_fields
+
+    def search(self, input_params: SearchParams) -> SearchResult:
+        return async_to_sync(self.repository.search)(input_params)
+
+
+@dataclass(slots=True)
+class AsyncUseCaseAdapter(AsyncUseCase[Input, Output]):
+    use_case: UseCase[Input, Output]
+
+    async def execute(self, input_dto: Input) -> Output:
+        return await sync_to_async(self.use_case.execute)(input_dto)
+
+
+@dataclass(slots=True)
+class SyncUseCaseAdapter(UseCase[Input, Output]):
+    use_case: AsyncUseCase[Input, Output]
+
+    def execute(self, input_dto: Input) -> Output:
+        return async_to_sync(self.use_case.execute)(input_dto)
@@ -0,0 +1,217 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional
+
+from histafrica.shared.domain.repository import (
+    ET,
+    BulkResult,
+    RepositoryInterface,
+    SearchableRepositoryInterface,
+    SearchParams,
+    SearchResult,
+)
+from histafrica.shared.domain.value_objects import UniqueEntityId
+
+_MISSING = object()
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_ratio": self.hit_ratio,
+        }
+
+
+class LRUCache:
+    """
+    Thread-safe mapping bounded to ``capacity`` entries that evicts the least
+    recently used one when full. With a ``ttl`` (in seconds), entries older than
+    that are dropped on their next lookup.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if capacity < 1:
+            raise ValueError("capacity must be greater than zero")
+        self.capacity = capacity
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                self.stats.misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= self._clock():
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = None if self.ttl is None else self._clock() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+@dataclass(slots=True)
+class CachedRepository(RepositoryInterface[ET]):
+    """
+    Read-through cache in front of any repository. Entities are frozen, so the
+    cached instance is handed out as is. Every write through this wrapper drops
+    the ids it touched and bumps ``version``; writes made straight to the
+    wrapped repository are only picked up once their entries expire.
+    """
+
+    repository: RepositoryInterface[ET]
+    cache: LRUCache = field(default_factory=LRUCache)
+    version: int = field(default=0, init=False)
+    # Makes the version bump and the reads' check-then-store atomic: the async
+    # adapters run writes and reads on threads.
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.cache.stats
+
+    def insert(self, entity: ET) -> None:
+        try:
+            self.repository.insert(entity)
+        finally:
+            self._invalidate([entity])
+
+    def bulk_insert(self, entities: List[ET]) -> BulkResult:
+        try:
+            return self.repository.bulk_insert(entities)
+        finally:
+            self._invalidate(entities)
+
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> ET:
+        key = str(entity_id)
+        entity = self.cache.get(key, _MISSING)
+        if entity is _MISSING:
+            version = self.version
+            entity = self.repository.find_by_id(key)
+            # A write that landed while loading may have made it stale.
+            with self._lock:
+                if version == self.version:
+                    self.cache.set(key, entity)
+        return entity
+
+    def find_all(self) -> List[ET]:
+        return self.repository.find_all()
+
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[ET]:
+        return self.repository.iter_all(chunk_size=chunk_size)
+
+    def update(self, entity: ET) -> None:
+        try:
+            self.repository.update(entity)
+        finally:
+            self._invalidate([entity])
+
+    def bulk_update(self, entities: List[ET]) -> BulkResult:
+        try:
+            return self.repository.bulk_update(entities)
+        finally:
+            self._invalidate(entities)
+
+    def delete(self, entity_id: str | UniqueEntityId | ET) -> None:
+        try:
+            self.repository.delete(entity_id)
+        finally:
+            self._invalidate([entity_id])
+
+    def bulk_delete(self, entity_ids: List[str | UniqueEntityId | ET]) -> BulkResult:
+        try:
+            return self.repository.bulk_delete(entity_ids)
+        finally:
+            self._invalidate(entity_ids)
+
+    def _invalidate(self, batch: List[Any]) -> None:
+        # Every write publishes a version of its own, so a reader that loaded
+        # before it cannot store under a version that still looks current.
+        with self._lock:
+            self.version += 1
+            for item in batch:
+                self.cache.delete(self._entity_id(item))
+
+
+@dataclass(slots=True)
+class CachedSearchableRepository(
+    CachedRepository[ET],
+    SearchableRepositoryInterface[ET, SearchParams, SearchResult],
+):
+    """
+    Also caches search results, keyed on the write version and the normalized
+    SearchParams, so equivalent queries share an entry. A write makes every
+    older entry unreachable without scanning keys; they age out of the LRU.
+    Cached results are shared between callers and must not be mutated.
+    """
+
+    repository: SearchableRepositoryInterface[ET, SearchParams, SearchResult]
+    search_cache: LRUCache = field(default_factory=lambda: LRUCache(capacity=256))
+
+    @property
+    def sortable_fields(self) -> List[str]:
+        return self.repository.sortable_fields
+
+    @property
+    def search_stats(self) -> CacheStats:
+        return self.search_cache.stats
+
+    def search(self, input_params: SearchParams) -> SearchResult:
+        key = (self.version, input_params.cache_key())
+        result = self.search_cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = self.repository.search(input_params)
+            self.search_cache.set(key, result)
+        return result
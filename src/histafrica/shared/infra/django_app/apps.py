@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class SharedConfig(AppConfig):
+    name = "histafrica.shared.infra.django_app"
+    label = "shared"
@@ -0,0 +1,54 @@
+import hashlib
+from typing import Any, Optional
+
+from django.http import HttpRequest
+from django.utils.http import parse_etags, quote_etag
+from rest_framework.views import APIView
+
+_UNSET = object()
+
+
+def strong_etag(*parts: Any) -> str:
+    """Quoted strong ETag made of ``parts`` joined with dashes."""
+    return quote_etag("-".join(map(str, parts)))
+
+
+def digest(value: Any) -> str:
+    """Short stable hash of ``repr(value)``, to fit a cache key in an ETag."""
+    return hashlib.blake2b(repr(value).encode(), digest_size=8).hexdigest()
+
+
+def etag_matches(request: HttpRequest, etag: str) -> bool:
+    """
+    Whether the request's If-None-Match names ``etag``. If-None-Match uses the
+    weak comparison (RFC 9110 13.1.2), so a W/ prefix on either side is
+    ignored, and ``*`` matches any current representation.
+    """
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    etags = parse_etags(header)
+    if etags == ["*"]:
+        return True
+    return _opaque(etag) in map(_opaque, etags)
+
+
+def _opaque(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+class VersionedView(APIView):
+    """
+    View whose representation is named by an ETag computed from versions,
+    without loading what it describes. ``get_etag`` returns None when there
+    is nothing to describe (the view then answers 404). The ETag is computed
+    once per request: ResponseCacheMiddleware computes it before the view
+    runs and leaves it on the request.
+    """
+
+    def get_etag(self, request: HttpRequest, **kwargs) -> Optional[str]:
+        raise NotImplementedError()
+
+    def etag(self, request: HttpRequest, **kwargs) -> Optional[str]:
+        etag = getattr(request, "response_etag", _UNSET)
+        return self.get_etag(request, **kwargs) if etag is _UNSET else etag
@@ -3,7 +3,10 @@ from rest_framework.response import Response
 from rest_framework.views import exception_handler as rest_exception_handler
 
 from histafrica.shared.domain.exceptions import (
+    DuplicateEntityException,
     EntityValidationException,
+    InvalidCursorException,
+    InvalidSortException,
     NotFoundException,
 )
 
@@ -23,10 +26,23 @@ def handle_not_found_error(exception: NotFoundException, context):
     return Response({"message": exception.args[0]}, status=404)
 
 
+def handle_duplicate_entity_error(exception: DuplicateEntityException, context):
+    return Response({"message": exception.args[0]}, status=409)
+
+
+def handle_bad_search_params_error(
+    exception: InvalidCursorException | InvalidSortException, context
+):
+    return Response({"message": exception.args[0]}, status=400)
+
+
 handlers = {
     ValidationError: handle_serializer_validation_error,
     EntityValidationException: handle_entity_validation_error,
     NotFoundException: handle_not_found_error,
+    DuplicateEntityException: handle_duplicate_entity_error,
+    InvalidCursorException: handle_bad_search_params_error,
+    InvalidSortException: handle_bad_search_params_error,
 }
 
 
@@ -0,0 +1,89 @@
+import os
+import shutil
+import tempfile
+
+from django.core.management.base import BaseCommand, CommandError
+
+from histafrica.shared.infra.django_app.metrics import METRICS_DIR, clear_metrics
+from histafrica.shared.infra.django_app.server import (
+    LISTEN_FD,
+    PreforkServer,
+    default_workers,
+    load_application,
+    warm_up,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Serve the WSGI application from pre-forked workers sharing one loaded "
+        "copy of it. TERM/INT stop gracefully, HUP reloads. Connections speak "
+        "HTTP/1.0 and close after each response (no keep-alive nor TLS): put "
+        "a proxy keeping client connections alive in front of it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--bind", default="0.0.0.0:8000", help="host:port")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help=f"Worker processes, 2 * CPUs + 1 ({default_workers()}) by default.",
+        )
+        parser.add_argument(
+            "--max-requests",
+            type=int,
+            default=1000,
+            help="Requests a worker serves before it is replaced, 0 for no limit.",
+        )
+        parser.add_argument("--max-requests-jitter", type=int, default=100)
+        parser.add_argument("--graceful-timeout", type=float, default=30.0)
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=30.0,
+            help="Seconds a client may stay silent before it is disconnected, "
+            "0 to wait forever.",
+        )
+        parser.add_argument("--app", default="framework.wsgi:application")
+        parser.add_argument(
+            "--metrics-dir",
+            default=None,
+            help="Directory the workers share their metrics through, a "
+            "temporary one removed on shutdown by default.",
+        )
+
+    def handle(self, *args, **options):
+        host, _, port = options["bind"].rpartition(":")
+        if not host or not port.isdigit():
+            raise CommandError(f"--bind must be host:port, got '{options['bind']}'")
+
+        # Kept across reloads, which inherit the environment and the socket:
+        # the counts of the workers already retired are still served.
+        directory = options["metrics_dir"]
+        temporary = directory is None
+        if temporary:
+            directory = os.environ.get(METRICS_DIR) or tempfile.mkdtemp(
+                prefix="histafrica-metrics-"
+            )
+        else:
+            os.makedirs(directory, exist_ok=True)
+        if LISTEN_FD not in os.environ:
+            clear_metrics(directory)
+        os.environ[METRICS_DIR] = directory
+
+        application = load_application(options["app"])
+        warm_up()
+        PreforkServer(
+            application,
+            host=host.strip("[]"),
+            port=int(port),
+            workers=options["workers"],
+            max_requests=options["max_requests"],
+            max_requests_jitter=options["max_requests_jitter"],
+            graceful_timeout=options["graceful_timeout"],
+            timeout=options["timeout"] or None,
+            log=self.stdout.write,
+        ).run()
+        if temporary:
+            shutil.rmtree(directory, ignore_errors=True)
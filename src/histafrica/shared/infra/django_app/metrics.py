@@ -0,0 +1,306 @@
+import glob
+import json
+import os
+import threading
+from bisect import bisect_left
+from time import perf_counter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+from histafrica.shared.infra.django_app.pool import pool_stats
+from histafrica.shared.timing import Timings, collect
+
+# Seconds. Finer than Prometheus' defaults at the low end, where most phases
+# of a request land.
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Directory the processes of one server share their metrics through; the
+# serve command sets it for its workers. Unset, each process reports its own.
+METRICS_DIR = "HISTAFRICA_METRICS_DIR"
+
+# labels -> [count per bucket, +Inf last], sum
+Series = Dict[Tuple[str, ...], List]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], **extra: str) -> str:
+    pairs = [*zip(names, values), *extra.items()]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if value != float("inf") else "+Inf"
+
+
+class Histogram:
+    """Prometheus histogram, one series per combination of label values."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def snapshot(self) -> Series:
+        with self._lock:
+            return {
+                labels: [list(counts), total]
+                for labels, (counts, total) in self._series.items()
+            }
+
+    def collect(self, others: Iterable[Series] = ()) -> Iterator[str]:
+        """Exposition of this histogram, summed with ``others``' series."""
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        merged = self.snapshot()
+        for other in others:
+            for labels, (counts, total) in other.items():
+                if len(counts) != len(self.buckets) + 1:
+                    continue  # Written with other buckets, before a reload.
+                series = merged.setdefault(labels, [[0] * len(counts), 0.0])
+                series[0] = [mine + theirs for mine, theirs in zip(series[0], counts)]
+                series[1] += total
+        for labels, (counts, total) in sorted(merged.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = _labels(self.labelnames, labels, le=_number(bound))
+                yield f"{self.name}_bucket{le} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(total)}"
+            yield f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}"
+
+
+class Registry:
+    """
+    Metrics rendered by the /metrics endpoint: histograms in registration
+    order, then the other collectors'. Given a ``directory``, or METRICS_DIR
+    in the environment, each process writes its histograms there on dump()
+    and render() sums the files of every process, exited ones included, so
+    the counts of a server do not depend on the worker a scrape reaches.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.histograms: List[Histogram] = []
+        self.collectors: List[Callable[[], Iterable[str]]] = []
+        self._directory = directory
+        self._path: Optional[str] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> Optional[str]:
+        return self._directory or os.environ.get(METRICS_DIR)
+
+    def register(self, metric: Histogram) -> Histogram:
+        self.histograms.append(metric)
+        return metric
+
+    def dump(self) -> None:
+        """Writes this process's histograms to the directory, if any."""
+        directory = self.directory
+        if directory is None:
+            return
+        state = {
+            metric.name: [
+                [list(labels), counts, total]
+                for labels, (counts, total) in metric.snapshot().items()
+            ]
+            for metric in self.histograms
+        }
+        with self._lock:
+            path = self._own_path(directory)
+            with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+                json.dump(state, file)
+            os.replace(f"{path}.tmp", path)
+
+    def render(self) -> str:
+        others = self._load_others()
+        lines = [
+            line
+            for metric in self.histograms
+            for line in metric.collect(others.get(metric.name, ()))
+        ]
+        lines += [line for collector in self.collectors for line in collector()]
+        return "".join(f"{line}\n" for line in lines)
+
+    def _own_path(self, directory: str) -> str:
+        # Named after the process and a random suffix: a later process reusing
+        # the pid must not overwrite the counts of an exited one.
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._path = os.path.join(
+                directory, f"{self._pid}-{os.urandom(4).hex()}.json"
+            )
+        return self._path
+
+    def _load_others(self) -> Dict[str, List[Series]]:
+        directory = self.directory
+        if directory is None:
+            return {}
+        own = self._own_path(directory)
+        others: Dict[str, List[Series]] = {}
+        for path in glob.glob(os.path.join(directory, "*.json")):
+            if path == own:
+                continue
+            try:
+                with open(path, encoding="utf-8") as file:
+                    state = json.load(file)
+            except (OSError, ValueError):
+                continue
+            for name, entries in state.items():
+                others.setdefault(name, []).append(
+                    {
+                        tuple(labels): [counts, total]
+                        for labels, counts, total in entries
+                    }
+                )
+        return others
+
+
+def clear_metrics(directory: str) -> None:
+    """Removes the files left in ``directory`` by a previous server."""
+    for path in glob.glob(os.path.join(directory, "*.json*")):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def collect_pool_stats() -> Iterator[str]:
+    name = "histafrica_db_pool"
+    yield f"# HELP {name} psycopg_pool statistics of each pooled database alias."
+    yield f"# TYPE {name} gauge"
+    for alias, stats in sorted(pool_stats().items()):
+        for stat, value in sorted(stats.items()):
+            yield f"{name}{_labels(('alias', 'stat'), (alias, stat))} {_number(value)}"
+
+
+REGISTRY = Registry()
+REQUEST_SECONDS = REGISTRY.register(
+    Histogram(
+        "histafrica_request_seconds",
+        "Time to produce a response, up to its first byte.",
+        ["method", "route", "status"],
+    )
+)
+PHASE_SECONDS = REGISTRY.register(
+    Histogram(
+        "histafrica_phase_seconds",
+        "Time spent per request in each phase: use_case, repository, "
+        "validation and serialization. Phases nest.",
+        ["phase"],
+    )
+)
+REGISTRY.collectors.append(collect_pool_stats)
+
+
+class TimingMiddleware:
+    """
+    Times every request and the phases inside it (see histafrica.shared.
+    timing), reports them in a Server-Timing header unless SERVER_TIMING is
+    False, and records them in the histograms served by ``metrics_view``.
+    Keep it first, so it times the other middlewares too. The first chunk of
+    a streamed response is produced before the headers, so the header covers
+    it (the whole page when it fits in one chunk, see StreamingJSONRenderer);
+    the phase histograms cover the rest too, once the stream is over.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.server_timing = getattr(settings, "SERVER_TIMING", True)
+
+    def __call__(self, request: HttpRequest):
+        start = perf_counter()
+        with collect() as timings:
+            response = self.get_response(request)
+            if response.streaming:
+                chunks = iter(response.streaming_content)
+                first = next(chunks, None)
+        total = perf_counter() - start
+
+        if self.server_timing:
+            response["Server-Timing"] = timings.server_timing(total)
+        match = request.resolver_match
+        REQUEST_SECONDS.observe(
+            total,
+            request.method,
+            match.route if match is not None else "unmatched",
+            str(response.status_code),
+        )
+        if response.streaming:
+            response.streaming_content = self._stream(first, chunks, timings)
+        else:
+            self._observe_phases(timings)
+        return response
+
+    def _stream(
+        self, first: Optional[bytes], chunks: Iterator[bytes], timings: Timings
+    ) -> Iterator[bytes]:
+        try:
+            if first is None:
+                return
+            yield first
+            while True:
+                with collect(timings):
+                    chunk = next(chunks, None)
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            self._observe_phases(timings)
+
+    @staticmethod
+    def _observe_phases(timings: Timings) -> None:
+        for phase, (seconds, _) in timings.phases.items():
+            PHASE_SECONDS.observe(seconds, phase)
+        REGISTRY.dump()
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """
+    Prometheus text exposition of the server's metrics. Under the prefork
+    server the workers share theirs through METRICS_DIR, so any of them
+    answers for all; the pool statistics are the answering worker's.
+    """
+    return HttpResponse(REGISTRY.render(), content_type=CONTENT_TYPE)
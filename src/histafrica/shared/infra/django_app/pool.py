@@ -0,0 +1,18 @@
+from typing import Any, Dict
+
+from django.db import connections
+
+
+def pool_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    psycopg_pool statistics of every pooled database alias, keyed on alias:
+    pool_min, pool_max, pool_size, pool_available, requests_waiting and the
+    counters psycopg_pool keeps since the pool opened. Pools live in each
+    process, so these describe the calling process only.
+    """
+    stats = {}
+    for alias in connections:
+        connection = connections[alias]
+        if connection.vendor == "postgresql" and connection.pool is not None:
+            stats[alias] = connection.pool.get_stats()
+    return stats
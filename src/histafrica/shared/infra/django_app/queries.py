@@ -0,0 +1,24 @@
+import json
+from typing import Optional
+
+from django.db import connections
+from django.db.models import QuerySet
+
+
+def estimate_count(query: QuerySet) -> Optional[int]:
+    """
+    Row count the PostgreSQL planner expects for ``query``, read from EXPLAIN
+    instead of running COUNT(*). It comes from table statistics, so it is cheap
+    but can drift until the next ANALYZE. Returns None on other databases.
+    """
+    connection = connections[query.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    sql, params = query.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
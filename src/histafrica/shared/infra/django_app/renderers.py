@@ -0,0 +1,69 @@
+from itertools import islice
+from typing import Any, Callable, Iterator, List
+
+from django.http import StreamingHttpResponse
+from rest_framework.compat import LONG_SEPARATORS, SHORT_SEPARATORS
+from rest_framework.renderers import JSONRenderer
+
+from histafrica.shared.infra.django_app.serializers import CollectionSerializer
+from histafrica.shared.timing import timed
+
+
+class StreamingJSONRenderer(JSONRenderer):
+    """
+    Renders a CollectionSerializer as a stream of JSON chunks: the items of
+    ``data`` are serialized and encoded ``chunk_size`` at a time, so a page is
+    never held in memory whole and the first bytes go out before the last
+    item is read. The opening goes out with the first items, so a caller
+    reading the first chunk has serialized them (see TimingMiddleware). The
+    joined chunks are the bytes JSONRenderer gives for ``collection.data``.
+    """
+
+    chunk_size = 100
+
+    def render_collection(self, collection: CollectionSerializer) -> Iterator[bytes]:
+        item_separator, key_separator = (
+            SHORT_SEPARATORS if self.compact else LONG_SEPARATORS
+        )
+        encode = self.encoder_class(
+            ensure_ascii=self.ensure_ascii,
+            allow_nan=not self.strict,
+            separators=(item_separator, key_separator),
+        ).encode
+
+        items = iter(collection.iter_items(collection.instance))
+        chunk = f"{{{encode('data')}{key_separator}["
+        separator = ""
+        while True:
+            batch = self._encode_batch(items, encode)
+            if batch:
+                chunk += separator + item_separator.join(batch)
+                separator = item_separator
+            if len(batch) < self.chunk_size:
+                break
+            yield self._bytes(chunk)
+            chunk = ""
+        yield self._bytes(
+            chunk
+            + f"]{item_separator}{encode('meta')}{key_separator}"
+            + f"{encode(collection.meta)}}}"
+        )
+
+    @timed("serialization")
+    def _encode_batch(self, items: Iterator, encode: Callable[[Any], str]) -> List[str]:
+        return [encode(item) for item in islice(items, self.chunk_size)]
+
+    @staticmethod
+    def _bytes(chunk: str) -> bytes:
+        # Same escaping as JSONRenderer.render.
+        return chunk.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029").encode()
+
+
+class StreamingCollectionResponse(StreamingHttpResponse):
+    """JSON response streaming a CollectionSerializer page item by item."""
+
+    def __init__(self, collection: CollectionSerializer, *args, **kwargs):
+        kwargs.setdefault("content_type", StreamingJSONRenderer.media_type)
+        super().__init__(
+            StreamingJSONRenderer().render_collection(collection), *args, **kwargs
+        )
@@ -0,0 +1,188 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpRequest, HttpResponse, QueryDict
+from rest_framework.exceptions import NotAcceptable
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from histafrica.shared.infra.cache import LRUCache
+from histafrica.shared.infra.django_app.conditional import (
+    VersionedView,
+    digest,
+    etag_matches,
+)
+
+_MISSING = object()
+
+# Set by the response itself on every pass, so never stored.
+_UNSTORED_HEADERS = {"content-length", "etag"}
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    body: bytes
+    headers: Tuple[Tuple[str, str], ...]
+
+    def to_response(self, etag: str) -> HttpResponse:
+        response = HttpResponse(self.body, headers=dict(self.headers))
+        response["ETag"] = etag
+        return response
+
+
+class ResponseCache:
+    """
+    Rendered responses in two tiers: an in-process LRUCache in front of the
+    Django cache ``alias``, which is shared between workers when it points at
+    a shared backend. Keys name a version, so entries are never stale, only
+    unreachable, and both tiers drop them by age or capacity.
+    """
+
+    def __init__(
+        self,
+        alias: Optional[str] = None,
+        local: Optional[LRUCache] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.alias = alias
+        self.local = LRUCache(capacity=256) if local is None else local
+        self.timeout = timeout
+
+    @classmethod
+    def from_settings(cls) -> "ResponseCache":
+        return cls(
+            alias=getattr(settings, "RESPONSE_CACHE_ALIAS", None),
+            local=LRUCache(
+                capacity=getattr(settings, "RESPONSE_CACHE_LOCAL_SIZE", 256)
+            ),
+            timeout=getattr(settings, "RESPONSE_CACHE_TIMEOUT", None),
+        )
+
+    @property
+    def shared(self):
+        return None if self.alias is None else caches[self.alias]
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self.local.get(key, _MISSING)
+        if entry is not _MISSING:
+            return entry
+        if self.shared is None:
+            return None
+        entry = self.shared.get(key)
+        if entry is not None:
+            self.local.set(key, entry)
+        return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        self.local.set(key, entry)
+        if self.shared is not None:
+            if self.timeout is None:
+                self.shared.set(key, entry)
+            else:
+                self.shared.set(key, entry, self.timeout)
+
+
+@lru_cache(maxsize=256)
+def _renderer_format(
+    view_class: type, accept: str, format_override: Optional[str]
+) -> Optional[str]:
+    # Content negotiation only reads the Accept header and the format query
+    # parameter, so its outcome is memoized on them.
+    request = HttpRequest()
+    request.META["HTTP_ACCEPT"] = accept
+    if format_override is not None:
+        request.GET = QueryDict(mutable=True)
+        request.GET[api_settings.URL_FORMAT_OVERRIDE] = format_override
+    view = view_class()
+    try:
+        renderer, _ = view.get_content_negotiator().select_renderer(
+            Request(request), view.get_renderers()
+        )
+    except NotAcceptable:
+        return None
+    return renderer.format
+
+
+class ResponseCacheMiddleware:
+    """
+    Serves GET responses of VersionedView views from a ResponseCache. The
+    view's ETag, computed from versions without loading anything, is part of
+    the key with the path and the negotiated format, so a hit costs the
+    version lookup and skips the use case, the serializer and the renderer.
+    Writes invalidate by moving versions: an entity write reaches that
+    entity's detail and every list, nothing else. Versions must never go
+    back, or older entries would become reachable again.
+
+    Only JSON is cached, and responses setting cookies never are. Keep this
+    middleware last, so headers added by the others are not stored.
+    """
+
+    cached_formats = ("json",)
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.cache = ResponseCache.from_settings()
+
+    def __call__(self, request: HttpRequest):
+        response = self.get_response(request)
+        key = getattr(request, "response_cache_key", None)
+        if (
+            key is not None
+            and response.status_code == 200
+            and response.get("ETag") == request.response_etag
+            and not response.cookies
+        ):
+            self._store(key, response)
+        return response
+
+    def process_view(self, request: HttpRequest, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "view_class", None)
+        if request.method != "GET" or not (
+            isinstance(view_class, type) and issubclass(view_class, VersionedView)
+        ):
+            return None
+        renderer_format = _renderer_format(
+            view_class,
+            request.headers.get("Accept", "*/*"),
+            request.GET.get(api_settings.URL_FORMAT_OVERRIDE),
+        )
+        if renderer_format not in self.cached_formats:
+            return None
+
+        etag = view_class().get_etag(request, **view_kwargs)
+        request.response_etag = etag
+        if etag is None or etag_matches(request, etag):
+            return None
+        key = f"response:{digest((request.path, renderer_format, etag))}"
+        entry = self.cache.get(key)
+        if entry is not None:
+            return entry.to_response(etag)
+        request.response_cache_key = key
+        return None
+
+    def _store(self, key: str, response: HttpResponse) -> None:
+        headers = tuple(
+            (name, value)
+            for name, value in response.headers.items()
+            if name.lower() not in _UNSTORED_HEADERS
+        )
+        if response.streaming:
+            # Stored once the last chunk is out, so the first request still
+            # streams; a client that drops the connection stores nothing.
+            response.streaming_content = self._tee(
+                key, headers, response.streaming_content
+            )
+        else:
+            self.cache.set(key, CachedResponse(response.content, headers))
+
+    def _tee(
+        self, key: str, headers: Tuple[Tuple[str, str], ...], chunks: Iterable[bytes]
+    ) -> Iterator[bytes]:
+        body = []
+        for chunk in chunks:
+            body.append(chunk)
+            yield chunk
+        self.cache.set(key, CachedResponse(b"".join(body), headers))
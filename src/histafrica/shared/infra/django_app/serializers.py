@@ -1,6 +1,11 @@
+from typing import Any, Dict, Iterable, Iterator
+
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
 
 from histafrica.shared.application.dto import PaginationOutput
+from histafrica.shared.timing import timed
 
 
 class AbstractSerializer(serializers.Serializer):
@@ -10,18 +15,69 @@ class AbstractSerializer(serializers.Serializer):
 
 
 class PaginationSerializer(serializers.Serializer):
-    total = serializers.IntegerField()
+    total = serializers.IntegerField(required=False, allow_null=True)
     current_page = serializers.IntegerField()
     per_page = serializers.IntegerField()
-    last_page = serializers.IntegerField()
+    last_page = serializers.IntegerField(required=False, allow_null=True)
+    has_next = serializers.BooleanField(required=False, allow_null=True)
+    estimated_total = serializers.IntegerField(required=False, allow_null=True)
+    next_cursor = serializers.CharField(required=False, allow_null=True)
+
+    optional_fields = (
+        "total",
+        "last_page",
+        "has_next",
+        "estimated_total",
+        "next_cursor",
+    )
+
+    def to_representation(self, instance):
+        # Exact counts render total/last_page, the count-less mode renders
+        # has_next (and estimated_total when known); next_cursor is there when
+        # a next page exists. Unset keys are left out.
+        data = super().to_representation(instance)
+        return {
+            key: value
+            for key, value in data.items()
+            if value is not None or key not in self.optional_fields
+        }
 
 
 class ResourceSerializer(serializers.Serializer):
 
+    @property
+    @timed("serialization")
+    def data(self):
+        return super().data
+
     def to_representation(self, instance):
         data = super().to_representation(instance)
         return {"data": data}
 
+    def iter_representations(self, instances: Iterable) -> Iterator[Dict[str, Any]]:
+        """
+        Unwrapped representation of each instance, the same Serializer.
+        to_representation gives, with the readable fields resolved once for
+        all of them instead of per instance.
+        """
+        fields = [(field, field.field_name) for field in self._readable_fields]
+        for instance in instances:
+            ret = {}
+            for field, field_name in fields:
+                try:
+                    attribute = field.get_attribute(instance)
+                except SkipField:
+                    continue
+                check_for_none = (
+                    attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+                )
+                ret[field_name] = (
+                    None
+                    if check_for_none is None
+                    else field.to_representation(attribute)
+                )
+            yield ret
+
 
 class CollectionSerializer(serializers.ListSerializer):
     paginationOutput: PaginationOutput
@@ -37,14 +93,26 @@ class CollectionSerializer(serializers.ListSerializer):
 
     def to_representation(self, data):
         return {
-            "data": [
-                # todo - verify if we have data or not
-                self.child.to_representation(item)["data"]
-                for item in data
-            ],
-            "meta": PaginationSerializer(self.pagination).data,
+            "data": list(self.iter_items(data)),
+            "meta": self.meta,
         }
 
+    def iter_items(self, data: Iterable) -> Iterator[Dict[str, Any]]:
+        # Resource children are serialized directly; any child that changes
+        # to_representation still goes through it and is unwrapped.
+        child = self.child
+        if (
+            isinstance(child, ResourceSerializer)
+            and type(child).to_representation is ResourceSerializer.to_representation
+        ):
+            return child.iter_representations(data)
+        return (child.to_representation(item)["data"] for item in data)
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        return PaginationSerializer(self.pagination).data
+
     @property
+    @timed("serialization")
     def data(self):
         return self.to_representation(self.instance)
@@ -0,0 +1,357 @@
+import gc
+import os
+import random
+import select
+import signal
+import socket
+import sys
+import time
+import traceback
+from importlib import import_module
+from typing import Callable, List, Optional, Set
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer
+
+from django.db import connections
+from django.urls import get_resolver
+
+# Listening socket handed over to the new master on reload.
+LISTEN_FD = "HISTAFRICA_LISTEN_FD"
+# Workers of the previous generation, retired by the new master on reload.
+RETIRING_PIDS = "HISTAFRICA_RETIRING_PIDS"
+
+_STOP_SIGNALS = {signal.SIGTERM, signal.SIGINT, signal.SIGHUP}
+
+
+def default_workers() -> int:
+    """2 * CPUs + 1, counting the CPUs this process may run on."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    return 2 * cpus + 1
+
+
+def load_application(path: str) -> Callable:
+    """WSGI callable at ``module:attribute``, ``application`` by default."""
+    module, _, attribute = path.partition(":")
+    return getattr(import_module(module), attribute or "application")
+
+
+def warm_up() -> None:
+    """
+    Import everything requests would import lazily (URLconfs, views,
+    serializers), then close the database connections and pools, which must
+    not be shared with the forked workers.
+    """
+    get_resolver().url_patterns  # pylint: disable=expression-not-assigned
+    for connection in connections.all():
+        connection.close()
+        if hasattr(connection, "close_pool"):
+            connection.close_pool()
+
+
+class _Stop(Exception):
+    pass
+
+
+class _RequestHandler(WSGIRequestHandler):
+    def setup(self):
+        # Read by StreamRequestHandler.setup() to set the socket timeout.
+        self.timeout = self.server.request_timeout
+        super().setup()
+
+    def handle(self):
+        try:
+            super().handle()
+        except TimeoutError as ex:
+            self.log_error("Request timed out: %r", ex)
+            self.close_connection = True
+
+
+class _WorkerServer(WSGIServer):
+    requests = 0
+    # Seconds a client may stay silent, None to wait forever.
+    request_timeout: Optional[float] = None
+    # From accept() to closing the connection.
+    busy = False
+
+    def handle_request(self):
+        # The shared socket is non-blocking, which the inherited method takes
+        # as a zero timeout: it would poll it in a busy loop.
+        select.select([self.socket], [], [])
+        self._handle_request_noblock()
+
+    def get_request(self):
+        self.busy = True
+        try:
+            return super().get_request()
+        except OSError:
+            self.busy = False
+            raise
+
+    def finish_request(self, request, client_address):
+        self.requests += 1
+        super().finish_request(request, client_address)
+
+    def shutdown_request(self, request):
+        super().shutdown_request(request)
+        self.busy = False
+
+
+class PreforkServer:
+    """
+    Pre-forking WSGI server. The master loads the application once and
+    freezes the garbage collector before forking, so the workers share the
+    loaded code and data copy-on-write. Each worker serves one request at a
+    time on the shared listening socket, one per connection (wsgiref speaks
+    HTTP/1.0, without keep-alive), and exits after ``max_requests`` (plus up
+    to ``max_requests_jitter``, so workers do not all recycle at once); the
+    master replaces it. A client silent for ``timeout`` seconds is
+    disconnected, so idle or slow clients cannot hold every worker. A worker
+    exiting with an error is replaced after a delay doubling with each
+    consecutive failure, up to ``max_backoff``, so a worker failing to boot
+    does not make the master fork in a loop.
+
+    Signals to the master: TERM or INT stops gracefully, waiting up to
+    ``graceful_timeout`` for requests in flight. HUP re-executes the master
+    in place on the same socket, which reloads the code; its workers stay
+    its children and keep serving while the new code loads, then are stopped
+    as gracefully once the new generation is forked. Old workers reaching
+    ``max_requests`` meanwhile are only replaced then, and if the new code
+    fails to load, the master exits and leaves them serving.
+    """
+
+    def __init__(
+        self,
+        application: Callable,
+        host: str = "0.0.0.0",
+        port: int = 8000,
+        workers: Optional[int] = None,
+        max_requests: int = 0,
+        max_requests_jitter: int = 0,
+        graceful_timeout: float = 30.0,
+        timeout: Optional[float] = 30.0,
+        max_backoff: float = 10.0,
+        backlog: int = 2048,
+        log: Callable[[str], None] = lambda message: print(message, file=sys.stderr),
+        argv: Optional[List[str]] = None,
+    ):
+        self.application = application
+        self.host = host
+        self.port = port
+        self.workers = workers or default_workers()
+        self.max_requests = max_requests
+        self.max_requests_jitter = max_requests_jitter
+        self.graceful_timeout = graceful_timeout
+        self.timeout = timeout
+        self.max_backoff = max_backoff
+        self.backlog = backlog
+        self.log = log
+        # The interpreter arguments too, so python -m and -c re-execute.
+        self.argv = sys.orig_argv[1:] if argv is None else argv
+        self.socket: Optional[socket.socket] = None
+        self._children: Set[int] = set()
+        self._retiring: Set[int] = set()
+        self._retire_deadline: Optional[float] = None
+        self._signal: Optional[int] = None
+        self._worker_server: Optional[_WorkerServer] = None
+        self._stopping = False
+        self._failures = 0
+        self._next_spawn = 0.0
+
+    def run(self) -> None:
+        self.socket = self._listen()
+        host, port = self.socket.getsockname()[:2]
+        self.log(f"Listening at http://{host}:{port} ({os.getpid()})")
+        retiring = os.environ.pop(RETIRING_PIDS, "")
+        self._retiring = {int(pid) for pid in retiring.split(",") if pid}
+
+        # Signals wake the loop through the pipe; SIGCHLD only needs to wake
+        # it, since dead workers are reaped on every pass.
+        wakeup_read, wakeup_write = os.pipe()
+        os.set_blocking(wakeup_read, False)
+        os.set_blocking(wakeup_write, False)
+        signal.set_wakeup_fd(wakeup_write)
+        for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+            signal.signal(signum, self._handle_master_signal)
+        signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+        # Blocked across a reload, so they wait for the handlers above.
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, _STOP_SIGNALS)
+
+        # Objects loaded so far are never collected, so the collector does not
+        # write to their pages and break the sharing with the workers.
+        gc.collect()
+        gc.freeze()
+        try:
+            while self._signal is None:
+                self._reap()
+                # Until the backoff after a failed worker is over, if any.
+                wait = self._next_spawn - time.monotonic()
+                if wait <= 0:
+                    while len(self._children) < self.workers:
+                        self._spawn()
+                    wait = 1.0
+                self._retire()
+                select.select([wakeup_read], [], [], min(wait, 1.0))
+                self._drain(wakeup_read)
+        finally:
+            signal.set_wakeup_fd(-1)
+            os.close(wakeup_read)
+            os.close(wakeup_write)
+
+        if self._signal == signal.SIGHUP:
+            self._reexec()
+        self._stop_workers()
+        self.socket.close()
+        self.log(f"Shut down ({os.getpid()})")
+
+    def _listen(self) -> socket.socket:
+        inherited = os.environ.pop(LISTEN_FD, None)
+        if inherited is not None:
+            listener = socket.socket(fileno=int(inherited))
+            listener.set_inheritable(False)
+            return listener
+        return socket.create_server((self.host, self.port), backlog=self.backlog)
+
+    def _handle_master_signal(self, signum, frame):
+        self._signal = signum
+
+    @staticmethod
+    def _drain(fd: int) -> None:
+        try:
+            while os.read(fd, 1024):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _reap(self) -> None:
+        while self._children or self._retiring:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self._children.clear()
+                self._retiring.clear()
+                return
+            if not pid:
+                return
+            if pid in self._retiring:
+                self._retiring.discard(pid)
+                continue
+            self._children.discard(pid)
+            self._record_exit(pid, os.waitstatus_to_exitcode(status))
+
+    def _retire(self) -> None:
+        """Stops the previous generation once this one is forked."""
+        if not self._retiring or len(self._children) < self.workers:
+            return
+        if self._retire_deadline is None:
+            self._kill(signal.SIGTERM, self._retiring)
+            self._retire_deadline = time.monotonic() + self.graceful_timeout
+        elif time.monotonic() >= self._retire_deadline:
+            self._kill(signal.SIGKILL, self._retiring)
+
+    def _record_exit(self, pid: int, code: int) -> None:
+        if not code:
+            self._failures = 0
+            return
+        self._failures += 1
+        delay = min(0.1 * 2 ** (self._failures - 1), self.max_backoff)
+        self._next_spawn = time.monotonic() + delay
+        if self._signal is None:
+            self.log(f"Worker {pid} exited with {code}, restarting in {delay:.1f}s")
+
+    def _spawn(self) -> None:
+        # A signal sent before the worker installs its handlers waits for them
+        # instead of running the master's.
+        signal.pthread_sigmask(signal.SIG_BLOCK, _STOP_SIGNALS)
+        try:
+            pid = os.fork()
+            if not pid:
+                self._work()
+        finally:
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, _STOP_SIGNALS)
+        self._children.add(pid)
+
+    def _stop_workers(self) -> None:
+        self._children |= self._retiring
+        self._retiring.clear()
+        self._kill(signal.SIGTERM, self._children)
+        deadline = time.monotonic() + self.graceful_timeout
+        while self._children and time.monotonic() < deadline:
+            time.sleep(0.05)
+            self._reap()
+        if self._children:
+            self._kill(signal.SIGKILL, self._children)
+            for pid in list(self._children):
+                os.waitpid(pid, 0)
+            self._children.clear()
+
+    @staticmethod
+    def _kill(signum: int, pids: Set[int]) -> None:
+        for pid in list(pids):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pids.discard(pid)
+
+    def _reexec(self) -> None:
+        self.log(f"Reloading ({os.getpid()})")
+        self.socket.set_inheritable(True)
+        environ = {
+            **os.environ,
+            LISTEN_FD: str(self.socket.fileno()),
+            RETIRING_PIDS: ",".join(map(str, self._children | self._retiring)),
+        }
+        sys.stdout.flush()
+        sys.stderr.flush()
+        signal.pthread_sigmask(signal.SIG_BLOCK, _STOP_SIGNALS)
+        os.execve(sys.executable, [sys.executable, *self.argv], environ)
+
+    # Worker side.
+
+    def _work(self) -> None:
+        code = 0
+        try:
+            self._serve()
+        except _Stop:
+            pass
+        except BaseException:  # pylint: disable=broad-exception-caught
+            traceback.print_exc()
+            code = 1
+        finally:
+            os._exit(code)  # pylint: disable=protected-access
+
+    def _serve(self) -> None:
+        signal.set_wakeup_fd(-1)
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, self._handle_worker_signal)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        random.seed()
+
+        server = self._worker_server = _WorkerServer(
+            self.socket.getsockname()[:2], _RequestHandler, bind_and_activate=False
+        )
+        server.request_timeout = self.timeout
+        server.socket.close()
+        server.socket = self.socket
+        # Idle workers all wake on a new connection; the ones that lose the
+        # race must not block in accept().
+        self.socket.setblocking(False)
+        server.server_name = socket.getfqdn(self.host)
+        server.server_port = server.server_address[1]
+        server.setup_environ()
+        server.set_app(self.application)
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, _STOP_SIGNALS)
+
+        limit = 0
+        if self.max_requests:
+            limit = self.max_requests + random.randint(0, self.max_requests_jitter)
+        while not self._stopping and (not limit or server.requests < limit):
+            server.handle_request()
+
+    def _handle_worker_signal(self, signum, frame):
+        # An idle worker stops at once; a busy one finishes its request first.
+        self._stopping = True
+        if not self._worker_server.busy:
+            raise _Stop()
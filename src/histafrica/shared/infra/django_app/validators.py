@@ -0,0 +1,274 @@
+import re
+import sys
+from abc import ABC
+from functools import cache
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Optional, Tuple, Type
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import (
+    MaxLengthValidator,
+    MinLengthValidator,
+    ProhibitNullCharactersValidator,
+)
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import (
+    BooleanField,
+    CharField,
+    SkipField,
+    empty,
+    get_error_detail,
+)
+from rest_framework.serializers import Serializer
+from rest_framework.validators import ProhibitSurrogateCharactersValidator
+
+from histafrica.shared.domain.validators import (
+    ErrorFields,
+    PropsValidated,
+    ValidatorFieldsInterface,
+)
+from histafrica.shared.timing import instrument, timed
+
+
+class DRFValidator(
+    ValidatorFieldsInterface[PropsValidated], ABC
+):  # pylint: disable=too-few-public-methods
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        instrument(cls, "validation", ["validate", "validate_many"])
+
+    @timed("validation")
+    def validate(self, data: Serializer) -> bool:
+        serializer = data
+        if serializer.is_valid():
+            self.validated_data = dict(serializer.validated_data)
+            return True
+
+        self.errors = {
+            field: [str(_error) for _error in _errors]
+            for field, _errors in serializer.errors.items()
+        }
+        return False
+
+
+class StrictCharField(CharField):
+
+    def to_internal_value(self, data):
+        if not isinstance(data, str):
+            self.fail("invalid")
+
+        return super().to_internal_value(data)
+
+
+class StrictBooleanField(BooleanField):
+
+    def to_internal_value(self, data):  # pylint: disable=inconsistent-return-statements
+        if data is True:
+            return True
+        if data is False:
+            return False
+        if data is None and self.allow_null:
+            return None
+        self.fail("invalid", input=data)
+
+
+# Plan step: primitive value (or ``empty``) -> validated value. Raises
+# ValidationError, or SkipField for an optional field that was left out.
+_Step = Callable[[Any], Any]
+_Plan = Callable[[Dict[str, Any]], Tuple[Dict[str, Any], Optional[ErrorFields]]]
+
+_SURROGATE = re.compile("[\ud800-\udfff]")
+_CHECKED_VALIDATORS = (
+    MaxLengthValidator,
+    MinLengthValidator,
+    ProhibitNullCharactersValidator,
+    ProhibitSurrogateCharactersValidator,
+)
+
+
+def _string_check(field: CharField) -> Callable[[str], bool]:
+    # True when the field validators would all pass on the value. When it
+    # says False, the validators themselves run to build the errors, so the
+    # check only has to be right about valid values.
+    min_length, max_length = 0, sys.maxsize
+    for validator in field.validators:
+        if not isinstance(validator, _CHECKED_VALIDATORS) or callable(
+            getattr(validator, "limit_value", None)
+        ):
+            return lambda value: False
+        if isinstance(validator, MaxLengthValidator):
+            max_length = min(max_length, validator.limit_value)
+        elif isinstance(validator, MinLengthValidator):
+            min_length = max(min_length, validator.limit_value)
+
+    def check(value: str) -> bool:
+        return (
+            min_length <= len(value) <= max_length
+            and "\x00" not in value
+            and (value.isascii() or _SURROGATE.search(value) is None)
+        )
+
+    return check
+
+
+def _strict_char_step(field: "StrictCharField") -> _Step:
+    # CharField.run_validation, Field.validate_empty_values and
+    # StrictCharField.to_internal_value, in the order DRF runs them.
+    fail, run_validators = field.fail, field.run_validators
+    required, allow_null = field.required, field.allow_null
+    allow_blank, trim = field.allow_blank, field.trim_whitespace
+    check = _string_check(field)
+
+    def step(data):
+        if type(data) is str:
+            value = data.strip() if trim else data
+            if value == "":
+                if not allow_blank:
+                    fail("blank")
+                return ""
+        else:
+            if data is empty:
+                if required:
+                    fail("required")
+                raise SkipField()
+            if data == "" or (trim and str(data).strip() == ""):
+                if not allow_blank:
+                    fail("blank")
+                return ""
+            if data is None:
+                if not allow_null:
+                    fail("null")
+                return None
+            if not isinstance(data, str):
+                fail("invalid")
+            value = str(data).strip() if trim else str(data)
+        if not check(value):
+            run_validators(value)
+        return value
+
+    return step
+
+
+def _strict_boolean_step(field: "StrictBooleanField") -> _Step:
+    fail, run_validators = field.fail, field.run_validators
+    required, allow_null = field.required, field.allow_null
+    has_validators = bool(field.validators)
+
+    def step(data):
+        if data is True or data is False:
+            value = data
+        elif data is empty:
+            if required:
+                fail("required")
+            raise SkipField()
+        elif data is None:
+            if not allow_null:
+                fail("null")
+            return None
+        else:
+            fail("invalid", input=data)
+        if has_validators:
+            run_validators(value)
+        return value
+
+    return step
+
+
+_NATIVE_STEPS: Dict[type, Callable[[Any], _Step]] = {
+    StrictCharField: _strict_char_step,
+    StrictBooleanField: _strict_boolean_step,
+}
+
+
+def _field_step(field) -> _Step:
+    native = type(field) in _NATIVE_STEPS and field.default is empty
+    return _NATIVE_STEPS[type(field)](field) if native else field.run_validation
+
+
+@cache
+def _compile_rules(rules_cls: Type[Serializer]) -> Optional[_Plan]:
+    """
+    Validation plan for the fields of ``rules_cls``: one step per writable
+    field, native for the strict fields and the field's own run_validation
+    for the others. None when the serializer has hooks the plan does not
+    replicate (validate(), validate_<field>, validators, sources).
+    """
+    rules = rules_cls()
+    if type(rules).validate is not Serializer.validate or rules.validators:
+        return None
+    steps = []
+    for name, field in rules.fields.items():
+        if field.read_only:
+            continue
+        if field.source_attrs != [name] or hasattr(rules, f"validate_{name}"):
+            return None
+        steps.append((name, _field_step(field)))
+
+    def plan(data: Dict[str, Any]):
+        validated: Dict[str, Any] = {}
+        errors: Optional[ErrorFields] = None
+        for name, step in steps:
+            try:
+                validated[name] = step(data.get(name, empty))
+            except ValidationError as exc:
+                errors = errors or {}
+                errors[name] = [str(_error) for _error in exc.detail]
+            except DjangoValidationError as exc:
+                errors = errors or {}
+                errors[name] = [str(_error) for _error in get_error_detail(exc)]
+            except SkipField:
+                pass
+        return validated, errors
+
+    return plan
+
+
+class CompiledDRFValidator(DRFValidator[PropsValidated], ABC):
+    """
+    DRFValidator over a fixed ``rules`` serializer, compiled once into a plan
+    of plain functions instead of building the serializer for every call.
+    Errors and validated data are the same the serializer gives; input the
+    plan does not cover (form data, non dict payloads) goes to the serializer.
+    """
+
+    rules: ClassVar[Type[Serializer]]
+
+    def validate(self, data: Any) -> bool:
+        validated, errors = self._run(data)
+        if errors is None:
+            self.validated_data = validated
+            return True
+        self.errors = errors
+        return False
+
+    def validate_many(self, items: Iterable[Any]) -> Dict[int, ErrorFields]:
+        """
+        Validate a batch, e.g. a bulk import. Returns the errors of the
+        invalid items by position; validated_data is left with one entry per
+        item, None for the invalid ones.
+        """
+        validated_items: List[Optional[Dict[str, Any]]] = []
+        errors_by_index: Dict[int, ErrorFields] = {}
+        for index, data in enumerate(items):
+            validated, errors = self._run(data)
+            if errors is None:
+                validated_items.append(validated)
+            else:
+                validated_items.append(None)
+                errors_by_index[index] = errors
+        self.validated_data = validated_items
+        self.errors = None
+        return errors_by_index
+
+    def _run(self, data: Any) -> Tuple[Optional[Dict[str, Any]], Optional[ErrorFields]]:
+        data = data if data is not None else {}
+        plan = _compile_rules(self.rules)
+        if plan is not None and type(data) is dict:
+            return plan(data)
+        serializer = self.rules(data=data)
+        if serializer.is_valid():
+            return dict(serializer.validated_data), None
+        return None, {
+            field: [str(_error) for _error in _errors]
+            for field, _errors in serializer.errors.items()
+        }
@@ -0,0 +1,71 @@
+import os
+import pstats
+import tempfile
+import unittest
+
+from django.db import transaction
+from django.test import TestCase
+
+from histafrica.category.infra.django_app.models import CategoryModel
+from histafrica.pytest_plugin import ProfileSession, QueryCounter, stats_filename
+
+
+class TestQueryCounter(TestCase):
+
+    def test_counts_queries_without_transaction_control(self):
+        with QueryCounter() as queries:
+            with transaction.atomic():
+                for _ in range(3):
+                    list(CategoryModel.objects.all())
+            CategoryModel.objects.count()
+
+        self.assertEqual(queries.count, 4)
+        report = queries.report(budget=2)
+        self.assertTrue(report.startswith("ran 4 SQL queries, over its budget of 2."))
+        self.assertIn('3 x SELECT "categories"."id"', report)
+        self.assertNotIn("COUNT", report)
+
+    def test_stops_counting_on_exit(self):
+        with QueryCounter() as queries:
+            pass
+        list(CategoryModel.objects.all())
+
+        self.assertEqual(queries.count, 0)
+        self.assertEqual(
+            queries.report(budget=0), "ran 0 SQL queries, over its budget of 0."
+        )
+
+
+def busy(n: int) -> int:
+    return sum(range(n))
+
+
+class TestProfileSession(unittest.TestCase):
+
+    def test_writes_a_stats_file_per_test(self):
+        with tempfile.TemporaryDirectory() as directory:
+            session = ProfileSession(directory=directory)
+            with session.profile("tests/test_a.py::TestA::test[1-x]"):
+                busy(1000)
+
+            filename = stats_filename("tests/test_a.py::TestA::test[1-x]")
+            self.assertEqual(filename, "tests_test_a.py_TestA_test_1-x.pstats")
+            stats = pstats.Stats(os.path.join(directory, filename))
+            self.assertIn(busy.__name__, {name for _, _, name in stats.stats})
+        self.assertIsNone(session.stats)
+
+    def test_aggregates_hotspots(self):
+        session = ProfileSession(aggregate=True)
+        for nodeid in ("test_a", "test_b"):
+            with session.profile(nodeid):
+                busy(1000)
+
+        hotspots = session.hotspots(100, os.path.dirname(__file__))
+        self.assertLessEqual(len(hotspots), 100)
+        self.assertEqual(
+            [row[0] for row in hotspots],
+            sorted((row[0] for row in hotspots), reverse=True),
+        )
+        location = f"{os.path.basename(__file__)}:{busy.__code__.co_firstlineno}(busy)"
+        (calls,) = [calls for _, _, calls, name in hotspots if name == location]
+        self.assertEqual(calls, 2)
@@ -1,15 +1,30 @@
+import base64
+import datetime
+import json
 import unittest
 from dataclasses import dataclass
 from typing import List, Optional
 
 from histafrica.shared.domain.entity import Entity
-from histafrica.shared.domain.exceptions import NotFoundException
+from histafrica.shared.domain.exceptions import (
+    DuplicateEntityException,
+    InvalidCursorException,
+    InvalidSortException,
+    NotFoundException,
+)
 from histafrica.shared.domain.repository import (
+    BULK_REINDEX_THRESHOLD,
     ET,
+    MAX_PER_PAGE,
+    AsyncRepositoryInterface,
+    AsyncSearchableRepositoryInterface,
+    BulkResult,
     Filter,
     InMemoryRepository,
+    InMemorySearchableRepository,
     RepositoryInterface,
     SearchableRepositoryInterface,
+    SearchCursor,
     SearchParams,
     SearchResult,
 )
@@ -84,6 +99,24 @@ class TestInMemoryRepository(unittest.TestCase):
         items = self.repo.find_all()
         self.assertEqual(items, [entity])
 
+    def test_iter_all(self):
+        entities = [StubEntity(name=f"test {i}", price=i) for i in range(3)]
+        self.repo.bulk_insert(entities)
+
+        iterator = self.repo.iter_all(chunk_size=2)
+        self.assertEqual(next(iterator), entities[0])
+        self.repo.delete(entities[1])
+        self.assertEqual(list(iterator), entities[1:])
+
+    def test_as_batch(self):
+        entities = [StubEntity(name=f"test {i}", price=i) for i in range(3)]
+        self.repo.bulk_insert(entities)
+
+        batch = self.repo.as_batch()
+        self.assertEqual(batch.ids, [entity.id for entity in entities])
+        self.assertEqual(batch.to_dicts(), Entity.to_dicts(entities))
+        self.assertEqual(list(self.repo.as_batch(["price"]).columns), ["price"])
+
     def test_throw_not_found_exception_in_update(self):
         entity = StubEntity(name="test", price=5)
         with self.assertRaises(NotFoundException) as assert_error:
@@ -103,6 +136,18 @@ class TestInMemoryRepository(unittest.TestCase):
 
         self.assertEqual(entity_updated, self.repo.items[0])
 
+    def test_update_keeps_insertion_order(self):
+        entities = [StubEntity(name=f"test {i}", price=i) for i in range(3)]
+        for entity in entities:
+            self.repo.insert(entity)
+
+        entity_updated = StubEntity(
+            unique_entity_id=entities[1].unique_entity_id, name="updated", price=1
+        )
+        self.repo.update(entity_updated)
+
+        self.assertEqual(self.repo.items, [entities[0], entity_updated, entities[2]])
+
     def test_throw_not_found_exception_in_delete(self):
         entity = StubEntity(name="test", price=5)
         with self.assertRaises(NotFoundException) as assert_error:
@@ -118,6 +163,120 @@ class TestInMemoryRepository(unittest.TestCase):
         self.repo.delete(entity)
         self.assertEqual(self.repo.items, [])
 
+    def test_delete_by_id(self):
+        entity = StubEntity(name="test", price=5)
+        self.repo.insert(entity)
+
+        self.repo.delete(entity.unique_entity_id)
+        self.assertEqual(self.repo.items, [])
+
+    def test_throw_duplicate_entity_exception_in_insert(self):
+        entity = StubEntity(name="test", price=5)
+        self.repo.insert(entity)
+        with self.assertRaises(DuplicateEntityException) as assert_error:
+            self.repo.insert(entity)
+        self.assertEqual(
+            assert_error.exception.args[0],
+            f"Entity already exists using ID '{entity.id}'",
+        )
+
+    def test_bulk_insert(self):
+        existing = StubEntity(name="existing", price=1)
+        self.repo.insert(existing)
+        entities = [StubEntity(name=f"test {i}", price=i) for i in range(3)]
+
+        result = self.repo.bulk_insert([entities[0], existing, *entities[1:], entities[0]])
+
+        self.assertIsInstance(result, BulkResult)
+        self.assertEqual(result.succeeded, [entity.id for entity in entities])
+        self.assertEqual(list(result.errors), [1, 4])
+        self.assertIsInstance(result.errors[1], DuplicateEntityException)
+        self.assertEqual(
+            result.errors[4].args[0],
+            f"Entity ID '{entities[0].id}' is repeated in the batch",
+        )
+        self.assertEqual(self.repo.items, [existing, *entities])
+
+    def test_bulk_update(self):
+        entities = [StubEntity(name=f"test {i}", price=i) for i in range(2)]
+        self.repo.bulk_insert(entities)
+        entities_updated = [
+            StubEntity(unique_entity_id=entity.unique_entity_id, name="updated", price=0)
+            for entity in entities
+        ]
+        missing = StubEntity(name="missing", price=0)
+
+        result = self.repo.bulk_update([entities_updated[1], missing, entities_updated[0]])
+
+        self.assertEqual(
+            result.succeeded, [entities_updated[1].id, entities_updated[0].id]
+        )
+        self.assertEqual(list(result.errors), [1])
+        self.assertIsInstance(result.errors[1], NotFoundException)
+        self.assertEqual(self.repo.items, entities_updated)
+
+    def test_bulk_delete(self):
+        entities = [StubEntity(name=f"test {i}", price=i) for i in range(3)]
+        self.repo.bulk_insert(entities)
+
+        result = self.repo.bulk_delete(
+            [entities[0].id, entities[2].unique_entity_id, entities[0], "fake id"]
+        )
+
+        self.assertEqual(result.succeeded, [entities[0].id, entities[2].id])
+        self.assertIsInstance(result.errors[2], DuplicateEntityException)
+        self.assertIsInstance(result.errors[3], NotFoundException)
+        self.assertTrue(result.has_errors)
+        self.assertEqual(self.repo.items, [entities[1]])
+
+
+class StubRepository(RepositoryInterface[StubEntity]):
+    def __init__(self):
+        self.entities = {}
+
+    def insert(self, entity: StubEntity) -> None:
+        if entity.id in self.entities:
+            raise DuplicateEntityException(entity.id)
+        self.entities[entity.id] = entity
+
+    def find_by_id(self, entity_id) -> StubEntity:
+        if str(entity_id) not in self.entities:
+            raise NotFoundException(str(entity_id))
+        return self.entities[str(entity_id)]
+
+    def find_all(self) -> List[StubEntity]:
+        return list(self.entities.values())
+
+    def update(self, entity: StubEntity) -> None:
+        self.find_by_id(entity.id)
+        self.entities[entity.id] = entity
+
+    def delete(self, entity_id) -> None:
+        self.find_by_id(entity_id)
+        del self.entities[str(entity_id)]
+
+
+class TestRepositoryInterfaceBulkOperations(unittest.TestCase):
+
+    def test_bulk_operations_fall_back_to_single_writes(self):
+        repo = StubRepository()
+        entities = [StubEntity(name=f"test {i}", price=i) for i in range(2)]
+
+        result = repo.bulk_insert([entities[0], entities[0], entities[1]])
+        self.assertEqual(result.succeeded, [entities[0].id, entities[1].id])
+        self.assertIsInstance(result.errors[1], DuplicateEntityException)
+
+        result = repo.bulk_update([entities[1], StubEntity(name="missing", price=0)])
+        self.assertEqual(result.succeeded, [entities[1].id])
+        self.assertIsInstance(result.errors[1], NotFoundException)
+
+        self.assertEqual(list(repo.iter_all()), entities)
+
+        result = repo.bulk_delete([entities[0].id, entities[0].id])
+        self.assertEqual(result.succeeded, [entities[0].id])
+        self.assertIsInstance(result.errors[1], DuplicateEntityException)
+        self.assertEqual(repo.find_all(), [entities[1]])
+
 
 class TestSearchableRepositoryInterface(unittest.TestCase):
 
@@ -135,6 +294,236 @@ class TestSearchableRepositoryInterface(unittest.TestCase):
         self.assertEqual(SearchableRepositoryInterface.sortable_fields, [])
 
 
+class StubAsyncRepository(AsyncRepositoryInterface[StubEntity]):
+
+    def __init__(self):
+        self.repo = StubInMemoryRepository()
+
+    async def insert(self, entity):
+        self.repo.insert(entity)
+
+    async def find_by_id(self, entity_id):
+        return self.repo.find_by_id(entity_id)
+
+    async def find_all(self):
+        return self.repo.find_all()
+
+    async def update(self, entity):
+        self.repo.update(entity)
+
+    async def delete(self, entity_id):
+        self.repo.delete(entity_id)
+
+
+class TestAsyncRepositoryInterface(unittest.IsolatedAsyncioTestCase):
+
+    def test_throw_error_when_methods_not_implemented(self):
+        with self.assertRaises(TypeError) as assert_error:
+            AsyncRepositoryInterface()
+        self.assertEqual(
+            assert_error.exception.args[0],
+            "Can't instantiate abstract class AsyncRepositoryInterface with "
+            + "abstract methods delete, find_all, find_by_id, insert, update",
+        )
+
+        with self.assertRaises(TypeError) as assert_error:
+            AsyncSearchableRepositoryInterface()
+        self.assertEqual(
+            assert_error.exception.args[0],
+            "Can't instantiate abstract class AsyncSearchableRepositoryInterface "
+            + "with abstract methods delete, find_all, find_by_id, insert, "
+            + "search, update",
+        )
+
+    async def test_bulk_operations_fall_back_to_single_writes(self):
+        repo = StubAsyncRepository()
+        entities = [StubEntity(name=f"test {i}", price=i) for i in range(2)]
+
+        result = await repo.bulk_insert([entities[0], entities[0], entities[1]])
+        self.assertEqual(result.succeeded, [entities[0].id, entities[1].id])
+        self.assertIsInstance(result.errors[1], DuplicateEntityException)
+
+        result = await repo.bulk_update(
+            [entities[1], StubEntity(name="missing", price=0)]
+        )
+        self.assertEqual(result.succeeded, [entities[1].id])
+        self.assertIsInstance(result.errors[1], NotFoundException)
+
+        self.assertEqual([entity async for entity in repo.iter_all()], entities)
+
+        result = await repo.bulk_delete([entities[0].id, entities[0].id])
+        self.assertEqual(result.succeeded, [entities[0].id])
+        self.assertIsInstance(result.errors[1], DuplicateEntityException)
+        self.assertEqual(await repo.find_all(), [entities[1]])
+
+
+class StubInMemorySearchableRepository(InMemorySearchableRepository[StubEntity]):
+    sortable_fields = ["name", "price"]
+
+    def _apply_filter(
+        self, items: List[StubEntity], filter_param: Optional[str]
+    ) -> List[StubEntity]:
+        return [i for i in items if filter_param.lower() in i.name.lower()]
+
+
+class TestInMemorySearchableRepository(unittest.TestCase):
+
+    repo: StubInMemorySearchableRepository
+
+    def setUp(self) -> None:
+        self.repo = StubInMemorySearchableRepository()
+
+    def test_search_without_params_keeps_insertion_order(self):
+        entities = [StubEntity(name=f"test {i}", price=i) for i in range(16)]
+        for entity in entities:
+            self.repo.insert(entity)
+
+        result = self.repo.search(SearchParams())
+        self.assertEqual(
+            result,
+            SearchResult(items=entities[:15], total=16, current_page=1, per_page=15),
+        )
+
+        result = self.repo.search(SearchParams(page=2))
+        self.assertEqual(result.items, entities[15:])
+
+    def test_search_sorted_by_sortable_field(self):
+        entities = [
+            StubEntity(name="b", price=3),
+            StubEntity(name="a", price=1),
+            StubEntity(name="d", price=2),
+            StubEntity(name="c", price=4),
+        ]
+        for entity in entities:
+            self.repo.insert(entity)
+
+        arrange = [
+            {
+                "params": SearchParams(per_page=2, sort="name"),
+                "expected": [entities[1], entities[0]],
+            },
+            {
+                "params": SearchParams(page=2, per_page=2, sort="name"),
+                "expected": [entities[3], entities[2]],
+            },
+            {
+                "params": SearchParams(per_page=3, sort="name", sort_dir="desc"),
+                "expected": [entities[2], entities[3], entities[0]],
+            },
+            {
+                "params": SearchParams(page=2, per_page=3, sort="price", sort_dir="desc"),
+                "expected": [entities[1]],
+            },
+            {
+                "params": SearchParams(page=3, per_page=3, sort="price"),
+                "expected": [],
+            },
+        ]
+        for i in arrange:
+            result = self.repo.search(i["params"])
+            self.assertEqual(result.items, i["expected"], i["params"])
+            self.assertEqual(result.total, 4)
+
+    def test_search_ignores_sort_on_non_sortable_fields(self):
+        entities = [StubEntity(name="b", price=1), StubEntity(name="a", price=2)]
+        for entity in entities:
+            self.repo.insert(entity)
+
+        result = self.repo.search(SearchParams(sort="id"))
+        self.assertEqual(result.items, entities)
+        self.assertEqual(result.sort, "id")
+
+    def test_search_applies_filter_before_sort_and_paginate(self):
+        entities = [
+            StubEntity(name="test b", price=1),
+            StubEntity(name="fake", price=2),
+            StubEntity(name="TEST a", price=3),
+            StubEntity(name="test c", price=4),
+        ]
+        for entity in entities:
+            self.repo.insert(entity)
+
+        result = self.repo.search(
+            SearchParams(per_page=2, sort="name", sort_dir="desc", filter="test")
+        )
+        self.assertEqual(
+            result,
+            SearchResult(
+                items=[entities[3], entities[0]],
+                total=3,
+                current_page=1,
+                per_page=2,
+                sort="name",
+                sort_dir="desc",
+                filter="test",
+            ),
+        )
+
+    def test_sort_indexes_follow_update_and_delete(self):
+        entity_a = StubEntity(name="a", price=1)
+        entity_b = StubEntity(name="b", price=2)
+        self.repo.insert(entity_a)
+        self.repo.insert(entity_b)
+
+        entity_a_updated = StubEntity(
+            unique_entity_id=entity_a.unique_entity_id, name="z", price=1
+        )
+        self.repo.update(entity_a_updated)
+        result = self.repo.search(SearchParams(sort="name"))
+        self.assertEqual(result.items, [entity_b, entity_a_updated])
+
+        self.repo.delete(entity_b)
+        result = self.repo.search(SearchParams(sort="name"))
+        self.assertEqual(result.items, [entity_a_updated])
+        self.assertEqual(len(self.repo._sort_indexes["price"]), 1)
+
+    def test_sort_indexes_follow_bulk_writes(self):
+        size = BULK_REINDEX_THRESHOLD * 2
+        entities = [StubEntity(name=f"test {i:03}", price=size - i) for i in range(size)]
+        self.repo.bulk_insert(entities)
+
+        result = self.repo.search(SearchParams(per_page=size, sort="price"))
+        self.assertEqual(result.items, entities[::-1])
+
+        entities_updated = [
+            StubEntity(unique_entity_id=entity.unique_entity_id, name=entity.name, price=i)
+            for i, entity in enumerate(entities)
+        ]
+        self.repo.bulk_update(entities_updated)
+        result = self.repo.search(SearchParams(per_page=size, sort="price"))
+        self.assertEqual(result.items, entities_updated)
+
+        self.repo.bulk_delete(entities[::2])
+        result = self.repo.search(SearchParams(per_page=size, sort="name", sort_dir="desc"))
+        self.assertEqual(result.items, entities_updated[1::2][::-1])
+        self.assertEqual(len(self.repo._sort_indexes["price"]), size // 2)
+
+    def test_search_without_count(self):
+        entities = [StubEntity(name=f"test {i}", price=i) for i in range(3)]
+        self.repo.bulk_insert(entities)
+
+        result = self.repo.search(SearchParams(per_page=2, count_mode="none"))
+        self.assertEqual(result.items, entities[:2])
+        self.assertIsNone(result.total)
+        self.assertIsNone(result.last_page)
+        self.assertTrue(result.has_next)
+
+        result = self.repo.search(
+            SearchParams(page=2, per_page=2, count_mode="estimate")
+        )
+        self.assertEqual(result.items, entities[2:])
+        self.assertFalse(result.has_next)
+        self.assertEqual(result.estimated_total, 3)
+
+    def test_none_values_are_sorted_last(self):
+        entities = [StubEntity(name=None, price=1), StubEntity(name="a", price=2)]
+        for entity in entities:
+            self.repo.insert(entity)
+
+        result = self.repo.search(SearchParams(sort="name"))
+        self.assertEqual(result.items, [entities[1], entities[0]])
+
+
 class TestSearchParams(unittest.TestCase):
 
     def test_props_annotations(self):
@@ -146,6 +535,8 @@ class TestSearchParams(unittest.TestCase):
                 "sort": Optional[str],
                 "sort_dir": Optional[str],
                 "filter": Optional[Filter],
+                "cursor": Optional[str],
+                "count_mode": Optional[str],
             },
         )
 
@@ -238,6 +629,179 @@ class TestSearchParams(unittest.TestCase):
             params = SearchParams(filter=i["filter"])
             self.assertEqual(params.filter, i["expected"], i)
 
+    def test_cache_key(self):
+        self.assertEqual(
+            SearchParams(page=0, sort="name", sort_dir="DESC").cache_key(),
+            SearchParams(page=1, sort="name", sort_dir="desc").cache_key(),
+        )
+        self.assertEqual(
+            SearchParams(per_page="15", sort_dir="desc", filter="").cache_key(),
+            SearchParams().cache_key(),
+        )
+        self.assertNotEqual(
+            SearchParams(filter="a").cache_key(), SearchParams(filter="b").cache_key()
+        )
+        hash(SearchParams().cache_key())
+
+    def test_count_mode_prop(self):
+        params = SearchParams()
+        self.assertEqual(params.count_mode, "exact")
+
+        arrange = [
+            {"count_mode": None, "expected": "exact"},
+            {"count_mode": "", "expected": "exact"},
+            {"count_mode": "fake", "expected": "exact"},
+            {"count_mode": "NONE", "expected": "none"},
+            {"count_mode": "estimate", "expected": "estimate"},
+        ]
+
+        for i in arrange:
+            params = SearchParams(count_mode=i["count_mode"])
+            self.assertEqual(params.count_mode, i["expected"], i)
+
+        arrange = [
+            {"count_mode": None, "expected": "none"},
+            {"count_mode": "exact", "expected": "none"},
+            {"count_mode": "estimate", "expected": "estimate"},
+        ]
+
+        for i in arrange:
+            params = SearchParams(cursor="cursor", count_mode=i["count_mode"])
+            self.assertEqual(params.count_mode, i["expected"], i)
+
+    def test_cursor_prop(self):
+        params = SearchParams()
+        self.assertIsNone(params.cursor)
+
+        arrange = [
+            {"cursor": None, "expected": None},
+            {"cursor": "", "expected": None},
+            {"cursor": "abc", "expected": "abc"},
+            {"cursor": 0, "expected": "0"},
+        ]
+
+        for i in arrange:
+            params = SearchParams(cursor=i["cursor"])
+            self.assertEqual(params.cursor, i["expected"], i)
+
+    def test_from_query(self):
+        sortable_fields = ["name", "created_at"]
+        expected = SearchParams(
+            page=2, per_page=10, sort="name", sort_dir="desc", filter="movie"
+        )
+
+        query = "page=2&per_page=10&sort=name&sort_dir=DESC&filter=movie&other=1"
+        for raw in [
+            query,
+            "?" + query,
+            {
+                "page": "2",
+                "per_page": "10",
+                "sort": "name",
+                "sort_dir": "DESC",
+                "filter": "movie",
+            },
+            {
+                "page": ["1", "2"],
+                "per_page": ["10"],
+                "sort": ["name"],
+                "sort_dir": ["desc"],
+                "filter": ["movie"],
+            },
+        ]:
+            self.assertEqual(
+                SearchParams.from_query(raw, sortable_fields), expected, raw
+            )
+
+        self.assertEqual(SearchParams.from_query("", sortable_fields), SearchParams())
+        self.assertEqual(
+            SearchParams.from_query({"page": {}}, sortable_fields), SearchParams()
+        )
+
+    def test_from_query_drops_or_rejects_unsortable_fields(self):
+        params = SearchParams.from_query("sort=secret&sort_dir=desc", ["name"])
+        self.assertIsNone(params.sort)
+        self.assertIsNone(params.sort_dir)
+
+        with self.assertRaises(InvalidSortException) as assert_error:
+            SearchParams.from_query("sort=secret", ["name"], strict=True)
+        self.assertEqual(
+            str(assert_error.exception),
+            "Cannot sort by 'secret', sortable fields: name",
+        )
+
+    def test_from_query_clamps_per_page(self):
+        self.assertEqual(
+            SearchParams.from_query("per_page=100000", []).per_page, MAX_PER_PAGE
+        )
+        self.assertEqual(
+            SearchParams.from_query("per_page=100000", [], max_per_page=50).per_page,
+            50,
+        )
+        self.assertEqual(SearchParams.from_query("per_page=20", []).per_page, 20)
+
+    def test_from_query_returns_a_new_instance_each_call(self):
+        first = SearchParams.from_query("page=3&sort=name", ["name"])
+        first.page = 10
+        second = SearchParams.from_query("page=3&sort=name", ["name"])
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second.page, 3)
+        self.assertEqual(second.sort_dir, "asc")
+
+
+class TestSearchCursor(unittest.TestCase):
+
+    entity_id = "5490020a-e866-4229-9adc-aa44b83234c4"
+
+    def test_encode_and_decode(self):
+        arrange = [
+            SearchCursor(sort="name", sort_dir="asc", value="movie", id=self.entity_id),
+            SearchCursor(sort="price", sort_dir="desc", value=5.5, id=self.entity_id),
+            SearchCursor(
+                sort="created_at",
+                sort_dir="desc",
+                value=datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+                id=self.entity_id,
+            ),
+        ]
+        for cursor in arrange:
+            encoded = cursor.encode()
+            self.assertRegex(encoded, r"^[A-Za-z0-9_-]+$")
+            self.assertEqual(SearchCursor.decode(encoded), cursor)
+
+    def test_throw_invalid_cursor_exception_when_decode_fails(self):
+        for cursor in ["fake", "e30", "W10"]:
+            with self.assertRaises(InvalidCursorException, msg=cursor):
+                SearchCursor.decode(cursor)
+
+    def test_throw_invalid_cursor_exception_on_crafted_payloads(self):
+        value_types = {"name": str, "created_at": datetime.datetime}
+        arrange = [
+            ["name", "asc", "a", "not-a-uuid"],
+            ["name", "asc", "a", 5],
+            ["name", "up", "a", self.entity_id],
+            ["name", "asc", [1, 2], self.entity_id],
+            ["created_at", "desc", [1, 2], "x"],
+            ["created_at", "desc", "2024-01-01", self.entity_id],
+            ["created_at", "desc", {"$datetime": 1}, self.entity_id],
+            ["price", "asc", 1.5, self.entity_id],
+            [["name"], "asc", "a", self.entity_id],
+        ]
+        for payload in arrange:
+            cursor = (
+                base64.urlsafe_b64encode(json.dumps(payload).encode())
+                .decode()
+                .rstrip("=")
+            )
+            with self.assertRaises(InvalidCursorException, msg=payload):
+                SearchCursor.decode(cursor, value_types)
+
+        cursor = SearchCursor(
+            sort="name", sort_dir="asc", value="a", id=self.entity_id
+        ).encode()
+        self.assertEqual(SearchCursor.decode(cursor, value_types).value, "a")
+
 
 class TestSearchResult(unittest.TestCase):
 
@@ -246,13 +810,16 @@ class TestSearchResult(unittest.TestCase):
             SearchResult.__annotations__,
             {
                 "items": List[ET],
-                "total": int,
+                "total": Optional[int],
                 "current_page": int,
                 "per_page": int,
-                "last_page": int,
+                "last_page": Optional[int],
                 "sort": Optional[str],
                 "sort_dir": Optional[str],
                 "filter": Optional[Filter],
+                "next_cursor": Optional[str],
+                "has_next": Optional[bool],
+                "estimated_total": Optional[int],
             },
         )
 
@@ -273,6 +840,9 @@ class TestSearchResult(unittest.TestCase):
                 "sort": None,
                 "sort_dir": None,
                 "filter": None,
+                "next_cursor": None,
+                "has_next": True,
+                "estimated_total": None,
             },
         )
 
@@ -284,6 +854,7 @@ class TestSearchResult(unittest.TestCase):
             sort="name",
             sort_dir="asc",
             filter="test",
+            next_cursor="cursor",
         )
 
         self.assertDictEqual(
@@ -297,9 +868,42 @@ class TestSearchResult(unittest.TestCase):
                 "sort": "name",
                 "sort_dir": "asc",
                 "filter": "test",
+                "next_cursor": "cursor",
+                "has_next": True,
+                "estimated_total": None,
             },
         )
 
+    def test_without_total(self):
+        result = SearchResult(
+            items=[], total=None, current_page=3, per_page=15, has_next=False
+        )
+        self.assertIsNone(result.last_page)
+        self.assertFalse(result.has_next)
+
+        result = SearchResult(
+            items=[],
+            total=None,
+            current_page=1,
+            per_page=15,
+            has_next=True,
+            estimated_total=1000,
+        )
+        self.assertIsNone(result.last_page)
+        self.assertEqual(result.estimated_total, 1000)
+
+    def test_has_next_follows_last_page_when_total_is_known(self):
+        arrange = [
+            {"current_page": 1, "total": 30, "expected": True},
+            {"current_page": 2, "total": 30, "expected": False},
+            {"current_page": 1, "total": 0, "expected": False},
+        ]
+        for i in arrange:
+            result = SearchResult(
+                items=[], total=i["total"], current_page=i["current_page"], per_page=15
+            )
+            self.assertEqual(result.has_next, i["expected"], i)
+
     def test_when_per_page_is_greater_than_total(self):
         result = SearchResult(items=[], total=4, current_page=1, per_page=15)
         self.assertEqual(result.last_page, 1)
@@ -32,10 +32,13 @@ class TestPaginationOut(unittest.TestCase):
             PaginationOutput.__annotations__,
             {
                 "items": List[Item],
-                "total": int,
+                "total": Optional[int],
                 "per_page": int,
                 "current_page": int,
-                "last_page": int,
+                "last_page": Optional[int],
+                "has_next": Optional[bool],
+                "estimated_total": Optional[int],
+                "next_cursor": Optional[str],
             },
         )
 
@@ -76,3 +79,31 @@ class TestPaginationOutputMapper(unittest.TestCase):
                 per_page=result.per_page,
             ),
         )
+
+    def test_to_output_without_total(self):
+        result = SearchResult(
+            items=["fake"],
+            total=None,
+            current_page=2,
+            per_page=1,
+            has_next=True,
+            estimated_total=10,
+            next_cursor="cursor",
+        )
+
+        output = PaginationOutputMapper.from_child(PaginationOutputChild).to_output(
+            result.items, result=result
+        )
+        self.assertEqual(
+            output,
+            PaginationOutputChild(
+                items=result.items,
+                total=None,
+                current_page=2,
+                last_page=None,
+                per_page=1,
+                has_next=True,
+                estimated_total=10,
+                next_cursor="cursor",
+            ),
+        )
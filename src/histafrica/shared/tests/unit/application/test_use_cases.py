@@ -1,6 +1,6 @@
 import unittest
 
-from histafrica.shared.application.use_case import UseCase
+from histafrica.shared.application.use_case import AsyncUseCase, UseCase
 
 
 class TestUseCases(unittest.TestCase):
@@ -13,3 +13,12 @@ class TestUseCases(unittest.TestCase):
             "Can't instantiate abstract class UseCase with abstract "
             + "method execute",
         )
+
+    def test_throw_error_when_async_methods_not_implemented(self):
+        with self.assertRaises(TypeError) as assert_error:
+            AsyncUseCase()
+        self.assertEqual(
+            assert_error.exception.args[0],
+            "Can't instantiate abstract class AsyncUseCase with abstract "
+            + "method execute",
+        )
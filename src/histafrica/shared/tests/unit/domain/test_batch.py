@@ -0,0 +1,101 @@
+import unittest
+from array import array
+from dataclasses import dataclass, field
+from typing import List, Optional
+from unittest.mock import patch
+
+from histafrica.shared.domain import batch as batch_module
+from histafrica.shared.domain.batch import EntityBatch
+from histafrica.shared.domain.entity import Entity
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEntity(Entity):
+    name: Optional[str]
+    price: float
+    tags: List[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubFlagEntity(Entity):
+    active: bool
+
+
+class TestEntityBatchUnit(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.entities = [
+            StubEntity(name="b", price=2.0, tags=["x"]),
+            StubEntity(name=None, price=1.0),
+            StubEntity(name="a", price=3.0),
+            StubEntity(name="c", price=2.0),
+        ]
+        self.batch = EntityBatch.from_entities(self.entities)
+
+    def test_from_entities(self):
+        self.assertEqual(len(self.batch), 4)
+        self.assertIs(self.batch.entity_cls, StubEntity)
+        self.assertEqual(self.batch.ids, [entity.id for entity in self.entities])
+        self.assertEqual(list(self.batch.columns), ["name", "price", "tags"])
+        self.assertIsInstance(self.batch.columns["price"], array)
+        self.assertIsInstance(self.batch.columns["name"], list)
+
+        batch = EntityBatch.from_entities(self.entities, ["price"])
+        self.assertEqual(list(batch.columns), ["price"])
+
+        batch = EntityBatch.from_entities([])
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(batch.to_dicts(), [])
+        self.assertEqual(batch.to_entities(), [])
+
+    def test_compare_contains_and_filter(self):
+        mask = self.batch.compare("price", "ge", 2.0)
+        self.assertEqual(list(mask), [True, False, True, True])
+        self.assertEqual(
+            self.batch.filter(mask).ids,
+            [self.entities[0].id, self.entities[2].id, self.entities[3].id],
+        )
+        self.assertEqual(
+            list(self.batch.compare("name", "lt", "c")), [True, False, True, False]
+        )
+        self.assertEqual(self.batch.contains("name", "A"), [False, False, True, False])
+
+    def test_argsort_matches_repository_order(self):
+        for field_name in ("name", "price"):
+            for reverse in (False, True):
+                expected = sorted(
+                    self.entities,
+                    key=lambda e: (
+                        (getattr(e, field_name) is None, getattr(e, field_name)),
+                        e.id,
+                    ),
+                    reverse=reverse,
+                )
+                sorted_batch = self.batch.sort(field_name, reverse)
+                self.assertEqual(sorted_batch.to_entities(), expected)
+
+    def test_to_dicts(self):
+        dicts = self.batch.to_dicts()
+        self.assertEqual(dicts, Entity.to_dicts(self.entities))
+        self.assertIsNot(dicts[0]["tags"], self.entities[0].tags)
+
+    def test_bools_round_trip_as_bools(self):
+        entities = [StubFlagEntity(active=True), StubFlagEntity(active=False)]
+        batch = EntityBatch.from_entities(entities)
+
+        self.assertEqual(batch.to_entities(), entities)
+        self.assertIs(batch.to_entities()[0].active, True)
+        self.assertIs(batch.to_dicts()[1]["active"], False)
+        self.assertEqual(list(batch.compare("active", "eq", True)), [True, False])
+
+    def test_to_entities_with_some_columns(self):
+        entities = EntityBatch.from_entities(self.entities, ["name", "price"])
+        self.assertEqual(entities.to_entities()[0].tags, [])
+
+    @unittest.skipIf(batch_module._numpy() is None, "NumPy is not installed")
+    def test_numpy_and_pure_python_paths_agree(self):
+        with patch.object(batch_module, "_numpy", return_value=None):
+            mask = self.batch.compare("price", "gt", 1.0)
+            order = self.batch.argsort("price", reverse=True)
+        self.assertEqual(list(self.batch.compare("price", "gt", 1.0)), mask)
+        self.assertEqual(self.batch.argsort("price", reverse=True), order)
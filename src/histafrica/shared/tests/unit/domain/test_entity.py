@@ -1,6 +1,9 @@
+import datetime
 import unittest
+import uuid
 from abc import ABC
-from dataclasses import dataclass, is_dataclass
+from dataclasses import asdict, dataclass, field, is_dataclass
+from typing import Dict, List, Optional
 
 from histafrica.shared.domain.entity import Entity
 from histafrica.shared.domain.value_objects import UniqueEntityId
@@ -12,6 +15,18 @@ class StubEntity(Entity):
     prop2: str
 
 
+@dataclass(frozen=True)
+class StubValue:
+    tags: List[str]
+
+
+@dataclass(frozen=True, kw_only=True)
+class StubNestedEntity(Entity):
+    name: Optional[str] = None
+    value: StubValue = field(default_factory=lambda: StubValue(tags=["a"]))
+    extra: Dict[str, List[int]] = field(default_factory=lambda: {"a": [1]})
+
+
 class TestEntityUnit(unittest.TestCase):
 
     def test_if_is_a_dataclass(self):
@@ -55,3 +70,77 @@ class TestEntityUnit(unittest.TestCase):
         entity = StubEntity(prop1="value1", prop2="value2")
         entity._set("prop1", "changed")
         self.assertEqual(entity.prop1, "changed")
+
+    def test_to_dict_matches_asdict(self):
+        entity = StubNestedEntity(name="name")
+        expected = asdict(entity)
+        expected.pop("unique_entity_id")
+        expected["id"] = entity.id
+
+        entity_dict = entity.to_dict()
+        self.assertEqual(entity_dict, expected)
+        self.assertEqual(list(entity_dict), list(expected))
+        self.assertIsNot(entity_dict["extra"]["a"], entity.extra["a"])
+        self.assertIsNot(entity_dict["value"]["tags"], entity.value.tags)
+
+    def test_to_dicts(self):
+        entities = [
+            StubEntity(prop1="value1", prop2="value2"),
+            StubNestedEntity(name="name"),
+            StubEntity(prop1="value3", prop2="value4"),
+        ]
+        self.assertEqual(
+            Entity.to_dicts(entities), [entity.to_dict() for entity in entities]
+        )
+        self.assertEqual(Entity.to_dicts([]), [])
+
+    def test_from_row(self):
+        entity_id = uuid.uuid4()
+        entity = StubEntity.from_row((entity_id, "value1", "value2"))
+        self.assertEqual(
+            entity,
+            StubEntity(
+                unique_entity_id=UniqueEntityId(str(entity_id)),
+                prop1="value1",
+                prop2="value2",
+            ),
+        )
+        self.assertEqual(entity.id, str(entity_id))
+
+        entity = StubEntity.from_row(
+            ("value2", "value1", str(entity_id)), columns=["prop2", "prop1", "id"]
+        )
+        self.assertEqual((entity.prop1, entity.prop2), ("value1", "value2"))
+
+        entity = StubNestedEntity.from_row({"id": str(entity_id), "name": "name"})
+        self.assertEqual(entity.name, "name")
+        self.assertEqual(entity.value, StubValue(tags=["a"]))
+        self.assertEqual(entity.extra, {"a": [1]})
+
+    def test_from_row_skips_post_init(self):
+        @dataclass(frozen=True, kw_only=True, slots=True)
+        class StubValidatedEntity(Entity):
+            created_at: datetime.datetime
+
+            def __post_init__(self):
+                raise AssertionError("__post_init__ should not run")
+
+        created_at = datetime.datetime(2024, 1, 1)
+        entity = StubValidatedEntity.from_row((str(uuid.uuid4()), created_at))
+        self.assertEqual(entity.created_at, created_at)
+
+    def test_throw_error_when_a_required_column_is_missing(self):
+        with self.assertRaises(ValueError) as assert_error:
+            StubEntity.from_row({"id": str(uuid.uuid4()), "prop1": "value1"})
+        self.assertEqual(
+            assert_error.exception.args[0],
+            "Missing column 'prop2' to build StubEntity",
+        )
+
+    def test_hydrate_many(self):
+        rows = [(str(uuid.uuid4()), f"value {i}", "value") for i in range(3)]
+        entities = StubEntity.hydrate_many(rows)
+        self.assertEqual(
+            [(entity.id, entity.prop1, entity.prop2) for entity in entities], rows
+        )
+        self.assertEqual(StubEntity.hydrate_many([]), [])
@@ -0,0 +1,64 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import histafrica
+
+DOMAIN_MODULES = [
+    "histafrica.shared.domain.batch",
+    "histafrica.shared.domain.entity",
+    "histafrica.shared.domain.exceptions",
+    "histafrica.shared.domain.repository",
+    "histafrica.shared.domain.text_search",
+    "histafrica.shared.domain.validators",
+    "histafrica.shared.domain.value_objects",
+    "histafrica.category.domain.entity",
+    "histafrica.category.domain.repositories",
+]
+
+# Cumulative microseconds reported by -X importtime for all of DOMAIN_MODULES,
+# standard library dependencies included. Loading Django and DRF alone takes
+# several times this.
+IMPORT_TIME_BUDGET = 250_000
+
+
+def cold_import(modules):
+    """Import ``modules`` in a fresh interpreter; -X importtime report lines."""
+    source_dir = os.path.dirname(os.path.dirname(histafrica.__file__))
+    code = "import sys\n" + "".join(f"import {module}\n" for module in modules)
+    code += "print('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": source_dir},
+        text=True,
+    )
+    return result.stdout.split(), result.stderr.splitlines()
+
+
+class TestDomainImportTime(unittest.TestCase):
+
+    def test_domain_does_not_import_frameworks(self):
+        loaded, _ = cold_import(DOMAIN_MODULES)
+        frameworks = [
+            module
+            for module in loaded
+            if module.split(".")[0] in ("django", "rest_framework")
+        ]
+        self.assertEqual(frameworks, [])
+        infra = [module for module in loaded if ".infra" in module]
+        self.assertEqual(infra, [])
+
+    def test_domain_import_time_is_within_budget(self):
+        _, report = cold_import(DOMAIN_MODULES)
+        # Top level entries have one space after the last separator; their
+        # cumulative time includes everything they imported.
+        total = sum(
+            int(line.split("|")[1])
+            for line in report
+            if line.startswith("import time:")
+            and line.split("|")[2].startswith(" histafrica")
+        )
+        self.assertLessEqual(total, IMPORT_TIME_BUDGET, "\n".join(report))
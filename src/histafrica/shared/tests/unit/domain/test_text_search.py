@@ -0,0 +1,64 @@
+import unittest
+
+from histafrica.shared.domain.text_search import (
+    NGramIndex,
+    parse_text_query,
+    similarity,
+)
+
+
+class TestTextSearchUnit(unittest.TestCase):
+    def test_parse_text_query(self):
+        self.assertEqual(parse_text_query("  Movie  HIST movie "), ["movie", "hist"])
+        self.assertEqual(parse_text_query(""), [])
+
+    def test_similarity(self):
+        self.assertEqual(similarity("movie", "Movie"), 1.0)
+        self.assertEqual(similarity("movie", "music"), 1 / 11)
+        self.assertEqual(similarity("", ""), 0.0)
+
+
+class TestNGramIndexUnit(unittest.TestCase):
+    index: NGramIndex
+
+    def setUp(self) -> None:
+        self.index = NGramIndex()
+        self.index.add_many(
+            [
+                ("1", "Movie"),
+                ("2", "Documentary\nmovies about history"),
+                ("3", "Music"),
+            ]
+        )
+
+    def test_search_matches_substrings_case_insensitive(self):
+        self.assertEqual([i for i, _ in self.index.search("MOV")], ["1", "2"])
+        self.assertEqual([i for i, _ in self.index.search("ist")], ["2"])
+
+    def test_search_requires_every_term(self):
+        self.assertEqual([i for i, _ in self.index.search("mov hist")], ["2"])
+        self.assertEqual(self.index.search("mov jazz"), [])
+
+    def test_search_short_terms(self):
+        self.assertEqual([i for i, _ in self.index.search("u")], ["2", "3"])
+        self.assertEqual([i for i, _ in self.index.search("mu si")], ["3"])
+
+    def test_search_ranks_best_match_first(self):
+        ranked = self.index.search("movie")
+        self.assertEqual([i for i, _ in ranked], ["1", "2"])
+        self.assertEqual(ranked[0][1], 1.0)
+        self.assertLess(ranked[1][1], 1.0)
+
+    def test_search_without_terms_matches_everything(self):
+        self.assertEqual(len(self.index.search(" ")), 3)
+
+    def test_add_replaces_and_remove_drops_postings(self):
+        self.index.add("1", "Cinema")
+        self.assertEqual([i for i, _ in self.index.search("movie")], ["2"])
+        self.assertEqual([i for i, _ in self.index.search("cine")], ["1"])
+
+        self.index.remove("2")
+        self.index.remove("unknown")
+        self.assertEqual(self.index.search("movie"), [])
+        self.assertEqual(len(self.index), 2)
+        self.assertNotIn("his", self.index._postings)
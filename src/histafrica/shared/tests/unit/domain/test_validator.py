@@ -2,14 +2,20 @@ import unittest
 from dataclasses import fields
 from unittest.mock import MagicMock, PropertyMock, patch
 
+from rest_framework import serializers
 from rest_framework.serializers import Serializer
 
 from histafrica.shared.domain.exceptions import ValidationException
 from histafrica.shared.domain.validators import (
-    DRFValidator,
     ValidatorFieldsInterface,
     ValidatorRules,
 )
+from histafrica.shared.infra.django_app.validators import (
+    CompiledDRFValidator,
+    DRFValidator,
+    StrictBooleanField,
+    StrictCharField,
+)
 
 
 class TestValidatorRules(unittest.TestCase):
@@ -171,3 +177,121 @@ class TestDRFValidator(unittest.TestCase):
         self.assertEqual(validator.errors, {"field": ["some error"]})
         mock_errors.assert_called()
         mock_is_valid.assert_called()
+
+
+class StubRules(serializers.Serializer):
+    code = StrictCharField(min_length=2, max_length=5)
+    raw = StrictCharField(required=False, trim_whitespace=False, allow_null=True)
+    flag = StrictBooleanField(required=False, allow_null=True)
+    count = serializers.IntegerField(required=False, max_value=10)
+    label = StrictCharField(required=False, default="none")
+
+
+class StubCheckedRules(StubRules):
+    def validate_code(self, value):
+        if value == "bad":
+            raise serializers.ValidationError("Bad code.")
+        return value
+
+
+class StubValidator(CompiledDRFValidator):
+    rules = StubRules
+
+
+class StubCheckedValidator(CompiledDRFValidator):
+    rules = StubCheckedRules
+
+
+class TestCompiledDRFValidator(unittest.TestCase):
+
+    cases = [
+        None,
+        {},
+        {"code": "abc"},
+        {"code": "  abc  "},
+        {"code": "a"},
+        {"code": "abcdef"},
+        {"code": "   "},
+        {"code": ""},
+        {"code": None},
+        {"code": 12},
+        {"code": True},
+        {"code": ["abc"]},
+        {"code": "a\x00c"},
+        {"code": "a\ud800c"},
+        {"code": "abc", "raw": "  "},
+        {"code": "abc", "raw": ""},
+        {"code": "abc", "raw": None},
+        {"code": "abc", "raw": " x "},
+        {"code": "abc", "flag": True},
+        {"code": "abc", "flag": None},
+        {"code": "abc", "flag": "true"},
+        {"code": "abc", "flag": 1},
+        {"code": "abc", "count": "7"},
+        {"code": "abc", "count": 11},
+        {"code": "abc", "count": "x"},
+        {"code": "abc", "label": "text"},
+        {"code": 1, "raw": 2, "flag": 3, "count": None, "label": None},
+        {"code": "abc", "unknown": "ignored"},
+        [],
+        "text",
+    ]
+
+    def assert_same_as_serializer(self, validator, rules_cls, data):
+        serializer = rules_cls(data=data if data is not None else {})
+        expected = serializer.is_valid()
+        msg = f"data: {data!r}"
+        self.assertEqual(validator.validate(data), expected, msg=msg)
+        if expected:
+            self.assertEqual(
+                validator.validated_data, dict(serializer.validated_data), msg=msg
+            )
+            self.assertEqual(
+                list(validator.validated_data), list(serializer.validated_data)
+            )
+        else:
+            self.assertEqual(
+                validator.errors,
+                {
+                    field: [str(error) for error in errors]
+                    for field, errors in serializer.errors.items()
+                },
+                msg=msg,
+            )
+
+    def test_same_result_as_serializer(self):
+        for data in self.cases:
+            self.assert_same_as_serializer(StubValidator(), StubRules, data)
+
+    def test_serializer_hooks_fall_back_to_serializer(self):
+        for data in [*self.cases, {"code": "bad"}]:
+            self.assert_same_as_serializer(
+                StubCheckedValidator(), StubCheckedRules, data
+            )
+        validator = StubCheckedValidator()
+        self.assertFalse(validator.validate({"code": "bad"}))
+        self.assertEqual(validator.errors, {"code": ["Bad code."]})
+
+    def test_validate_many(self):
+        validator = StubValidator()
+        errors = validator.validate_many(
+            [{"code": "abc"}, {"code": "a"}, {"code": "xyz", "flag": False}, None]
+        )
+
+        self.assertEqual(
+            errors,
+            {
+                1: {"code": ["Ensure this field has at least 2 characters."]},
+                3: {"code": ["This field is required."]},
+            },
+        )
+        self.assertEqual(
+            validator.validated_data,
+            [
+                {"code": "abc", "label": "none"},
+                None,
+                {"code": "xyz", "flag": False, "label": "none"},
+                None,
+            ],
+        )
+        self.assertIsNone(validator.errors)
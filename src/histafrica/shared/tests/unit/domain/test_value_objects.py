@@ -5,7 +5,11 @@ from dataclasses import FrozenInstanceError, dataclass, is_dataclass
 from unittest.mock import patch
 
 from histafrica.shared.domain.exceptions import InvalidUuidException
-from histafrica.shared.domain.value_objects import UniqueEntityId, ValueObject
+from histafrica.shared.domain.value_objects import (
+    UniqueEntityId,
+    ValueObject,
+    uuid7,
+)
 
 
 @dataclass(frozen=True)
@@ -79,3 +83,24 @@ class TestUniqueEntityId(unittest.TestCase):
         with self.assertRaises(FrozenInstanceError):
             value_object = UniqueEntityId()
             value_object.id = "fake id"
+
+    def test_convert_to_string(self):
+        value_object = UniqueEntityId()
+        self.assertIs(str(value_object), value_object.id)
+
+    def test_trusted_skips_validation(self):
+        value = uuid.uuid4()
+        with patch.object(
+            UniqueEntityId, "_UniqueEntityId__validate", autospec=True
+        ) as mock_validate:
+            value_object = UniqueEntityId.trusted(value)
+            mock_validate.assert_not_called()
+        self.assertEqual(value_object, UniqueEntityId(str(value)))
+        self.assertEqual(value_object.id, str(value))
+
+    def test_time_ordered(self):
+        ids = [UniqueEntityId.time_ordered().id for _ in range(100)]
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(len(set(ids)), 100)
+        self.assertEqual(uuid.UUID(ids[0]).version, 7)
+        self.assertEqual(uuid.UUID(uuid7()).variant, uuid.RFC_4122)
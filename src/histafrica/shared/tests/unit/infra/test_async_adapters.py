@@ -0,0 +1,101 @@
+import unittest
+from dataclasses import dataclass
+
+from histafrica.shared.application.use_case import AsyncUseCase, UseCase
+from histafrica.shared.domain.entity import Entity
+from histafrica.shared.domain.exceptions import NotFoundException
+from histafrica.shared.domain.repository import (
+    InMemorySearchableRepository,
+    SearchParams,
+)
+from histafrica.shared.infra.async_adapters import (
+    AsyncSearchableRepositoryAdapter,
+    AsyncUseCaseAdapter,
+    SyncSearchableRepositoryAdapter,
+    SyncUseCaseAdapter,
+)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEntity(Entity):
+    name: str
+
+
+class StubInMemorySearchableRepository(InMemorySearchableRepository[StubEntity]):
+    sortable_fields = ["name"]
+
+    def _apply_filter(self, items, filter_param):
+        return [i for i in items if filter_param in i.name]
+
+
+class StubUseCase(UseCase[int, int]):
+    def execute(self, input_dto: int) -> int:
+        return input_dto * 2
+
+
+class StubAsyncUseCase(AsyncUseCase[int, int]):
+    async def execute(self, input_dto: int) -> int:
+        return input_dto * 3
+
+
+class TestAsyncSearchableRepositoryAdapter(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.repo = AsyncSearchableRepositoryAdapter(StubInMemorySearchableRepository())
+        self.entities = [StubEntity(name=f"stub {i}") for i in range(5)]
+
+    async def test_crud(self):
+        self.assertEqual(self.repo.sortable_fields, ["name"])
+        result = await self.repo.bulk_insert(self.entities)
+        self.assertFalse(result.has_errors)
+
+        entity = self.entities[0]
+        self.assertIs(await self.repo.find_by_id(entity.id), entity)
+        self.assertEqual(await self.repo.find_all(), self.entities)
+
+        renamed = StubEntity(unique_entity_id=entity.unique_entity_id, name="other")
+        await self.repo.update(renamed)
+        self.assertIs(await self.repo.find_by_id(entity.id), renamed)
+
+        await self.repo.delete(entity.id)
+        with self.assertRaises(NotFoundException):
+            await self.repo.find_by_id(entity.id)
+
+    async def test_iter_all_and_search(self):
+        await self.repo.bulk_insert(self.entities)
+        self.assertEqual(
+            [entity async for entity in self.repo.iter_all(chunk_size=2)],
+            self.entities,
+        )
+
+        result = await self.repo.search(SearchParams(per_page=2, sort="name"))
+        self.assertEqual(result.items, self.entities[:2])
+        self.assertEqual(result.total, 5)
+
+
+class TestSyncSearchableRepositoryAdapter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.repo = SyncSearchableRepositoryAdapter(
+            AsyncSearchableRepositoryAdapter(StubInMemorySearchableRepository())
+        )
+        self.entities = [StubEntity(name=f"stub {i}") for i in range(5)]
+
+    def test_round_trip(self):
+        self.repo.bulk_insert(self.entities)
+        self.assertEqual(self.repo.sortable_fields, ["name"])
+        self.assertIs(self.repo.find_by_id(self.entities[1].id), self.entities[1])
+        self.assertEqual(list(self.repo.iter_all(chunk_size=2)), self.entities)
+
+        result = self.repo.bulk_delete([self.entities[0].id, "fake"])
+        self.assertEqual(result.succeeded, [self.entities[0].id])
+        self.assertIsInstance(result.errors[1], NotFoundException)
+
+        result = self.repo.search(SearchParams(filter="stub"))
+        self.assertEqual(result.items, self.entities[1:])
+
+
+class TestUseCaseAdapters(unittest.IsolatedAsyncioTestCase):
+    async def test_async_use_case_adapter(self):
+        self.assertEqual(await AsyncUseCaseAdapter(StubUseCase()).execute(2), 4)
+
+    def test_sync_use_case_adapter(self):
+        self.assertEqual(SyncUseCaseAdapter(StubAsyncUseCase()).execute(2), 6)
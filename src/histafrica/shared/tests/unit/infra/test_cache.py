@@ -0,0 +1,234 @@
+import threading
+import unittest
+from dataclasses import dataclass
+from unittest.mock import MagicMock
+
+from histafrica.shared.domain.entity import Entity
+from histafrica.shared.domain.exceptions import NotFoundException
+from histafrica.shared.domain.repository import (
+    InMemoryRepository,
+    InMemorySearchableRepository,
+    SearchParams,
+)
+from histafrica.shared.infra.cache import (
+    CachedRepository,
+    CachedSearchableRepository,
+    CacheStats,
+    LRUCache,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_throw_error_when_capacity_is_invalid(self):
+        with self.assertRaises(ValueError):
+            LRUCache(capacity=0)
+
+    def test_get_and_set(self):
+        cache = LRUCache()
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.get("key", "default"), "default")
+
+        cache.set("key", "value")
+        self.assertEqual(cache.get("key"), "value")
+        self.assertEqual(len(cache), 1)
+
+        cache.delete("key")
+        self.assertIsNone(cache.get("key"))
+
+    def test_evict_least_recently_used(self):
+        cache = LRUCache(capacity=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.stats.evictions, 1)
+
+    def test_expire_entries_after_ttl(self):
+        clock = FakeClock()
+        cache = LRUCache(ttl=10, clock=clock)
+        cache.set("key", "value")
+
+        clock.now = 9.9
+        self.assertEqual(cache.get("key"), "value")
+        clock.now = 10
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats.expirations, 1)
+
+    def test_stats(self):
+        cache = LRUCache()
+        cache.set("key", "value")
+        cache.get("key")
+        cache.get("key")
+        cache.get("fake")
+
+        self.assertEqual(
+            cache.stats.to_dict(),
+            {
+                "hits": 2,
+                "misses": 1,
+                "evictions": 0,
+                "expirations": 0,
+                "hit_ratio": 2 / 3,
+            },
+        )
+        self.assertEqual(CacheStats().hit_ratio, 0.0)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEntity(Entity):
+    name: str
+
+
+class StubInMemoryRepository(InMemoryRepository[StubEntity]):
+    pass
+
+
+class TestCachedRepository(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.inner = StubInMemoryRepository()
+        self.spy = MagicMock(wraps=self.inner)
+        self.repo = CachedRepository(repository=self.spy)
+        self.entity = StubEntity(name="test")
+        self.repo.insert(self.entity)
+
+    def test_find_by_id_reads_through(self):
+        entity_found = self.repo.find_by_id(self.entity.id)
+        self.assertIs(entity_found, self.entity)
+
+        entity_found = self.repo.find_by_id(self.entity.unique_entity_id)
+        self.assertIs(entity_found, self.entity)
+
+        self.spy.find_by_id.assert_called_once_with(self.entity.id)
+        self.assertEqual(self.repo.stats.hits, 1)
+        self.assertEqual(self.repo.stats.misses, 1)
+
+    def test_not_found_is_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(NotFoundException):
+                self.repo.find_by_id("fake id")
+        self.assertEqual(self.spy.find_by_id.call_count, 2)
+
+    def test_invalidate_on_update_and_delete(self):
+        self.repo.find_by_id(self.entity.id)
+        entity_updated = StubEntity(
+            unique_entity_id=self.entity.unique_entity_id, name="updated"
+        )
+        self.repo.update(entity_updated)
+        self.assertIs(self.repo.find_by_id(self.entity.id), entity_updated)
+
+        self.repo.delete(self.entity.id)
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(self.entity.id)
+
+    def test_invalidate_on_bulk_writes(self):
+        entities = [StubEntity(name=f"test {i}") for i in range(2)]
+        self.repo.bulk_insert(entities)
+        for entity in entities:
+            self.repo.find_by_id(entity.id)
+
+        entities_updated = [
+            StubEntity(unique_entity_id=entity.unique_entity_id, name="updated")
+            for entity in entities
+        ]
+        self.repo.bulk_update(entities_updated)
+        self.assertEqual(
+            [self.repo.find_by_id(entity.id) for entity in entities], entities_updated
+        )
+
+        result = self.repo.bulk_delete(entities)
+        self.assertEqual(result.succeeded, [entity.id for entity in entities])
+        self.assertEqual(len(self.repo.cache), 0)
+
+    def test_do_not_cache_entities_loaded_during_a_write(self):
+        entity_updated = StubEntity(
+            unique_entity_id=self.entity.unique_entity_id, name="updated"
+        )
+
+        def find_by_id_racing_an_update(entity_id):
+            entity = self.inner.find_by_id(entity_id)
+            self.repo.update(entity_updated)
+            return entity
+
+        self.spy.find_by_id.side_effect = find_by_id_racing_an_update
+        self.assertIs(self.repo.find_by_id(self.entity.id), self.entity)
+
+        self.spy.find_by_id.side_effect = None
+        self.assertIs(self.repo.find_by_id(self.entity.id), entity_updated)
+
+    def test_writes_and_read_stores_are_serialized(self):
+        version = self.repo.version
+        with self.repo._lock:
+            writer = threading.Thread(target=self.repo.delete, args=[self.entity.id])
+            writer.start()
+            writer.join(timeout=0.1)
+            # The write went through to the repository, the bump waits.
+            self.assertTrue(writer.is_alive())
+            self.assertEqual(self.repo.version, version)
+        writer.join()
+        self.assertEqual(self.repo.version, version + 1)
+
+    def test_delegate_find_all_and_iter_all(self):
+        self.assertEqual(self.repo.find_all(), [self.entity])
+        self.assertEqual(list(self.repo.iter_all(chunk_size=10)), [self.entity])
+        self.spy.iter_all.assert_called_once_with(chunk_size=10)
+
+
+class StubInMemorySearchableRepository(InMemorySearchableRepository[StubEntity]):
+    sortable_fields = ["name"]
+
+    def _apply_filter(self, items, filter_param):
+        return [i for i in items if filter_param in i.name]
+
+
+class TestCachedSearchableRepository(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.spy = MagicMock(wraps=StubInMemorySearchableRepository())
+        self.spy.sortable_fields = ["name"]
+        self.repo = CachedSearchableRepository(repository=self.spy)
+        self.repo.bulk_insert([StubEntity(name="b"), StubEntity(name="a")])
+
+    def test_sortable_fields_come_from_the_repository(self):
+        self.assertEqual(self.repo.sortable_fields, ["name"])
+
+    def test_equivalent_params_share_an_entry(self):
+        result = self.repo.search(SearchParams(page=0, sort="name", sort_dir="DESC"))
+        self.assertIs(
+            self.repo.search(SearchParams(page=1, sort="name", sort_dir="desc")),
+            result,
+        )
+        self.assertEqual([i.name for i in result.items], ["b", "a"])
+        self.spy.search.assert_called_once()
+        self.assertEqual(self.repo.search_stats.hits, 1)
+
+        self.repo.search(SearchParams(filter="a"))
+        self.assertEqual(self.spy.search.call_count, 2)
+
+    def test_writes_invalidate_results(self):
+        result = self.repo.search(SearchParams())
+        version = self.repo.version
+
+        self.repo.insert(StubEntity(name="c"))
+        self.assertEqual(self.repo.version, version + 1)
+
+        result_after_write = self.repo.search(SearchParams())
+        self.assertIsNot(result_after_write, result)
+        self.assertEqual(result_after_write.total, 3)
+
+        self.repo.bulk_delete([i.id for i in result_after_write.items])
+        self.assertEqual(self.repo.search(SearchParams()).total, 0)
@@ -0,0 +1,35 @@
+import unittest
+
+from django.test import RequestFactory
+
+from histafrica.shared.infra.django_app.conditional import (
+    digest,
+    etag_matches,
+    strong_etag,
+)
+
+
+class TestConditional(unittest.TestCase):
+
+    def test_strong_etag(self):
+        self.assertEqual(strong_etag("id", 3), '"id-3"')
+
+    def test_digest(self):
+        self.assertEqual(digest((1, "name")), digest((1, "name")))
+        self.assertNotEqual(digest((1, "name")), digest((2, "name")))
+        self.assertEqual(len(digest(None)), 16)
+
+    def test_etag_matches(self):
+        factory = RequestFactory()
+        arrange = [
+            (None, False),
+            ('"id-3"', True),
+            ('W/"id-3"', True),
+            ('"id-2", "id-3"', True),
+            ('"id-2"', False),
+            ("*", True),
+        ]
+        for header, expected in arrange:
+            headers = {} if header is None else {"HTTP_IF_NONE_MATCH": header}
+            request = factory.get("/", **headers)
+            self.assertEqual(etag_matches(request, '"id-3"'), expected, header)
@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+
+from histafrica.shared.infra.django_app.metrics import (
+    Histogram,
+    Registry,
+    clear_metrics,
+)
+
+
+class TestHistogram(unittest.TestCase):
+
+    def test_collect(self):
+        histogram = Histogram("stub_seconds", "Stub.", ["route"], buckets=(0.1, 1.0))
+        histogram.observe(0.05, "a")
+        histogram.observe(0.1, "a")
+        histogram.observe(5, "a")
+        histogram.observe(0.5, 'b"\n')
+
+        self.assertEqual(
+            list(histogram.collect()),
+            [
+                "# HELP stub_seconds Stub.",
+                "# TYPE stub_seconds histogram",
+                'stub_seconds_bucket{route="a",le="0.1"} 2',
+                'stub_seconds_bucket{route="a",le="1.0"} 2',
+                'stub_seconds_bucket{route="a",le="+Inf"} 3',
+                'stub_seconds_sum{route="a"} 5.15',
+                'stub_seconds_count{route="a"} 3',
+                'stub_seconds_bucket{route="b\\"\\n",le="0.1"} 0',
+                'stub_seconds_bucket{route="b\\"\\n",le="1.0"} 1',
+                'stub_seconds_bucket{route="b\\"\\n",le="+Inf"} 1',
+                'stub_seconds_sum{route="b\\"\\n"} 0.5',
+                'stub_seconds_count{route="b\\"\\n"} 1',
+            ],
+        )
+
+    def test_registry_render(self):
+        registry = Registry()
+        histogram = registry.register(Histogram("stub", "Stub.", buckets=(1.0,)))
+        histogram.observe(2)
+        self.assertEqual(
+            registry.render(),
+            "# HELP stub Stub.\n"
+            "# TYPE stub histogram\n"
+            'stub_bucket{le="1.0"} 0\n'
+            'stub_bucket{le="+Inf"} 1\n'
+            "stub_sum 2.0\n"
+            "stub_count 1\n",
+        )
+
+    def test_registry_sums_the_processes_sharing_a_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # One registry per process; the random file suffix tells them apart.
+            workers = [Registry(directory), Registry(directory)]
+            for registry, value in zip(workers, [0.5, 2]):
+                histogram = registry.register(
+                    Histogram("stub", "Stub.", ["route"], buckets=(1.0,))
+                )
+                histogram.observe(value, "a")
+                registry.dump()
+            workers[1].histograms[0].observe(2, "b")
+
+            self.assertEqual(len(os.listdir(directory)), 2)
+            self.assertEqual(
+                workers[1].render(),
+                "# HELP stub Stub.\n"
+                "# TYPE stub histogram\n"
+                'stub_bucket{route="a",le="1.0"} 1\n'
+                'stub_bucket{route="a",le="+Inf"} 2\n'
+                'stub_sum{route="a"} 2.5\n'
+                'stub_count{route="a"} 2\n'
+                'stub_bucket{route="b",le="1.0"} 0\n'
+                'stub_bucket{route="b",le="+Inf"} 1\n'
+                'stub_sum{route="b"} 2.0\n'
+                'stub_count{route="b"} 1\n',
+            )
+
+            clear_metrics(directory)
+            self.assertEqual(os.listdir(directory), [])
@@ -0,0 +1,69 @@
+import unittest
+
+from rest_framework.renderers import JSONRenderer
+
+from histafrica.shared.infra.django_app.renderers import (
+    StreamingCollectionResponse,
+    StreamingJSONRenderer,
+)
+from histafrica.shared.tests.unit.infra.test_serializer import (
+    StubDetailedCollectionSerializer,
+    detailed_pagination,
+)
+from histafrica.shared.timing import collect
+
+
+class StubLongRenderer(StreamingJSONRenderer):
+    compact = False
+    chunk_size = 2
+
+
+class TestStreamingJSONRenderer(unittest.TestCase):
+
+    def test_render_collection_as_json_renderer(self):
+        for renderer in [StreamingJSONRenderer(), StubLongRenderer()]:
+            for size in [0, 1, 2, 5, 250]:
+                collection = StubDetailedCollectionSerializer(
+                    instance=detailed_pagination(size)
+                )
+                chunks = list(renderer.render_collection(collection))
+
+                self.assertEqual(
+                    b"".join(chunks),
+                    JSONRenderer.render(renderer, collection.data),
+                    msg=f"compact: {renderer.compact}, {size} items",
+                )
+
+    def test_render_collection_in_chunks(self):
+        collection = StubDetailedCollectionSerializer(instance=detailed_pagination(5))
+        chunks = list(StubLongRenderer().render_collection(collection))
+
+        # Opening with two items, two more, then the last item with the meta.
+        self.assertEqual(len(chunks), 3)
+        self.assertTrue(chunks[0].startswith(b'{"data": [{'))
+        self.assertTrue(chunks[2].startswith(b", {"))
+
+    def test_render_collection_times_serialization(self):
+        collection = StubDetailedCollectionSerializer(instance=detailed_pagination(5))
+        chunks = StubLongRenderer().render_collection(collection)
+
+        with collect() as timings:
+            next(chunks)
+        self.assertEqual(timings.phases["serialization"][1], 1)
+        with collect(timings):
+            list(chunks)
+        self.assertEqual(timings.phases["serialization"][1], 3)
+
+
+class TestStreamingCollectionResponse(unittest.TestCase):
+
+    def test_stream_collection(self):
+        collection = StubDetailedCollectionSerializer(instance=detailed_pagination(3))
+        response = StreamingCollectionResponse(collection, status=200)
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(
+            b"".join(response.streaming_content),
+            JSONRenderer().render(collection.data),
+        )
@@ -0,0 +1,42 @@
+import pickle
+import unittest
+
+from django.core.cache import caches
+
+from histafrica.shared.infra.cache import LRUCache
+from histafrica.shared.infra.django_app.response_cache import (
+    CachedResponse,
+    ResponseCache,
+)
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        caches["responses"].clear()
+        self.entry = CachedResponse(
+            b'{"data": []}', (("Content-Type", "application/json"),)
+        )
+
+    def test_local_tier_only(self):
+        cache = ResponseCache()
+        self.assertIsNone(cache.get("key"))
+        cache.set("key", self.entry)
+        self.assertEqual(cache.get("key"), self.entry)
+        self.assertIsNone(caches["responses"].get("key"))
+
+    def test_shared_tier_fills_local_tier(self):
+        ResponseCache(alias="responses").set("key", self.entry)
+
+        local = LRUCache()
+        cache = ResponseCache(alias="responses", local=local)
+        self.assertEqual(cache.get("key"), self.entry)
+        self.assertEqual(local.get("key"), self.entry)
+
+    def test_cached_response(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.entry)), self.entry)
+
+        response = self.entry.to_response('"etag"')
+        self.assertEqual(response.content, self.entry.body)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(response["ETag"], '"etag"')
@@ -1,3 +1,4 @@
+import datetime
 import unittest
 from typing import OrderedDict
 
@@ -27,6 +28,60 @@ class TestPaginationSerializer(unittest.TestCase):
             data, {"current_page": 1, "per_page": 2, "last_page": 3, "total": 4}
         )
 
+    def test_serialize_without_total(self):
+        pagination = PaginationOutput(
+            items=[],
+            total=None,
+            current_page=1,
+            per_page=2,
+            last_page=None,
+            has_next=True,
+        )
+
+        data = PaginationSerializer(instance=pagination).data
+
+        self.assertEqual(data, {"current_page": 1, "per_page": 2, "has_next": True})
+
+        pagination = PaginationOutput(
+            items=[],
+            total=None,
+            current_page=1,
+            per_page=2,
+            last_page=None,
+            has_next=False,
+            estimated_total=1,
+        )
+
+        data = PaginationSerializer(instance=pagination).data
+
+        self.assertEqual(
+            data,
+            {"current_page": 1, "per_page": 2, "has_next": False, "estimated_total": 1},
+        )
+
+    def test_serialize_next_cursor(self):
+        pagination = PaginationOutput(
+            items=[],
+            total=None,
+            current_page=1,
+            per_page=2,
+            last_page=None,
+            has_next=True,
+            next_cursor="cursor",
+        )
+
+        data = PaginationSerializer(instance=pagination).data
+
+        self.assertEqual(
+            data,
+            {
+                "current_page": 1,
+                "per_page": 2,
+                "has_next": True,
+                "next_cursor": "cursor",
+            },
+        )
+
 
 class StubSerializer(ResourceSerializer):
     name = serializers.CharField()
@@ -36,6 +91,47 @@ class StubCollectionSerializer(CollectionSerializer):
     child = StubSerializer()
 
 
+class StubDetailedSerializer(ResourceSerializer):
+    name = serializers.CharField()
+    description = serializers.CharField(allow_null=True)
+    created_at = serializers.DateTimeField()
+
+
+class StubDetailedCollectionSerializer(CollectionSerializer):
+    child = StubDetailedSerializer()
+
+
+class StubWrappingSerializer(ResourceSerializer):
+    name = serializers.CharField()
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        data["data"]["wrapped"] = True
+        return data
+
+
+class StubWrappingCollectionSerializer(CollectionSerializer):
+    child = StubWrappingSerializer()
+
+
+def detailed_pagination(size: int) -> PaginationOutput:
+    created_at = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    return PaginationOutput(
+        items=[
+            {
+                "name": f"item \u2028 é {i}",
+                "description": None if i % 2 else f"description {i}",
+                "created_at": created_at,
+            }
+            for i in range(size)
+        ],
+        total=size,
+        current_page=1,
+        per_page=max(size, 1),
+        last_page=1,
+    )
+
+
 class TestCollectionSerializer(unittest.TestCase):
 
     def test_if_throw_an_error_when_instance_is_not_pagination_output(self):
@@ -78,3 +174,20 @@ class TestCollectionSerializer(unittest.TestCase):
                 "meta": {"current_page": 1, "per_page": 2, "last_page": 3, "total": 4},
             },
         )
+
+    def test_serialize_children_directly(self):
+        pagination = detailed_pagination(3)
+        data = StubDetailedCollectionSerializer(instance=pagination).data
+
+        child = StubDetailedSerializer()
+        self.assertEqual(
+            data["data"],
+            [child.to_representation(item)["data"] for item in pagination.items],
+        )
+
+    def test_serialize_through_an_overridden_child_to_representation(self):
+        pagination = PaginationOutput(
+            items=[{"name": "foo"}], current_page=1, per_page=1, last_page=1, total=1
+        )
+        data = StubWrappingCollectionSerializer(instance=pagination).data
+        self.assertEqual(data["data"], [{"name": "foo", "wrapped": True}])
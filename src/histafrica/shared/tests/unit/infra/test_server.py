@@ -0,0 +1,199 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+import unittest
+import urllib.request
+from unittest import mock
+
+from histafrica.shared.infra.django_app import server
+from histafrica.shared.infra.django_app.server import default_workers, load_application
+
+# Answers with the pid of the worker that served the request.
+SERVER_SCRIPT = textwrap.dedent(
+    """
+    import os, time
+    from histafrica.shared.infra.django_app.server import PreforkServer
+
+    def application(environ, start_response):
+        if environ["PATH_INFO"] == "/slow":
+            print("Slow request started", flush=True)
+            time.sleep(0.5)
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return [str(os.getpid()).encode()]
+
+    PreforkServer(
+        application,
+        host="127.0.0.1",
+        port=0,
+        workers=2,
+        max_requests=1,
+        graceful_timeout=5,
+        timeout=0.5,
+        log=lambda message: print(message, flush=True),
+    ).run()
+    """
+)
+
+# Workers fail right after forking, before serving anything.
+FAILING_SERVER_SCRIPT = textwrap.dedent(
+    """
+    from histafrica.shared.infra.django_app.server import PreforkServer
+
+    class FailingServer(PreforkServer):
+        def _serve(self):
+            raise RuntimeError("boot failure")
+
+    FailingServer(
+        None,
+        host="127.0.0.1",
+        port=0,
+        workers=1,
+        log=lambda message: print(message, flush=True),
+    ).run()
+    """
+)
+
+
+class TestServerHelpers(unittest.TestCase):
+
+    def test_default_workers(self):
+        with mock.patch.object(os, "sched_getaffinity", return_value={0, 1, 2}):
+            self.assertEqual(default_workers(), 7)
+
+    def test_load_application(self):
+        self.assertIs(
+            load_application("histafrica.shared.infra.django_app.server:warm_up"),
+            server.warm_up,
+        )
+        self.assertIs(
+            load_application("histafrica.shared.tests.unit.infra.test_server"),
+            sys.modules[__name__].application,
+        )
+
+
+def application(environ, start_response):
+    """Stand-in for load_application's default attribute."""
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "requires fork()")
+class TestPreforkServer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.start(SERVER_SCRIPT)
+
+    def start(self, script: str) -> None:
+        self.process = subprocess.Popen(  # pylint: disable=consider-using-with
+            [sys.executable, "-c", script],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+        self.addCleanup(self.stop)
+        listening = self.process.stdout.readline()
+        self.url = listening.split()[2]
+
+    def stop(self):
+        # Stopped gracefully, so the workers do not outlive the master.
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process.wait()
+        self.process.stdout.close()
+
+    def get(self, path: str = "") -> int:
+        with urllib.request.urlopen(self.url + path, timeout=5) as response:
+            return int(response.read())
+
+    def test_workers_are_recycled_and_reloaded(self):
+        pids = [self.get() for _ in range(4)]
+        self.assertEqual(len(set(pids)), 4)
+        self.assertNotIn(self.process.pid, pids)
+
+        self.process.send_signal(signal.SIGHUP)
+        self.assertIn("Reloading", self.process.stdout.readline())
+        self.assertIn("Listening", self.process.stdout.readline())
+        self.assertNotIn(self.get(), pids)
+
+        self.process.send_signal(signal.SIGTERM)
+        self.assertEqual(self.process.wait(timeout=10), 0)
+
+    def test_reload_keeps_serving(self):
+        in_flight = []
+        request = threading.Thread(target=lambda: in_flight.append(self.get("/slow")))
+        request.start()
+        self.assertIn("Slow request started", self.process.stdout.readline())
+
+        # The new master is up before the old workers are stopped, and the
+        # request in flight still finishes on its worker.
+        self.process.send_signal(signal.SIGHUP)
+        self.assertIn("Reloading", self.process.stdout.readline())
+        self.assertIn("Listening", self.process.stdout.readline())
+        self.assertEqual(in_flight, [])
+        pids = [self.get() for _ in range(4)]
+        request.join()
+        self.assertEqual(len(in_flight), 1)
+        self.assertNotIn(in_flight[0], pids)
+
+        self.process.send_signal(signal.SIGTERM)
+        self.assertEqual(self.process.wait(timeout=10), 0)
+
+    def test_stop_finishes_requests_in_flight(self):
+        pids = []
+        request = threading.Thread(target=lambda: pids.append(self.get("/slow")))
+        request.start()
+        self.assertIn("Slow request started", self.process.stdout.readline())
+
+        self.process.send_signal(signal.SIGTERM)
+        request.join()
+        self.assertEqual(len(pids), 1)
+        self.assertEqual(self.process.wait(timeout=10), 0)
+
+    def test_silent_clients_are_disconnected(self):
+        host, port = self.url.split("//")[1].rstrip("/").split(":")
+        idle = [socket.create_connection((host, int(port))) for _ in range(2)]
+        for connection in idle:
+            self.addCleanup(connection.close)
+
+        # Both workers are held by a silent client until the timeout.
+        self.assertTrue(self.get())
+        for connection in idle:
+            connection.settimeout(5)
+            self.assertEqual(connection.recv(1), b"")
+
+    @unittest.skipUnless(os.path.exists("/proc/self/stat"), "requires /proc")
+    def test_idle_workers_wait_without_spinning(self):
+        time.sleep(0.2)
+        pid = self.process.pid
+        with open(f"/proc/{pid}/task/{pid}/children", encoding="ascii") as children:
+            workers = children.read().split()
+        self.assertEqual(len(workers), 2)
+
+        cpu_seconds = [self.cpu_seconds(worker) for worker in workers]
+        time.sleep(0.5)
+        for worker, before in zip(workers, cpu_seconds):
+            self.assertLess(self.cpu_seconds(worker) - before, 0.1)
+
+    @staticmethod
+    def cpu_seconds(pid: str) -> float:
+        with open(f"/proc/{pid}/stat", encoding="ascii") as stat:
+            fields = stat.read().rpartition(")")[2].split()
+        # utime and stime, in clock ticks.
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+    def test_failing_workers_are_restarted_with_backoff(self):
+        self.stop()
+        self.start(FAILING_SERVER_SCRIPT)
+        delays = [self.process.stdout.readline().split()[-1] for _ in range(4)]
+        self.assertEqual(delays, ["0.1s", "0.2s", "0.4s", "0.8s"])
+
+        self.process.send_signal(signal.SIGTERM)
+        self.assertEqual(self.process.wait(timeout=10), 0)
@@ -0,0 +1,91 @@
+import asyncio
+import unittest
+from dataclasses import dataclass
+
+from histafrica.shared.application.use_case import UseCase
+from histafrica.shared.timing import collect, current, instrument, timed
+
+
+class StubService:
+
+    @timed("outer")
+    def outer(self, depth: int = 0):
+        return self.inner() if depth == 0 else self.outer(depth - 1)
+
+    @timed("inner")
+    def inner(self):
+        return "inner"
+
+    @timed("outer")
+    async def async_outer(self):
+        return self.inner()
+
+
+@dataclass(frozen=True, slots=True)
+class StubUseCase(UseCase[int, int]):
+    offset: int = 1
+
+    def execute(self, input_dto: int) -> int:
+        return input_dto + self.offset
+
+
+class TestTiming(unittest.TestCase):
+
+    def test_not_collected_outside_requests(self):
+        self.assertIsNone(current())
+        self.assertEqual(StubService().outer(), "inner")
+
+    def test_collect_phases(self):
+        service = StubService()
+        with collect() as timings:
+            self.assertIs(current(), timings)
+            service.outer()
+            service.inner()
+        self.assertIsNone(current())
+
+        self.assertEqual(list(timings.phases), ["inner", "outer"])
+        self.assertEqual(timings.phases["inner"][1], 2)
+        self.assertEqual(timings.phases["outer"][1], 1)
+        self.assertGreaterEqual(timings.phases["outer"][0], 0)
+        self.assertEqual(timings.active, set())
+
+    def test_reentered_phase_counted_once(self):
+        with collect() as timings:
+            StubService().outer(depth=3)
+        self.assertEqual(timings.phases["outer"][1], 1)
+
+    def test_async_functions(self):
+        async def run():
+            with collect() as timings:
+                await StubService().async_outer()
+            return timings
+
+        timings = asyncio.run(run())
+        self.assertEqual(timings.phases["outer"][1], 1)
+        self.assertEqual(timings.phases["inner"][1], 1)
+
+    def test_server_timing(self):
+        with collect() as timings:
+            timings.add("repository", 0.0012)
+            timings.add("repository", 0.001)
+        self.assertEqual(
+            timings.server_timing(0.005),
+            'repository;dur=2.200;desc="2 calls", total;dur=5.000',
+        )
+
+    def test_use_cases_are_instrumented(self):
+        with collect() as timings:
+            self.assertEqual(StubUseCase().execute(1), 2)
+        self.assertEqual(timings.phases["use_case"][1], 1)
+        self.assertEqual(StubUseCase.execute.__timed__, "use_case")
+
+    def test_instrument_is_idempotent(self):
+        class Stub:
+            def method(self):
+                return 1
+
+        instrument(Stub, "phase", ["method", "missing"])
+        wrapped = Stub.method
+        instrument(Stub, "phase", ["method"])
+        self.assertIs(Stub.method, wrapped)
+        self.assertEqual(Stub().method(), 1)
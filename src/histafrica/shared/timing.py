@@ -0,0 +1,121 @@
+"""
+Per-request phase timings. A Timings collector is made current for the
+duration of a request (see collect()); functions wrapped with timed() add
+their wall time to it under their phase. Outside a request the wrappers cost
+one context variable lookup, so instrumentation stays on everywhere.
+
+Phases nest: a use case's time includes the repository calls it makes. A
+phase entered again while it is running (a super() call, a repository
+wrapping another) is only counted once, at the outermost call.
+"""
+
+import functools
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+_current: ContextVar[Optional["Timings"]] = ContextVar("timings", default=None)
+
+
+class Timings:
+    """Total seconds and call count per phase, in first-seen order."""
+
+    __slots__ = ("phases", "active")
+
+    def __init__(self):
+        self.phases: Dict[str, List[float]] = {}
+        self.active: Set[str] = set()
+
+    def add(self, phase: str, seconds: float) -> None:
+        entry = self.phases.get(phase)
+        if entry is None:
+            self.phases[phase] = [seconds, 1]
+        else:
+            entry[0] += seconds
+            entry[1] += 1
+
+    def server_timing(self, total: Optional[float] = None) -> str:
+        """Server-Timing header value, in milliseconds."""
+        metrics = [
+            f'{phase};dur={seconds * 1000:.3f};desc="{int(count)} calls"'
+            for phase, (seconds, count) in self.phases.items()
+        ]
+        if total is not None:
+            metrics.append(f"total;dur={total * 1000:.3f}")
+        return ", ".join(metrics)
+
+
+def current() -> Optional[Timings]:
+    return _current.get()
+
+
+@contextmanager
+def collect(timings: Optional[Timings] = None) -> Iterator[Timings]:
+    """Makes ``timings``, or new ones, current; pass them again to resume."""
+    timings = Timings() if timings is None else timings
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+def timed(phase: str) -> Callable[[F], F]:
+    """Adds the calls' wall time to the current Timings under ``phase``."""
+
+    def decorator(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                timings = _current.get()
+                if timings is None or phase in timings.active:
+                    return await func(*args, **kwargs)
+                timings.active.add(phase)
+                start = perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    timings.add(phase, perf_counter() - start)
+                    timings.active.discard(phase)
+
+            wrapper = async_wrapper
+        else:
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                timings = _current.get()
+                if timings is None or phase in timings.active:
+                    return func(*args, **kwargs)
+                timings.active.add(phase)
+                start = perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    timings.add(phase, perf_counter() - start)
+                    timings.active.discard(phase)
+
+        wrapper.__timed__ = phase
+        return wrapper
+
+    return decorator
+
+
+def instrument(cls: type, phase: str, names: Iterable[str]) -> None:
+    """
+    Wraps the methods among ``names`` that ``cls`` itself defines with
+    timed(``phase``). Abstract and already wrapped methods are left alone, so
+    it can run from __init_subclass__, which slots dataclasses trigger twice.
+    """
+    for name in names:
+        func = cls.__dict__.get(name)
+        if (
+            inspect.isfunction(func)
+            and not getattr(func, "__isabstractmethod__", False)
+            and not hasattr(func, "__timed__")
+        ):
+            setattr(cls, name, timed(phase)(func))